@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+
+
+class PmBackendConfig(AppConfig):
+    name = "pm_backend"
+
+    def ready(self):
+        from .database import configure_sqlite
+
+        connection_created.connect(configure_sqlite, dispatch_uid="pm_backend.configure_sqlite")
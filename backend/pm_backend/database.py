@@ -0,0 +1,109 @@
+"""Environment-driven database profile.
+
+DB_ENGINE picks the backend:
+
+* ``sqlite`` (default): DB_NAME is the file path. Every new connection runs
+  the SQLITE_PRAGMAS below (synchronous=NORMAL, mmap) and waits up to
+  SQLITE_BUSY_TIMEOUT ms for locks. The journal mode is stored in the file,
+  so it is only changed when SQLITE_JOURNAL_MODE asks for it (WAL in
+  production); otherwise whatever file is opened keeps its own. On Django 5.1+ transactions also take
+  the write lock up front (IMMEDIATE), so concurrent writers queue on the
+  busy timeout instead of failing with "database is locked".
+* ``postgresql``: DB_NAME, DB_USER, DB_PASSWORD, DB_HOST and DB_PORT.
+  Connections persist for DB_CONN_MAX_AGE seconds (default 60) with health
+  checks, or with DB_POOL=1 come from a psycopg pool (Django 5.1+ and
+  ``psycopg[pool]``) sized by DB_POOL_MIN_SIZE/DB_POOL_MAX_SIZE.
+"""
+import os
+
+import django
+from django.core.exceptions import ImproperlyConfigured
+
+ENGINES = {
+    "sqlite": "django.db.backends.sqlite3",
+    "postgresql": "django.db.backends.postgresql",
+}
+
+
+def _flag(environ, name, default):
+    value = environ.get(name)
+    if value is None or value == "":
+        return default
+    return value.lower() in ("1", "true", "yes", "on")
+
+
+def _int(environ, name, default):
+    try:
+        return int(environ.get(name) or default)
+    except ValueError:
+        raise ImproperlyConfigured(f"{name} must be an integer")
+
+
+def sqlite_pragmas(environ=os.environ):
+    """PRAGMAs applied to every new SQLite connection, in order"""
+    pragmas = {}
+    if environ.get("SQLITE_JOURNAL_MODE"):
+        pragmas["journal_mode"] = environ["SQLITE_JOURNAL_MODE"]
+    pragmas.update({
+        "synchronous": environ.get("SQLITE_SYNCHRONOUS", "NORMAL"),
+        "busy_timeout": _int(environ, "SQLITE_BUSY_TIMEOUT", 5000),
+        "mmap_size": _int(environ, "SQLITE_MMAP_SIZE", 256 * 1024 * 1024),
+    })
+    return pragmas
+
+
+def database_settings(base_dir, environ=os.environ):
+    """The DATABASES["default"] entry for the configured profile"""
+    engine = environ.get("DB_ENGINE", "sqlite").lower()
+    if engine in ("postgres", "psql"):
+        engine = "postgresql"
+    if engine not in ENGINES:
+        raise ImproperlyConfigured(f"DB_ENGINE must be one of {', '.join(ENGINES)}")
+
+    if engine == "sqlite":
+        config = {
+            "ENGINE": ENGINES[engine],
+            "NAME": environ.get("DB_NAME") or base_dir / "db.sqlite3",
+            "CONN_MAX_AGE": _int(environ, "DB_CONN_MAX_AGE", 0),
+            "OPTIONS": {
+                # Seconds the driver waits on a locked database (the busy timeout)
+                "timeout": _int(environ, "SQLITE_BUSY_TIMEOUT", 5000) / 1000,
+            },
+        }
+        if django.VERSION >= (5, 1):
+            config["OPTIONS"]["transaction_mode"] = "IMMEDIATE"
+        return config
+
+    config = {
+        "ENGINE": ENGINES[engine],
+        "NAME": environ.get("DB_NAME", "project_manager"),
+        "USER": environ.get("DB_USER", ""),
+        "PASSWORD": environ.get("DB_PASSWORD", ""),
+        "HOST": environ.get("DB_HOST", "localhost"),
+        "PORT": environ.get("DB_PORT", "5432"),
+        "CONN_MAX_AGE": _int(environ, "DB_CONN_MAX_AGE", 60),
+        "CONN_HEALTH_CHECKS": _flag(environ, "DB_CONN_HEALTH_CHECKS", True),
+        "OPTIONS": {},
+    }
+    if _flag(environ, "DB_POOL", False):
+        if django.VERSION < (5, 1):
+            raise ImproperlyConfigured("DB_POOL needs Django 5.1 or later")
+        # Pooled connections are returned to the pool instead of being kept per thread
+        config["CONN_MAX_AGE"] = 0
+        config["OPTIONS"]["pool"] = {
+            "min_size": _int(environ, "DB_POOL_MIN_SIZE", 2),
+            "max_size": _int(environ, "DB_POOL_MAX_SIZE", 10),
+            "timeout": _int(environ, "DB_POOL_TIMEOUT", 10),
+        }
+    return config
+
+
+def configure_sqlite(sender, connection, **kwargs):
+    """connection_created receiver that applies settings.SQLITE_PRAGMAS"""
+    if connection.vendor != "sqlite":
+        return
+    from django.conf import settings
+
+    with connection.cursor() as cursor:
+        for name, value in getattr(settings, "SQLITE_PRAGMAS", {}).items():
+            cursor.execute(f"PRAGMA {name} = {value}")
@@ -0,0 +1,283 @@
+"""Per-request query and timing instrumentation.
+
+Enabled with REQUEST_METRICS["ENABLED"]. When it is off the middleware
+removes itself at startup (MiddlewareNotUsed) and nothing is patched, so
+requests pay nothing. When on, every request records its query count, DB
+time, slowest statements, repeated statements (likely N+1), and the time
+spent in serializers (or metrics.serializing() blocks) and in rendering. The breakdown goes out as a
+Server-Timing header and is aggregated into per-route histograms served at
+/api/_metrics/.
+"""
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter, deque
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import Http404, HttpResponse, JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    "ENABLED": False,
+    # Statements kept per request, slowest first
+    "SLOW_QUERIES": 5,
+    # Same SQL (parameters aside) run this many times in one request is reported as N+1
+    "DUPLICATE_THRESHOLD": 5,
+    # Recent request records kept for /api/_metrics/
+    "RECENT": 50,
+}
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+_GROUP = re.compile(r"\(\?P<(\w+)>[^)]*\)")
+
+_current = ContextVar("request_metrics", default=None)
+
+
+def get_setting(name):
+    return getattr(settings, "REQUEST_METRICS", {}).get(name, DEFAULTS[name])
+
+
+def enabled():
+    return get_setting("ENABLED")
+
+
+class RequestRecord:
+    """What one request spent its time on"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.statements = []
+        self.db_seconds = 0.0
+        self.serialize_seconds = 0.0
+        self.serialize_db_seconds = 0.0
+        self.render_seconds = 0.0
+        self.serializer_depth = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        # connection.execute_wrapper hook
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            self.db_seconds += duration
+            if self.serializer_depth:
+                self.serialize_db_seconds += duration
+            self.statements.append((sql, duration))
+
+    def duplicates(self):
+        threshold = get_setting("DUPLICATE_THRESHOLD")
+        counts = Counter(sql for sql, _ in self.statements)
+        return [{"sql": sql, "count": count} for sql, count in counts.most_common() if count >= threshold]
+
+    def slowest(self):
+        statements = sorted(self.statements, key=lambda statement: statement[1], reverse=True)
+        return [
+            {"sql": sql, "ms": round(duration * 1000, 3)}
+            for sql, duration in statements[:get_setting("SLOW_QUERIES")]
+        ]
+
+    def timings(self):
+        """Milliseconds per phase; serializer time excludes the queries it triggered"""
+        total = time.perf_counter() - self.started
+        serialize = self.serialize_seconds - self.serialize_db_seconds
+        return {
+            "total": total * 1000,
+            "db": self.db_seconds * 1000,
+            "serialize": serialize * 1000,
+            "render": self.render_seconds * 1000,
+            "view": max(total - self.db_seconds - serialize - self.render_seconds, 0) * 1000,
+        }
+
+
+class MetricsStore:
+    """Per-route histograms and a short list of recent requests, shared by all threads"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.routes = {}
+            self.recent = deque(maxlen=get_setting("RECENT"))
+
+    def add(self, route, status, record, timings, duplicates):
+        queries = len(record.statements)
+        with self.lock:
+            stats = self.routes.get(route)
+            if stats is None:
+                stats = self.routes[route] = {
+                    "count": 0,
+                    "errors": 0,
+                    "n_plus_one": 0,
+                    "queries_total": 0,
+                    "queries_max": 0,
+                    "ms_total": dict.fromkeys(timings, 0.0),
+                    "ms_max": 0.0,
+                    "histogram": [0] * (len(BUCKETS_MS) + 1),
+                }
+            stats["count"] += 1
+            stats["errors"] += status >= 500
+            stats["n_plus_one"] += bool(duplicates)
+            stats["queries_total"] += queries
+            stats["queries_max"] = max(stats["queries_max"], queries)
+            for phase, ms in timings.items():
+                stats["ms_total"][phase] += ms
+            stats["ms_max"] = max(stats["ms_max"], timings["total"])
+            stats["histogram"][bisect_left(BUCKETS_MS, timings["total"])] += 1
+            self.recent.append({
+                "route": route,
+                "status": status,
+                "queries": queries,
+                "ms": {phase: round(ms, 3) for phase, ms in timings.items()},
+                "slowest": record.slowest(),
+                "duplicates": duplicates,
+            })
+
+    def snapshot(self):
+        with self.lock:
+            routes = {}
+            for route, stats in self.routes.items():
+                count = stats["count"]
+                routes[route] = {
+                    "count": count,
+                    "errors": stats["errors"],
+                    "n_plus_one": stats["n_plus_one"],
+                    "queries_avg": round(stats["queries_total"] / count, 2),
+                    "queries_max": stats["queries_max"],
+                    "ms_avg": {phase: round(ms / count, 3) for phase, ms in stats["ms_total"].items()},
+                    "ms_max": round(stats["ms_max"], 3),
+                    "histogram": {
+                        (f"le_{bound}ms" if index < len(BUCKETS_MS) else "inf"): stats["histogram"][index]
+                        for index, bound in enumerate((*BUCKETS_MS, None))
+                    },
+                }
+            return {"routes": routes, "recent": list(self.recent)}
+
+
+store = MetricsStore()
+
+
+@contextmanager
+def serializing():
+    """Count the block as serializer time (its queries stay DB time).
+
+    For code that builds representations without Serializer.to_representation,
+    such as the .values() fast paths in projects/fast_read.py. Nested blocks
+    count once.
+    """
+    record = _current.get()
+    if record is None:
+        yield
+        return
+    record.serializer_depth += 1
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record.serializer_depth -= 1
+        if not record.serializer_depth:
+            record.serialize_seconds += time.perf_counter() - started
+
+
+def _install_serializer_timing():
+    """Time top-level Serializer.to_representation calls (nested ones are included in their parent)"""
+    from rest_framework.serializers import Serializer
+
+    original = Serializer.to_representation
+    if getattr(original, "_request_metrics", False):
+        return
+
+    def to_representation(self, instance):
+        if _current.get() is None:
+            return original(self, instance)
+        with serializing():
+            return original(self, instance)
+
+    to_representation._request_metrics = True
+    Serializer.to_representation = to_representation
+
+
+def route_name(request):
+    """URL pattern of the request with regex groups shown as <name>, e.g. /api/tasks/<pk>/shift/"""
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "(unresolved)"
+    return "/" + _GROUP.sub(r"<\1>", match.route).replace("^", "").replace("$", "")
+
+
+def server_timing(timings, queries):
+    parts = []
+    for phase, ms in timings.items():
+        entry = f"{phase};dur={ms:.2f}"
+        if phase == "db":
+            entry += f';desc="{queries} queries"'
+        parts.append(entry)
+    return ", ".join(parts)
+
+
+class RequestMetricsMiddleware:
+    def __init__(self, get_response):
+        if not enabled():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        _install_serializer_timing()
+
+    def process_template_response(self, request, response):
+        # DRF responses render right after this hook; time it through a post-render callback
+        record = _current.get()
+        if record is not None:
+            started = time.perf_counter()
+
+            def rendered(response):
+                record.render_seconds += time.perf_counter() - started
+
+            response.add_post_render_callback(rendered)
+        return response
+
+    def __call__(self, request):
+        record = RequestRecord()
+        token = _current.set(record)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(record))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+
+        route = f"{request.method} {route_name(request)}"
+        timings = record.timings()
+        duplicates = record.duplicates()
+        if duplicates:
+            logger.warning(
+                "Possible N+1 on %s: %s",
+                route, "; ".join(f"{item['count']}x {item['sql'][:120]}" for item in duplicates),
+            )
+        store.add(route, response.status_code, record, timings, duplicates)
+        response["Server-Timing"] = server_timing(timings, len(record.statements))
+        return response
+
+
+@csrf_exempt
+def metrics_view(request):
+    """GET per-route histograms and recent requests; DELETE clears them"""
+    if not enabled():
+        raise Http404("Request metrics are disabled")
+    if request.method == "DELETE":
+        store.reset()
+        return HttpResponse(status=204)
+    if request.method != "GET":
+        return JsonResponse({"error": "Method not allowed"}, status=405)
+    return JsonResponse({"buckets_ms": BUCKETS_MS, **store.snapshot()})
@@ -2,6 +2,8 @@
 from pathlib import Path
 import os
 
+from .database import database_settings, sqlite_pragmas
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 SECRET_KEY = 'dev-secret-key-change-in-prod'
@@ -17,10 +19,12 @@ INSTALLED_APPS = [
     "django.contrib.staticfiles",
     "rest_framework",
     "corsheaders",
+    "pm_backend",
     "projects",
 ]
 
 MIDDLEWARE = [
+    "pm_backend.metrics.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -53,12 +57,26 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "pm_backend.wsgi.application"
 
+# SQLite by default; see pm_backend/database.py for the DB_* environment variables
 DATABASES = {
+    "default": database_settings(BASE_DIR),
+}
+SQLITE_PRAGMAS = sqlite_pragmas()
+
+CACHES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # Serialized project/timeline payloads, keyed on database state so per-worker locmem stays
+    # correct; swap the backend (e.g. Redis) to share hits across workers
+    "projects": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "pm-projects",
+        "TIMEOUT": 3600,
+        "OPTIONS": {"MAX_ENTRIES": 5000, "CULL_FREQUENCY": 4},
+    },
 }
+PROJECTS_CACHE_ALIAS = "projects"
 
 AUTH_PASSWORD_VALIDATORS = []
 
@@ -72,7 +90,35 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "projects.renderers.FastJSONRenderer",
         "rest_framework.renderers.BrowsableAPIRenderer",
     ]
 }
+
+# Build read-only project/task lists from values() rows instead of serializer instances
+FAST_READS = os.environ.get("FAST_READS", "1").lower() not in ("0", "false", "no")
+
+# Serve the project list/detail/tasks/stats and timeline GETs from async views
+# (projects/async_views.py). Opt-in: they only help under an ASGI server, and
+# threaded WSGI was faster on the loadtest command's runs.
+ASYNC_READS = os.environ.get("ASYNC_READS", "").lower() in ("1", "true", "yes")
+
+# Delta sync (/api/sync/). The returned timestamp lags the read by SYNC_OVERLAP_SECONDS:
+# updated_at is stamped when a row is saved, not at commit, so rows from transactions still
+# open at read time come again next sync (clients upsert by id). Tombstones are kept for
+# SYNC_TOMBSTONE_RETENTION_DAYS (manage.py prune_tombstones); older ?since= values get 410.
+SYNC_OVERLAP_SECONDS = int(os.environ.get("SYNC_OVERLAP_SECONDS", "60"))
+SYNC_TOMBSTONE_RETENTION_DAYS = int(os.environ.get("SYNC_TOMBSTONE_RETENTION_DAYS", "30"))
+
+# Per-request query/timing instrumentation (Server-Timing header, /api/_metrics/).
+# Off by default: the middleware then unloads itself and costs nothing.
+REQUEST_METRICS = {
+    "ENABLED": os.environ.get("REQUEST_METRICS", "").lower() in ("1", "true", "yes"),
+    "SLOW_QUERIES": 5,
+    "DUPLICATE_THRESHOLD": 5,
+    "RECENT": 50,
+}
+
+# Business-day calendar used for task scheduling (ISO dates, Monday=0 weekdays)
+BUSINESS_HOLIDAYS = []
+BUSINESS_WEEKEND = [5, 6]
@@ -0,0 +1,159 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase, skipIf
+
+import django
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import SimpleTestCase, TestCase as DatabaseTestCase, override_settings
+
+from . import metrics
+from .database import database_settings, sqlite_pragmas
+
+BASE_DIR = Path("/srv/app")
+
+
+class SqliteProfileTests(SimpleTestCase):
+    def test_defaults(self):
+        config = database_settings(BASE_DIR, {})
+        self.assertEqual(config["ENGINE"], "django.db.backends.sqlite3")
+        self.assertEqual(config["NAME"], BASE_DIR / "db.sqlite3")
+        self.assertEqual(config["CONN_MAX_AGE"], 0)
+        self.assertEqual(config["OPTIONS"]["timeout"], 5)
+        if django.VERSION >= (5, 1):
+            self.assertEqual(config["OPTIONS"]["transaction_mode"], "IMMEDIATE")
+
+    def test_environment_overrides(self):
+        config = database_settings(BASE_DIR, {"DB_NAME": "/tmp/pm.sqlite3", "SQLITE_BUSY_TIMEOUT": "250"})
+        self.assertEqual(config["NAME"], "/tmp/pm.sqlite3")
+        self.assertEqual(config["OPTIONS"]["timeout"], 0.25)
+
+    def test_pragmas(self):
+        self.assertEqual(
+            sqlite_pragmas({}),
+            {"synchronous": "NORMAL", "busy_timeout": 5000, "mmap_size": 256 * 1024 * 1024},
+        )
+        self.assertEqual(sqlite_pragmas({"SQLITE_SYNCHRONOUS": "FULL"})["synchronous"], "FULL")
+        # journal_mode persists in the file, so it leads and is only set on request
+        self.assertEqual(list(sqlite_pragmas({"SQLITE_JOURNAL_MODE": "WAL"}))[0], "journal_mode")
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ImproperlyConfigured):
+            database_settings(BASE_DIR, {"DB_ENGINE": "oracle"})
+
+    def test_invalid_integer(self):
+        with self.assertRaises(ImproperlyConfigured):
+            database_settings(BASE_DIR, {"DB_CONN_MAX_AGE": "soon"})
+
+
+@skipIf(connections["default"].vendor != "sqlite", "the SQLite profile is not in use")
+class SqliteConnectionTests(TestCase):
+    """Opens a real connection, which SimpleTestCase forbids"""
+
+    def read_pragmas(self, environ):
+        # The test database is in memory, which has no WAL, so open a file-backed connection
+        with tempfile.TemporaryDirectory() as directory, override_settings(SQLITE_PRAGMAS=sqlite_pragmas(environ)):
+            settings_dict = {**connections["default"].settings_dict, "NAME": str(Path(directory) / "wal.sqlite3")}
+            connection = DatabaseWrapper(settings_dict, alias="wal_check")
+            try:
+                with connection.cursor() as cursor:
+                    values = {}
+                    for pragma in ("journal_mode", "synchronous", "busy_timeout"):
+                        cursor.execute(f"PRAGMA {pragma}")
+                        values[pragma] = cursor.fetchone()[0]
+            finally:
+                connection.close()
+            return values
+
+    def test_new_connections_run_the_pragmas(self):
+        # synchronous=NORMAL reads back as 1
+        self.assertEqual(
+            self.read_pragmas({"SQLITE_JOURNAL_MODE": "WAL"}),
+            {"journal_mode": "wal", "synchronous": 1, "busy_timeout": 5000},
+        )
+
+    def test_journal_mode_is_left_alone_by_default(self):
+        self.assertEqual(self.read_pragmas({})["journal_mode"], "delete")
+
+
+class PostgresProfileTests(SimpleTestCase):
+    ENVIRON = {
+        "DB_ENGINE": "postgres",
+        "DB_NAME": "pm",
+        "DB_USER": "pm",
+        "DB_PASSWORD": "secret",
+        "DB_HOST": "db",
+    }
+
+    def test_persistent_connections(self):
+        config = database_settings(BASE_DIR, self.ENVIRON)
+        self.assertEqual(config["ENGINE"], "django.db.backends.postgresql")
+        self.assertEqual(
+            {key: config[key] for key in ("NAME", "USER", "PASSWORD", "HOST", "PORT")},
+            {"NAME": "pm", "USER": "pm", "PASSWORD": "secret", "HOST": "db", "PORT": "5432"},
+        )
+        self.assertEqual(config["CONN_MAX_AGE"], 60)
+        self.assertTrue(config["CONN_HEALTH_CHECKS"])
+        self.assertNotIn("pool", config["OPTIONS"])
+
+    def test_health_checks_can_be_turned_off(self):
+        config = database_settings(BASE_DIR, {**self.ENVIRON, "DB_CONN_HEALTH_CHECKS": "0", "DB_CONN_MAX_AGE": "5"})
+        self.assertFalse(config["CONN_HEALTH_CHECKS"])
+        self.assertEqual(config["CONN_MAX_AGE"], 5)
+
+    @skipIf(django.VERSION < (5, 1), "connection pools need Django 5.1")
+    def test_pool(self):
+        config = database_settings(BASE_DIR, {**self.ENVIRON, "DB_POOL": "1", "DB_POOL_MAX_SIZE": "20"})
+        # Pooled connections go back to the pool rather than persisting per thread
+        self.assertEqual(config["CONN_MAX_AGE"], 0)
+        self.assertEqual(config["OPTIONS"]["pool"], {"min_size": 2, "max_size": 20, "timeout": 10})
+
+    @skipIf(django.VERSION >= (5, 1), "connection pools are available")
+    def test_pool_needs_django_5_1(self):
+        with self.assertRaises(ImproperlyConfigured):
+            database_settings(BASE_DIR, {**self.ENVIRON, "DB_POOL": "1"})
+
+
+@override_settings(REQUEST_METRICS={"ENABLED": True, "DUPLICATE_THRESHOLD": 2})
+class RequestMetricsTests(DatabaseTestCase):
+    def setUp(self):
+        metrics.store.reset()
+
+    def test_server_timing_header(self):
+        response = self.client.get("/api/projects/")
+        self.assertEqual(response.status_code, 200)
+        phases = dict(entry.split(";", 1) for entry in response["Server-Timing"].split(", "))
+        self.assertEqual(set(phases), {"total", "db", "serialize", "render", "view"})
+        self.assertRegex(phases["db"], r'^dur=[\d.]+;desc="\d+ queries"$')
+
+    def test_routes_are_aggregated_and_reset(self):
+        self.client.get("/api/projects/")
+        self.client.get("/api/projects/")
+        self.client.get("/api/projects/999999/")
+
+        snapshot = self.client.get("/api/_metrics/").json()
+        projects = snapshot["routes"]["GET /api/projects/"]
+        self.assertEqual(projects["count"], 2)
+        self.assertEqual(sum(projects["histogram"].values()), 2)
+        self.assertGreater(projects["queries_max"], 0)
+        self.assertEqual(snapshot["routes"]["GET /api/projects/<pk>/"]["count"], 1)
+        self.assertEqual([entry["status"] for entry in snapshot["recent"]], [200, 200, 404])
+
+        self.assertEqual(self.client.delete("/api/_metrics/").status_code, 204)
+        snapshot = self.client.get("/api/_metrics/").json()
+        self.assertEqual(list(snapshot["routes"]), ["DELETE /api/_metrics/"])
+        self.assertEqual(self.client.post("/api/_metrics/").status_code, 405)
+
+    def test_repeated_statements_are_flagged(self):
+        record = metrics.RequestRecord()
+        record.statements = [("SELECT 1", 0.001), ("SELECT 2", 0.003), ("SELECT 1", 0.002)]
+        self.assertEqual(record.duplicates(), [{"sql": "SELECT 1", "count": 2}])
+        self.assertEqual([item["sql"] for item in record.slowest()], ["SELECT 2", "SELECT 1", "SELECT 1"])
+
+    @override_settings(REQUEST_METRICS={"ENABLED": False})
+    def test_disabled(self):
+        response = self.client.get("/api/projects/")
+        self.assertNotIn("Server-Timing", response)
+        self.assertEqual(self.client.get("/api/_metrics/").status_code, 404)
+        self.assertEqual(metrics.store.snapshot()["routes"], {})
@@ -2,7 +2,10 @@
 from django.contrib import admin
 from django.urls import path, include
 
+from .metrics import metrics_view
+
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('api/_metrics/', metrics_view, name='request-metrics'),
     path('api/', include('projects.urls')),
 ]
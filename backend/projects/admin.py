@@ -1,6 +1,6 @@
 
 from django.contrib import admin
-from .models import Employee, Project, Task
+from .models import Employee, Job, Project, Task
 
 @admin.register(Employee)
 class EmployeeAdmin(admin.ModelAdmin):
@@ -12,10 +12,16 @@ class TaskInline(admin.TabularInline):
 
 @admin.register(Project)
 class ProjectAdmin(admin.ModelAdmin):
-    list_display = ("id", "title", "start_date", "end_date", "assigned_employee", "completion_time")
+    list_display = ("id", "title", "start_date", "end_date", "assigned_employee", "completion_time",
+                    "task_count", "done_count", "min_task_start", "max_task_end")
     inlines = [TaskInline]
 
 @admin.register(Task)
 class TaskAdmin(admin.ModelAdmin):
     list_display = ("id", "project", "order", "name", "start_date", "end_date", "status", "completion_time")
     list_filter = ("project", "status")
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ("id", "kind", "project", "status", "coalesced", "created_at", "finished_at")
+    list_filter = ("kind", "status")
@@ -0,0 +1,193 @@
+"""Async versions of the heavier read endpoints, used under ASGI.
+
+Each handler answers a plain JSON GET on the async ORM and returns None for
+anything it does not cover (cursor pagination, ?stream=, format suffixes,
+the browsable API, invalid parameters); async_read then hands the request
+to the regular DRF view in a worker thread. Bodies, ETags and caching match
+the sync views byte for byte. Wired up by async_urls when
+settings.ASYNC_READS is on (opt-in; see settings).
+
+Streamed responses (?stream=, /api/export/) stay on the sync views, whose
+StreamingHttpResponse gets an async iterator under ASGI
+(streaming.async_lines), so they are not buffered either way.
+"""
+from datetime import date
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models import Count, Sum
+from django.db.models.functions import Coalesce
+from django.http import HttpResponse
+from django.urls import URLPattern
+from rest_framework.permissions import AllowAny
+from rest_framework.request import Request
+
+from pm_backend.metrics import serializing
+
+from . import cache, fast_read
+from .conditional import aconditional_response, aqueryset_etag
+from .models import Employee, Project, Task
+from .renderers import FastJSONRenderer
+from .serializers import ProjectSerializer, TaskSerializer
+from .views import TIMELINE_CHUNK_SIZE, TIMELINE_FIELDS
+
+# Query parameters only the sync views implement
+SYNC_ONLY_PARAMS = ("page_size", "cursor", "stream", "format")
+
+
+def _json(data):
+    response = HttpResponse(FastJSONRenderer().render(data), content_type="application/json")
+    response["Vary"] = "Accept"
+    return response
+
+
+def _sync_only(request, kwargs):
+    return (
+        "format" in kwargs
+        or not str(kwargs.get("pk", "0")).isdigit()
+        or any(param in request.GET for param in SYNC_ONLY_PARAMS)
+        or "text/html" in request.headers.get("Accept", "")
+    )
+
+
+async def _project_payloads(request, rows):
+    """Cached ProjectSerializer payloads for cache.PROJECT_KEY_FIELDS rows"""
+    drf_request = Request(request)
+    params = drf_request.query_params
+    serializer = ProjectSerializer(many=True, context={"request": drf_request})
+    payloads = await cache.acached_projects(
+        rows,
+        f"{params.get('fields', '')}|{params.get('omit', '')}",
+        lambda missing: fast_read.aproject_payloads(serializer, missing),
+    )
+    return [payloads[row[0]] for row in rows]
+
+
+async def project_list(request):
+    if not fast_read.enabled():
+        return None
+    etag = await aqueryset_etag(request, Project.objects.all(), Task.objects.all(), Employee.objects.all())
+
+    async def build():
+        projects = Project.objects.order_by("-created_at").values_list(*cache.PROJECT_KEY_FIELDS)
+        return _json(await _project_payloads(request, [row async for row in projects]))
+
+    return await aconditional_response(request, etag, build)
+
+
+async def project_detail(request, pk):
+    if not fast_read.enabled():
+        return None
+    row = await Project.objects.filter(pk=pk).values_list(*cache.PROJECT_KEY_FIELDS).afirst()
+    if row is None:
+        return None  # the sync view words the 404
+    etag = await aqueryset_etag(
+        request,
+        Project.objects.filter(pk=pk),
+        Task.objects.filter(project_id=pk),
+        Employee.objects.filter(projects=pk),
+    )
+
+    async def build():
+        return _json((await _project_payloads(request, [row]))[0])
+
+    return await aconditional_response(request, etag, build)
+
+
+async def project_tasks(request, pk):
+    if not fast_read.enabled():
+        return None
+    tasks = Task.objects.filter(project_id=pk).order_by("order")
+    etag = await aqueryset_etag(request, tasks)
+
+    async def build():
+        reader = fast_read.task_reader(TaskSerializer(many=True))
+        with serializing():
+            data = [reader.build(row) async for row in tasks.values(*reader.columns)]
+        return _json(data)
+
+    return await aconditional_response(request, etag, build)
+
+
+async def project_stats(request):
+    totals = await Project.objects.aaggregate(
+        total_projects=Count("id"),
+        total_tasks=Coalesce(Sum("task_count"), 0),
+        completed_tasks=Coalesce(Sum("done_count"), 0),
+    )
+    total_tasks, completed_tasks = totals["total_tasks"], totals["completed_tasks"]
+    return _json({
+        "total_projects": totals["total_projects"],
+        "total_tasks": total_tasks,
+        "completed_tasks": completed_tasks,
+        "completion_rate": round((completed_tasks / total_tasks) * 100) if total_tasks > 0 else 0,
+    })
+
+
+async def project_timeline(request):
+    window = {}
+    for param, lookup in (("start", "end_date__gte"), ("end", "start_date__lte")):
+        value = request.GET.get(param)
+        if value:
+            try:
+                window[lookup] = date.fromisoformat(value)
+            except ValueError:
+                return None  # the sync view words the 400
+    dated = Task.objects.filter(start_date__isnull=False, end_date__isnull=False, **window)
+    etag = await aqueryset_etag(request, dated, Project.objects.all(), Employee.objects.all())
+
+    async def timeline():
+        rows = dated.order_by("project_id", "order").values(*TIMELINE_FIELDS.values())
+        return [
+            {key: row[field] for key, field in TIMELINE_FIELDS.items()}
+            async for row in rows.aiterator(chunk_size=TIMELINE_CHUNK_SIZE)
+        ]
+
+    async def build():
+        return _json(await cache.acached_global("timeline", etag.strip('"'), timeline))
+
+    return await aconditional_response(request, etag, build)
+
+
+def async_read(read, view):
+    """An async view that serves GETs with ``read`` and everything else with the DRF ``view``"""
+    sync_view = sync_to_async(view)
+
+    @wraps(view)
+    async def dispatch(request, *args, **kwargs):
+        if request.method == "GET" and not _sync_only(request, kwargs):
+            response = await read(request, *args, **kwargs)
+            if response is not None:
+                return response
+        return await sync_view(request, *args, **kwargs)
+
+    return dispatch
+
+
+# Router URL name -> async GET handler
+ASYNC_READS = {
+    "project-list": project_list,
+    "project-detail": project_detail,
+    "project-tasks": project_tasks,
+    "project-stats": project_stats,
+    "task-project-timeline": project_timeline,
+}
+
+
+def async_urls(patterns):
+    """Router patterns with the ASYNC_READS views swapped in.
+
+    The async handlers skip DRF's authentication and permission checks, so
+    a viewset that restricts access keeps its sync view.
+    """
+    if not getattr(settings, "ASYNC_READS", False):
+        return patterns
+    swapped = []
+    for pattern in patterns:
+        read = ASYNC_READS.get(pattern.name)
+        view_class = getattr(pattern.callback, "cls", None)
+        if read and all(permission is AllowAny for permission in view_class.permission_classes):
+            pattern = URLPattern(pattern.pattern, async_read(read, pattern.callback), pattern.default_args, pattern.name)
+        swapped.append(pattern)
+    return swapped
@@ -0,0 +1,209 @@
+import http.client
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from urllib.parse import urlsplit
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from .cache import get_cache
+from .models import Project, Task
+from .synthetic import generate_dataset
+
+# name: (employees, projects, tasks per project)
+SIZES = {
+    "small": (20, 50, 10),
+    "medium": (100, 500, 20),
+    "large": (500, 2000, 30),
+}
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(sorted_values, pct):
+    """Linearly interpolated percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = (len(sorted_values) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def summarize(timings, query_counts, statuses):
+    timings = sorted(timings)
+    summary = {f"p{pct}_ms": round(percentile(timings, pct) * 1000, 3) for pct in PERCENTILES}
+    summary.update({
+        "min_ms": round(timings[0] * 1000, 3),
+        "max_ms": round(timings[-1] * 1000, 3),
+        "mean_ms": round(sum(timings) / len(timings) * 1000, 3),
+        "queries": max(query_counts),
+        "queries_min": min(query_counts),
+        "statuses": sorted(set(statuses)),
+        "samples": len(timings),
+    })
+    return summary
+
+
+class EndpointBenchmark:
+    """Times one API call per iteration against the current database.
+
+    Read endpoints clear the payload cache before every call unless
+    ``warm`` is set, so they measure the full query and serialization path.
+    """
+
+    def __init__(self, client, repeat):
+        self.client = client
+        self.repeat = repeat
+        self.project_ids = list(Project.objects.filter(task_count__gt=0).values_list("pk", flat=True))
+        # First dated tasks of projects with others to cascade to
+        first_tasks = Task.objects.filter(
+            project__task_count__gt=1, project_id__in=self.project_ids, order=1, start_date__isnull=False
+        )
+        self.first_task_ids = list(first_tasks.values_list("pk", flat=True))
+        window = Task.objects.order_by("start_date").values_list("start_date", flat=True)
+        self.timeline_start = window.first()
+
+    def scenarios(self):
+        yield "employee_list", self.get("/api/employees/")
+        yield "project_list", self.get("/api/projects/")
+        yield "project_list_warm", self.get("/api/projects/", warm=True)
+        yield "task_list", self.get("/api/tasks/")
+        if self.timeline_start:
+            end = self.timeline_start + timedelta(days=90)
+            yield "timeline", self.get(f"/api/tasks/project_timeline/?start={self.timeline_start}&end={end}")
+        yield "task_update_cascade", self.rotate(self.first_task_ids, self.delay_task)
+        yield "task_shift", self.rotate(self.first_task_ids, self.shift_task)
+        yield "auto_schedule", self.rotate(self.project_ids, self.auto_schedule)
+
+    def get(self, path, warm=False):
+        def call():
+            if not warm:
+                get_cache().clear()
+            return self.client.get(path)
+        if warm:
+            call()
+        return call
+
+    def rotate(self, ids, request):
+        # Each iteration writes to a different row so per-row state does not build up
+        ids = itertools.cycle(ids or [None])
+        return lambda: request(next(ids))
+
+    def delay_task(self, pk):
+        # Task.save derives end_date from start_date + completion_days, so lengthen the task
+        completion_days = Task.objects.values_list("completion_days", flat=True).get(pk=pk)
+        response = self.client.patch(f"/api/tasks/{pk}/", {"completion_days": completion_days + 1}, format="json")
+        if response.status_code == 200 and not response.data["cascaded_tasks"]:
+            raise RuntimeError(f"Delaying task {pk} cascaded to no other task; the scenario measured nothing")
+        return response
+
+    def shift_task(self, pk):
+        return self.client.post(f"/api/tasks/{pk}/shift/", {"days": 1}, format="json")
+
+    def auto_schedule(self, pk):
+        return self.client.post(f"/api/projects/{pk}/auto_schedule/")
+
+    def measure(self, call):
+        timings, query_counts, statuses = [], [], []
+        for _ in range(self.repeat):
+            with CaptureQueriesContext(connection) as context:
+                started = time.perf_counter()
+                response = call()
+                timings.append(time.perf_counter() - started)
+            query_counts.append(len(context.captured_queries))
+            statuses.append(response.status_code)
+        return summarize(timings, query_counts, statuses)
+
+    def run(self, only=None):
+        return {
+            name: self.measure(call)
+            for name, call in self.scenarios()
+            if not only or name in only
+        }
+
+
+def run_size(size, repeat, seed=0, dependency_ratio=0.0, only=None):
+    """Generate one dataset size into the (empty) current database and benchmark it"""
+    employees, projects, tasks = size
+    started = time.perf_counter()
+    counts = generate_dataset(employees, projects, tasks, seed=seed, dependency_ratio=dependency_ratio)
+    counts["generate_seconds"] = round(time.perf_counter() - started, 3)
+    get_cache().clear()
+    endpoints = EndpointBenchmark(APIClient(), repeat).run(only)
+    return {"dataset": counts, "endpoints": endpoints}
+
+
+def compare(previous, current, threshold):
+    """Regressions between two result files: slower p50 beyond threshold % or more queries"""
+    regressions = []
+    for size, result in current["results"].items():
+        old_endpoints = previous.get("results", {}).get(size, {}).get("endpoints", {})
+        for name, stats in result["endpoints"].items():
+            old = old_endpoints.get(name)
+            if not old:
+                continue
+            if stats["queries"] > old["queries"]:
+                regressions.append(f"{size}/{name}: queries {old['queries']} -> {stats['queries']}")
+            if old["p50_ms"] and stats["p50_ms"] > old["p50_ms"] * (1 + threshold / 100):
+                regressions.append(f"{size}/{name}: p50 {old['p50_ms']}ms -> {stats['p50_ms']}ms")
+    return regressions
+
+
+# Read endpoints a load test hits by default; the async views cover all of them
+LOAD_PATHS = (
+    "/api/projects/",
+    "/api/projects/stats/",
+    "/api/tasks/project_timeline/",
+)
+
+
+def load_test(base_url, path, concurrency, requests):
+    """Hammer one path of a running server with ``concurrency`` keep-alive clients.
+
+    Returns latency percentiles, throughput and the status codes seen.
+    """
+    url = urlsplit(base_url)
+    remaining = itertools.count()
+    local = threading.local()
+    timings, statuses = [], []
+
+    def connection():
+        if getattr(local, "connection", None) is None:
+            local.connection = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=60)
+        return local.connection
+
+    def worker():
+        while next(remaining) < requests:
+            started = time.perf_counter()
+            try:
+                conn = connection()
+                conn.request("GET", url.path.rstrip("/") + path, headers={"Accept": "application/json"})
+                response = conn.getresponse()
+                response.read()
+                status = response.status
+            except (OSError, http.client.HTTPException):
+                local.connection = None
+                status = "error"
+            timings.append(time.perf_counter() - started)
+            statuses.append(status)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(worker)
+    elapsed = time.perf_counter() - started
+
+    timings.sort()
+    summary = {f"p{pct}_ms": round(percentile(timings, pct) * 1000, 3) for pct in PERCENTILES}
+    summary.update({
+        "requests": len(timings),
+        "requests_per_second": round(len(timings) / elapsed, 1),
+        "errors": sum(1 for status in statuses if status == "error" or status >= 500),
+        "statuses": sorted({str(status) for status in statuses}),
+    })
+    return summary
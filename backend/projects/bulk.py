@@ -0,0 +1,175 @@
+from django.db.models import Q
+
+from .business_calendar import add_business_days
+from .critical_path import downstream, project_edges, with_order_edges
+from .models import Task
+from .serializers import TaskSerializer
+from .task_writes import save_task_changes, snapshot_tasks
+
+class BulkOperationError(Exception):
+    def __init__(self, index, message):
+        super().__init__(message)
+        self.index = index
+        self.message = message
+
+
+def _int(value, index, name):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise BulkOperationError(index, f"{name} must be an integer")
+
+
+class TaskBatch:
+    """Apply a list of task operations in memory, then write each project once.
+
+    Every operation follows the same rules as the single-task endpoints,
+    including the cascade of TaskViewSet.cascade_delay (dependents when the
+    project has dependencies, unlinked tasks following the task before them;
+    otherwise every later task), but cascades only
+    move rows in memory; the database sees one bulk write at the end.
+    """
+
+    OPERATIONS = ("patch", "shift", "set_completion_days", "delete", "reorder")
+    # Operations that act on a whole project rather than on one task id
+    TASKLESS_OPERATIONS = ()
+
+    def __init__(self, operations):
+        self.operations = operations
+        self.by_id = {}
+        self.by_project = {}
+        self.edges = {}
+        self.deleted = []
+        self.touched = set()
+
+    def validate(self):
+        """Check the operation list; returns the task ids and project ids it refers to"""
+        task_ids, project_ids = set(), set()
+        for index, operation in enumerate(self.operations):
+            if not isinstance(operation, dict) or operation.get("op") not in self.OPERATIONS:
+                raise BulkOperationError(index, f"op must be one of: {', '.join(self.OPERATIONS)}")
+            if operation["op"] == "reorder":
+                project_ids.add(_int(operation.get("project"), index, "project"))
+            elif operation["op"] not in self.TASKLESS_OPERATIONS:
+                task_ids.add(_int(operation.get("id"), index, "id"))
+        return task_ids, project_ids
+
+    def load(self):
+        task_ids, project_ids = self.validate()
+        touched_projects = Task.objects.filter(pk__in=task_ids).values("project_id")
+        tasks = (
+            Task.objects.filter(Q(project_id__in=touched_projects) | Q(project_id__in=project_ids))
+            .order_by("project_id", "order")
+            .select_for_update()
+        )
+        for task in tasks:
+            self.by_id[task.pk] = task
+            self.by_project.setdefault(task.project_id, []).append(task)
+        self.snapshots = snapshot_tasks(self.by_id.values())
+        for predecessor, successor in project_edges(list(self.by_project)):
+            self.edges.setdefault(self.by_id[successor].project_id, []).append((predecessor, successor))
+
+    def _task(self, index, operation):
+        task = self.by_id.get(int(operation["id"]))
+        if task is None:
+            raise BulkOperationError(index, f"Task {operation['id']} not found")
+        self.touched.add(task.pk)
+        return task
+
+    def _settle(self, task):
+        """Derive end_date and completion_time the way Task.save does"""
+        if task.start_date and task.completion_days:
+            task.end_date = task.calculate_end_date()
+        if task.start_date and task.end_date:
+            task.completion_time = task.end_date - task.start_date
+
+    def _cascade(self, task, old_end_date):
+        if not old_end_date or not task.end_date or old_end_date == task.end_date:
+            return
+        delta = task.end_date - old_end_date
+        edges = self.edges.get(task.project_id)
+        tasks = self.by_project[task.project_id]
+        if edges:
+            dependents = downstream(task.pk, with_order_edges([t.pk for t in tasks], edges))
+            affected = [t for t in tasks if t.pk in dependents]
+        else:
+            affected = [t for t in tasks if t.order > task.order]
+        for following in affected:
+            if following.start_date:
+                following.start_date += delta
+            if following.end_date:
+                following.end_date += delta
+
+    def patch(self, index, operation):
+        task = self._task(index, operation)
+        serializer = TaskSerializer(task, data=operation.get("data") or {}, partial=True)
+        if not serializer.is_valid():
+            raise BulkOperationError(index, serializer.errors)
+        old_end_date = task.end_date
+        for attr, value in serializer.validated_data.items():
+            setattr(task, attr, value)
+        self._settle(task)
+        self._cascade(task, old_end_date)
+
+    def shift(self, index, operation):
+        task = self._task(index, operation)
+        days = _int(operation.get("days", 0), index, "days")
+        if days == 0:
+            raise BulkOperationError(index, "Days parameter is required")
+        if task.start_date:
+            old_end_date = task.end_date
+            task.start_date = add_business_days(task.start_date, days)
+            self._settle(task)
+            self._cascade(task, old_end_date)
+
+    def set_completion_days(self, index, operation):
+        task = self._task(index, operation)
+        completion_days = _int(operation.get("completion_days", 1), index, "completion_days")
+        if completion_days < 1:
+            raise BulkOperationError(index, "Completion days must be at least 1")
+        old_end_date = task.end_date
+        task.completion_days = completion_days
+        self._settle(task)
+        self._cascade(task, old_end_date)
+
+    def delete(self, index, operation):
+        task = self._task(index, operation)
+        del self.by_id[task.pk]
+        self.by_project[task.project_id].remove(task)
+        self.deleted.append(task.pk)
+        if task.project_id in self.edges:
+            self.edges[task.project_id] = [edge for edge in self.edges[task.project_id] if task.pk not in edge]
+
+    def reorder(self, index, operation):
+        project_id = int(operation["project"])
+        tasks = self.by_project.get(project_id, [])
+        ids = operation.get("ids")
+        if not isinstance(ids, list) or sorted(map(str, ids)) != sorted(str(task.pk) for task in tasks):
+            raise BulkOperationError(index, "ids must list every task of the project exactly once")
+        # Hand the project's existing order values out in the new sequence, so gaps survive
+        orders = sorted(task.order for task in tasks)
+        position = {str(pk): order for order, pk in zip(orders, ids)}
+        for task in tasks:
+            task.order = position[str(task.pk)]
+            self.touched.add(task.pk)
+        tasks.sort(key=lambda task: task.order)
+
+    def apply(self):
+        """Apply every operation to the loaded tasks, in memory only"""
+        for index, operation in enumerate(self.operations):
+            getattr(self, operation["op"])(index, operation)
+
+        for project_id, tasks in self.by_project.items():
+            orders = [task.order for task in tasks]
+            if len(orders) != len(set(orders)):
+                raise BulkOperationError(None, f"Task orders must be unique within project {project_id}")
+
+    def run(self):
+        """Apply every operation, write the result, and return (touched tasks, deleted ids)"""
+        self.load()
+        self.apply()
+
+        changed = save_task_changes(list(self.by_id.values()), self.snapshots, removed=self.deleted)
+        touched = {task.pk: task for task in changed}
+        touched.update((pk, self.by_id[pk]) for pk in self.touched if pk in self.by_id)
+        return sorted(touched.values(), key=lambda task: (task.project_id, task.order)), self.deleted
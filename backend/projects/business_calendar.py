@@ -0,0 +1,123 @@
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+
+class BusinessCalendar:
+    """Business-day arithmetic in constant time (weeks plus remainder).
+
+    Non-working weekdays are given as ``weekend`` (Monday=0, Sunday=6) and
+    extra days off as ``holidays``; holidays are kept as a sorted list and
+    looked up with bisect.
+    """
+
+    def __init__(self, holidays=(), weekend=(5, 6)):
+        self.weekend = frozenset(weekend)
+        self.workdays_per_week = 7 - len(self.weekend)
+        if self.workdays_per_week <= 0:
+            raise ValueError("A business calendar needs at least one working weekday")
+        self.holidays = sorted({
+            day for day in (self._to_date(h) for h in holidays)
+            if day.weekday() not in self.weekend
+        })
+
+    @staticmethod
+    def _to_date(value):
+        return value if isinstance(value, date) else date.fromisoformat(value)
+
+    def is_business_day(self, day):
+        if day.weekday() in self.weekend:
+            return False
+        i = bisect_left(self.holidays, day)
+        return i == len(self.holidays) or self.holidays[i] != day
+
+    def _weekdays_between(self, start, end):
+        """Working weekdays in (start, end], ignoring holidays"""
+        days = (end - start).days
+        if days <= 0:
+            return 0
+        weeks, remainder = divmod(days, 7)
+        count = weeks * self.workdays_per_week
+        weekday = start.weekday()
+        for offset in range(1, remainder + 1):
+            if (weekday + offset) % 7 not in self.weekend:
+                count += 1
+        return count
+
+    def _holidays_between(self, start, end):
+        """Holidays in (start, end]"""
+        if not self.holidays or end <= start:
+            return 0
+        return bisect_right(self.holidays, end) - bisect_right(self.holidays, start)
+
+    def _step_weekdays(self, start, days, direction):
+        """Move ``days`` working weekdays away from start, ignoring holidays"""
+        weeks, remainder = divmod(days - 1, self.workdays_per_week)
+        current = start + timedelta(days=7 * weeks * direction)
+        remainder += 1
+        while remainder:
+            current += timedelta(days=direction)
+            if current.weekday() not in self.weekend:
+                remainder -= 1
+        return current
+
+    def add_business_days(self, start_date, days):
+        """Return the date ``days`` business days after (or before, if negative) start_date"""
+        if days == 0:
+            return start_date
+        if days < 0:
+            return self.subtract_business_days(start_date, -days)
+
+        current = self._step_weekdays(start_date, days, 1)
+        skipped = self._holidays_between(start_date, current)
+        while skipped:
+            previous = current
+            current = self._step_weekdays(previous, skipped, 1)
+            skipped = self._holidays_between(previous, current)
+        return current
+
+    def subtract_business_days(self, start_date, days):
+        """Return the date ``days`` business days before start_date"""
+        if days <= 0:
+            return start_date
+
+        current = self._step_weekdays(start_date, days, -1)
+        skipped = self._holidays_between(current - timedelta(days=1), start_date - timedelta(days=1))
+        while skipped:
+            previous = current
+            current = self._step_weekdays(previous, skipped, -1)
+            skipped = self._holidays_between(current - timedelta(days=1), previous - timedelta(days=1))
+        return current
+
+    def count_business_days(self, start_date, end_date):
+        """Count business days after start_date up to and including end_date"""
+        if end_date <= start_date:
+            return 0
+        return self._weekdays_between(start_date, end_date) - self._holidays_between(start_date, end_date)
+
+
+@lru_cache(maxsize=None)
+def get_calendar():
+    """Calendar built from the BUSINESS_HOLIDAYS / BUSINESS_WEEKEND settings"""
+    return BusinessCalendar(
+        holidays=getattr(settings, "BUSINESS_HOLIDAYS", ()),
+        weekend=getattr(settings, "BUSINESS_WEEKEND", (5, 6)),
+    )
+
+
+@receiver(setting_changed)
+def _reset_calendar(*, setting, **kwargs):
+    if setting in ("BUSINESS_HOLIDAYS", "BUSINESS_WEEKEND"):
+        get_calendar.cache_clear()
+
+
+def add_business_days(start_date, days):
+    return get_calendar().add_business_days(start_date, days)
+
+
+def count_business_days(start_date, end_date):
+    return get_calendar().count_business_days(start_date, end_date)
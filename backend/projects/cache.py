@@ -0,0 +1,152 @@
+"""Read-through cache for serialized project and timeline payloads.
+
+Keys are built from database state (updated_at columns, or the response's
+ETag), never from counters kept in the cache itself, so a write made by any
+process (another worker, run_jobs, import_data) changes the key the web
+workers compute and the stale entry is simply never read again.
+"""
+import threading
+from collections import Counter
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+
+from .models import Employee, Project
+
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+# bump() scope -> model whose updated_at feeds the keys
+SCOPES = {"project": Project, "employee": Employee}
+
+
+def get_cache():
+    """Cache backend for serialized payloads (PROJECTS_CACHE_ALIAS, locmem by default)"""
+    return caches[getattr(settings, "PROJECTS_CACHE_ALIAS", "projects")]
+
+
+def bump(scope, *pks):
+    """Move updated_at of these projects or employees so payloads cached under the old value miss.
+
+    For writes that change a payload without saving the row itself (task
+    edits, reorders, a project count); runs in the caller's transaction.
+    """
+    pks = {pk for pk in pks if pk is not None}
+    if pks:
+        SCOPES[scope].objects.filter(pk__in=pks).update(updated_at=timezone.now())
+
+
+def _record(namespace, hits, misses):
+    with _stats_lock:
+        _stats[f"{namespace}.hits"] += hits
+        _stats[f"{namespace}.misses"] += misses
+
+
+def stats():
+    """Hit/miss counters per payload kind since process start"""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def _stamp(value):
+    return value.isoformat() if value is not None else "-"
+
+
+# values_list() lookups of the rows cached_projects takes
+PROJECT_KEY_FIELDS = ("id", "updated_at", "assigned_employee_id", "assigned_employee__updated_at")
+
+
+def project_key_queryset(queryset):
+    """Projects with only the columns project_key_row needs, employee joined"""
+    return queryset.select_related("assigned_employee").only(
+        "id", "created_at", "updated_at", "assigned_employee", "assigned_employee__updated_at"
+    )
+
+
+def project_key_row(project):
+    """The cached_projects row of a project loaded through project_key_queryset"""
+    employee = project.assigned_employee if project.assigned_employee_id else None
+    return (project.pk, project.updated_at, project.assigned_employee_id, employee and employee.updated_at)
+
+
+def _project_keys(rows, variant):
+    return {
+        pk: f"project:{pk}:{_stamp(updated_at)}:{employee_id or '-'}:{_stamp(employee_updated_at)}:{variant}"
+        for pk, updated_at, employee_id, employee_updated_at in rows
+    }
+
+
+def _lookup_projects(rows, variant):
+    keys = _project_keys(rows, variant)
+    found = get_cache().get_many(list(keys.values()))
+    payloads = {pk: found[key] for pk, key in keys.items() if key in found}
+    missing = [pk for pk in keys if pk not in payloads]
+    _record("project", len(keys) - len(missing), len(missing))
+    return keys, payloads, missing
+
+
+def _store(keys, built):
+    get_cache().set_many({keys[pk]: payload for pk, payload in built.items()})
+
+
+def cached_projects(rows, variant, build):
+    """Read-through cache for serialized projects.
+
+    ``rows`` is a list of (project_id, updated_at, assigned_employee_id,
+    employee updated_at) tuples and ``build`` serializes a list of missing
+    ids into {id: payload}. Keys carry those columns plus ``variant`` (e.g.
+    the requested fields): task writes refresh the project's rollups and so
+    its updated_at, and project count changes bump the employee. Returns
+    {id: payload} for every row.
+    """
+    keys, payloads, missing = _lookup_projects(rows, variant)
+    if missing:
+        built = build(missing)
+        _store(keys, built)
+        payloads.update(built)
+    return payloads
+
+
+async def acached_projects(rows, variant, build):
+    """cached_projects with an async ``build``.
+
+    The lookups run as one sync_to_async call: BaseCache.aget_many would
+    take a thread hop per key.
+    """
+    keys, payloads, missing = await sync_to_async(_lookup_projects)(rows, variant)
+    if missing:
+        built = await build(missing)
+        await sync_to_async(_store)(keys, built)
+        payloads.update(built)
+    return payloads
+
+
+def _lookup_global(namespace, state):
+    key = f"{namespace}:{state}"
+    payload = get_cache().get(key)
+    _record(namespace, int(payload is not None), int(payload is None))
+    return key, payload
+
+
+def cached_global(namespace, state, build):
+    """Read-through cache for payloads that depend on every project (e.g. timeline windows).
+
+    ``state`` must change whenever the payload could, e.g. the response's
+    queryset_etag (which also covers the query string).
+    """
+    key, payload = _lookup_global(namespace, state)
+    if payload is None:
+        payload = build()
+        get_cache().set(key, payload)
+    return payload
+
+
+async def acached_global(namespace, state, build):
+    """cached_global with an async ``build``"""
+    key, payload = await sync_to_async(_lookup_global)(namespace, state)
+    if payload is None:
+        payload = await build()
+        await sync_to_async(get_cache().set)(key, payload)
+    return payload
@@ -0,0 +1,60 @@
+import asyncio
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from rest_framework.response import Response
+
+
+def _state_aggregates():
+    return {"count": Count("pk"), "latest": Max("updated_at")}
+
+
+def _etag(request, querysets, states):
+    parts = [request.get_full_path()]
+    for queryset, state in zip(querysets, states):
+        parts.append(f"{queryset.model._meta.label}:{state['count']}:{state['latest']}")
+    digest = hashlib.md5("|".join(parts).encode(), usedforsecurity=False).hexdigest()
+    return f'"{digest}"'
+
+
+def queryset_etag(request, *querysets):
+    """Cheap validator: row count and latest updated_at of each queryset, plus the URL.
+
+    A deletion lowers a count and any write moves updated_at forward, so the
+    tag changes whenever the serialized payload could.
+    """
+    states = [queryset.order_by().aggregate(**_state_aggregates()) for queryset in querysets]
+    return _etag(request, querysets, states)
+
+
+async def aqueryset_etag(request, *querysets):
+    """queryset_etag with the aggregates awaited concurrently"""
+    states = await asyncio.gather(*(
+        queryset.order_by().aaggregate(**_state_aggregates()) for queryset in querysets
+    ))
+    return _etag(request, querysets, states)
+
+
+def conditional_response(request, etag, build):
+    """Answer If-None-Match with 304, otherwise build the response and tag it"""
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        not_modified["ETag"] = etag
+        return not_modified
+    response = build()
+    if isinstance(response, Response) and response.status_code == 200:
+        response["ETag"] = etag
+    return response
+
+
+async def aconditional_response(request, etag, build):
+    """conditional_response for an async ``build`` returning any HttpResponse"""
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        not_modified["ETag"] = etag
+        return not_modified
+    response = await build()
+    if response.status_code == 200:
+        response["ETag"] = etag
+    return response
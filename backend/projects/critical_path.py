@@ -0,0 +1,136 @@
+from collections import deque
+from datetime import timedelta
+
+from .business_calendar import get_calendar
+from .models import Task
+
+DependencyEdge = Task.predecessors.through
+
+
+class DependencyCycle(Exception):
+    pass
+
+
+def project_edges(project_ids):
+    """(predecessor_id, successor_id) pairs for the given projects, in one query"""
+    return list(
+        DependencyEdge.objects.filter(from_task__project_id__in=project_ids)
+        .values_list("to_task_id", "from_task_id")
+    )
+
+
+def topological_order(node_ids, edges):
+    """Kahn's algorithm in O(V+E); raises DependencyCycle if the graph has a cycle"""
+    successors = {pk: [] for pk in node_ids}
+    indegree = dict.fromkeys(node_ids, 0)
+    for predecessor, successor in edges:
+        successors[predecessor].append(successor)
+        indegree[successor] += 1
+
+    ready = deque(pk for pk in node_ids if indegree[pk] == 0)
+    order = []
+    while ready:
+        pk = ready.popleft()
+        order.append(pk)
+        for successor in successors[pk]:
+            indegree[successor] -= 1
+            if indegree[successor] == 0:
+                ready.append(successor)
+    if len(order) != len(indegree):
+        raise DependencyCycle("Task dependencies contain a cycle")
+    return order, successors
+
+
+def with_order_edges(task_ids, edges):
+    """``edges`` plus an order edge into every task that has no dependency links.
+
+    ``task_ids`` are the project's tasks in order. An unlinked task keeps
+    following the task before it, as in a project without dependencies, so
+    linking two tasks does not reschedule the unrelated ones. Order edges
+    only lead into unlinked tasks, which have no explicit successors, so
+    they cannot close a cycle.
+    """
+    linked = {pk for edge in edges for pk in edge}
+    return list(edges) + [
+        (previous, pk) for previous, pk in zip(task_ids, task_ids[1:]) if pk not in linked
+    ]
+
+
+def downstream(task_id, edges):
+    """Ids of every task that transitively depends on task_id"""
+    successors = {}
+    for predecessor, successor in edges:
+        successors.setdefault(predecessor, []).append(successor)
+    seen, stack = set(), [task_id]
+    while stack:
+        for successor in successors.get(stack.pop(), ()):
+            if successor not in seen:
+                seen.add(successor)
+                stack.append(successor)
+    seen.discard(task_id)
+    return seen
+
+
+def critical_path(tasks, edges, start_date, keep_start_dates=True):
+    """Forward and backward pass over the dependency graph.
+
+    Durations are completion_days in business days and a successor starts on
+    the first business day after its last predecessor ends, as in
+    auto_schedule. Tasks without predecessors start at start_date, or at their
+    own start_date when keep_start_dates is set and it is later.
+
+    Returns ({task_id: schedule}, ordered critical path ids, project finish).
+    """
+    calendar = get_calendar()
+    by_id = {task.pk: task for task in tasks}
+    order, successors = topological_order(list(by_id), edges)
+    predecessors = {pk: [] for pk in by_id}
+    for predecessor, successor in edges:
+        predecessors[successor].append(predecessor)
+
+    anchor = calendar.add_business_days(start_date - timedelta(days=1), 1)
+    earliest_start, earliest_finish = {}, {}
+    for pk in order:
+        task = by_id[pk]
+        if predecessors[pk]:
+            start = calendar.add_business_days(max(earliest_finish[p] for p in predecessors[pk]), 1)
+        else:
+            start = anchor
+            if keep_start_dates and task.start_date and task.start_date > start:
+                start = calendar.add_business_days(task.start_date - timedelta(days=1), 1)
+        earliest_start[pk] = start
+        earliest_finish[pk] = calendar.add_business_days(start, task.completion_days or 0)
+
+    finish = max(earliest_finish.values(), default=anchor)
+    latest_start, latest_finish = {}, {}
+    for pk in reversed(order):
+        task = by_id[pk]
+        if successors[pk]:
+            latest_finish[pk] = calendar.subtract_business_days(min(latest_start[s] for s in successors[pk]), 1)
+        else:
+            latest_finish[pk] = finish
+        latest_start[pk] = calendar.subtract_business_days(latest_finish[pk], task.completion_days or 0)
+
+    schedule = {}
+    for pk in order:
+        slack = calendar.count_business_days(earliest_start[pk], latest_start[pk])
+        schedule[pk] = {
+            "earliest_start": earliest_start[pk],
+            "earliest_finish": earliest_finish[pk],
+            "latest_start": latest_start[pk],
+            "latest_finish": latest_finish[pk],
+            "slack": slack,
+            "critical": slack == 0,
+        }
+
+    # Walk the zero-slack chain from a critical source to the finish
+    path = []
+    current = next((pk for pk in order if not predecessors[pk] and schedule[pk]["critical"]), None)
+    while current is not None:
+        path.append(current)
+        current = next(
+            (s for s in successors[current]
+             if schedule[s]["critical"] and calendar.add_business_days(earliest_finish[current], 1) == earliest_start[s]),
+            None,
+        )
+    return schedule, path, finish
@@ -0,0 +1,59 @@
+"""Set-wise bookkeeping for deleted employees, projects and tasks.
+
+Every delete of these models goes through TrackedQuerySet.delete or
+TrackedModel.delete (models.py), which hand it to delete_tracked: the ids
+about to go are read with one query per model (tasks of deleted projects
+included), their tombstones are written with one bulk_create, and the
+rollup refresh and employee bump run once afterwards. No delete signal is
+connected to Task, so Django still removes a project's tasks with a single
+DELETE instead of loading them.
+"""
+from django.db import transaction
+from django.utils import timezone
+
+from . import cache
+from .models import Employee, Project, Task, Tombstone
+from .rollups import schedule_rollup
+
+
+def _tombstones(model_name, pks, now):
+    return [Tombstone(model=model_name, object_id=pk, deleted_at=now) for pk in pks]
+
+
+def delete_tracked(queryset, delete):
+    """Run ``delete`` (Django's own delete of ``queryset``) with its tombstones and derived writes"""
+    now = timezone.now()
+    with transaction.atomic(using=queryset.db):
+        if queryset.model is Task:
+            rows = list(queryset.order_by().values_list("pk", "project_id"))
+            tombstones = _tombstones("task", [pk for pk, _ in rows], now)
+            task_projects = {project_id for _, project_id in rows}
+            employees = []
+        elif queryset.model is Project:
+            rows = list(queryset.order_by().values_list("pk", "assigned_employee_id"))
+            pks = [pk for pk, _ in rows]
+            task_pks = Task.objects.filter(project__in=pks).values_list("pk", flat=True)
+            tombstones = _tombstones("project", pks, now) + _tombstones("task", task_pks.iterator(), now)
+            task_projects = set()
+            # Employee payloads carry a project count
+            employees = [employee_id for _, employee_id in rows]
+        elif queryset.model is Employee:
+            pks = list(queryset.order_by().values_list("pk", flat=True))
+            tombstones = _tombstones("employee", pks, now)
+            task_projects, employees = set(), []
+            # SET_NULL is a plain UPDATE, so move updated_at for sync clients here
+            Project.objects.filter(assigned_employee__in=pks).update(updated_at=now)
+        else:
+            raise TypeError(f"{queryset.model.__name__} deletes are not tracked")
+
+        Tombstone.objects.bulk_create(tombstones, batch_size=1000)
+        result = delete()
+        schedule_rollup(*task_projects)
+        cache.bump("employee", *employees)
+    return result
+
+
+def prune_tombstones(older_than):
+    """Delete tombstones recorded longer ago than ``older_than``; returns how many went"""
+    deleted, _ = Tombstone.objects.filter(deleted_at__lt=timezone.now() - older_than).delete()
+    return deleted
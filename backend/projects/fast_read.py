@@ -0,0 +1,214 @@
+"""Serializer-identical payloads built straight from .values() rows.
+
+Read-only list endpoints spend most of their time in DRF's per-field
+machinery on full model instances. A RowReader looks at a serializer's
+(already sparse-trimmed) fields once and turns each values() row into the
+same dict, in the same key order: plain columns are copied, datetimes are
+localized with a timezone resolved once, other dates and durations go
+through the field's own to_representation, and method fields are computed
+from the row. Builds run inside metrics.serializing() so Server-Timing still
+reports them as serializer time. Toggle with settings.FAST_READS.
+"""
+import asyncio
+from operator import itemgetter
+
+from django.conf import settings
+from django.db.models import Count
+from django.utils import timezone
+from rest_framework import ISO_8601, relations, serializers
+from rest_framework.settings import api_settings
+
+from pm_backend.metrics import serializing
+
+from .business_calendar import count_business_days
+from .models import Employee, Project, Task
+
+# Fields whose to_representation is the identity on the values() type
+PASSTHROUGH_FIELDS = (
+    serializers.CharField, serializers.IntegerField, serializers.BooleanField,
+    serializers.ChoiceField, relations.RelatedField,
+)
+
+DEPARTMENT_LABELS = dict(Employee._meta.get_field("department").flatchoices)
+
+
+def enabled():
+    return getattr(settings, "FAST_READS", True)
+
+
+def _fields(serializer):
+    serializer = getattr(serializer, "child", serializer)
+    return {name: field for name, field in serializer.fields.items() if not field.write_only}
+
+
+def _datetime_converter(field):
+    """DateTimeField.to_representation with the timezone looked up once instead of per value"""
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    field_timezone = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+    if output_format is None or output_format.lower() != ISO_8601 or field_timezone is None:
+        return field.to_representation
+
+    def convert(value):
+        if not timezone.is_aware(value):
+            return field.to_representation(value)
+        value = value.astimezone(field_timezone).isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+    return convert
+
+
+def _converter(key, convert):
+    def get(row):
+        value = row[key]
+        return None if value is None else convert(value)
+    return get
+
+
+class RowReader:
+    """Maps values() rows to the representation of ``serializer``.
+
+    ``computed`` maps a field name to (columns it needs, function of the row)
+    for fields that are not plain columns (method fields, nested data).
+    """
+
+    def __init__(self, serializer, computed=None):
+        computed = computed or {}
+        self.fields = _fields(serializer)
+        self.columns = []
+        self.getters = []
+        for name, field in self.fields.items():
+            if name in computed:
+                columns, getter = computed[name]
+            elif isinstance(field, relations.RelatedField):
+                columns = [f"{field.source}_id"]
+                getter = itemgetter(columns[0])
+            elif isinstance(field, PASSTHROUGH_FIELDS):
+                columns = [field.source]
+                getter = itemgetter(field.source)
+            elif isinstance(field, serializers.DateTimeField):
+                columns = [field.source]
+                getter = _converter(field.source, _datetime_converter(field))
+            else:
+                columns = [field.source]
+                getter = _converter(field.source, field.to_representation)
+            self.require(*columns)
+            self.getters.append((name, getter))
+
+    def require(self, *columns):
+        for column in columns:
+            if column not in self.columns:
+                self.columns.append(column)
+
+    def __contains__(self, name):
+        return name in self.fields
+
+    def build(self, row):
+        return {name: getter(row) for name, getter in self.getters}
+
+
+def _business_days(row):
+    if not row["start_date"] or not row["end_date"]:
+        return None
+    return count_business_days(row["start_date"], row["end_date"])
+
+
+def task_reader(serializer):
+    return RowReader(serializer, {
+        "business_days": (["start_date", "end_date"], _business_days),
+    })
+
+
+def employee_reader(serializer):
+    return RowReader(serializer, {
+        "department_display": (
+            ["department"], lambda row: DEPARTMENT_LABELS.get(row["department"], row["department"])
+        ),
+        "project_count": (["num_projects"], itemgetter("num_projects")),
+    })
+
+
+def _completion_percentage(row):
+    if row["task_count"] == 0:
+        return 0
+    return round((row["done_count"] / row["task_count"]) * 100)
+
+
+class ProjectPayloads:
+    """ProjectSerializer-identical payloads from at most three values() queries"""
+
+    def __init__(self, serializer):
+        fields = _fields(serializer)
+        self.reader = RowReader(serializer, {
+            "assigned_employee_detail": (["assigned_employee_id"], itemgetter("_employee")),
+            "tasks": (["id"], itemgetter("_tasks")),
+            "completion_percentage": (["task_count", "done_count"], _completion_percentage),
+        })
+        self.reader.require("id", "assigned_employee_id")
+        self.tasks_reader = self.employees_reader = None
+        if "tasks" in self.reader:
+            self.tasks_reader = task_reader(fields["tasks"])
+            self.tasks_reader.require("project_id")
+        if "assigned_employee_detail" in self.reader:
+            self.employees_reader = employee_reader(fields["assigned_employee_detail"])
+            self.employees_reader.require("id")
+
+    def projects(self, project_ids):
+        return Project.objects.filter(pk__in=project_ids).order_by().values(*self.reader.columns)
+
+    def tasks(self, rows):
+        if self.tasks_reader is None:
+            return None
+        return (
+            Task.objects.filter(project_id__in=[row["id"] for row in rows])
+            .order_by("project_id", "order")
+            .values(*self.tasks_reader.columns)
+        )
+
+    def employees(self, rows):
+        employee_ids = {row["assigned_employee_id"] for row in rows if row["assigned_employee_id"]}
+        if self.employees_reader is None or not employee_ids:
+            return None
+        return (
+            Employee.objects.filter(pk__in=employee_ids)
+            .annotate(num_projects=Count("projects"))
+            .order_by()
+            .values(*self.employees_reader.columns)
+        )
+
+    def assemble(self, rows, task_rows, employee_rows):
+        tasks = {}
+        for row in task_rows:
+            tasks.setdefault(row["project_id"], []).append(self.tasks_reader.build(row))
+        employees = {row["id"]: self.employees_reader.build(row) for row in employee_rows}
+
+        payloads = {}
+        for row in rows:
+            row["_tasks"] = tasks.get(row["id"], [])
+            row["_employee"] = employees.get(row["assigned_employee_id"])
+            payloads[row["id"]] = self.reader.build(row)
+        return payloads
+
+
+def project_payloads(serializer, project_ids):
+    """{id: ProjectSerializer-identical payload} in three queries at most"""
+    with serializing():
+        builder = ProjectPayloads(serializer)
+        rows = list(builder.projects(project_ids))
+        tasks, employees = builder.tasks(rows), builder.employees(rows)
+        return builder.assemble(rows, tasks if tasks is not None else [], employees if employees is not None else [])
+
+
+async def _alist(queryset):
+    if queryset is None:
+        return []
+    return [row async for row in queryset.aiterator(chunk_size=2000)]
+
+
+async def aproject_payloads(serializer, project_ids):
+    """project_payloads on the async ORM; the task and employee queries run concurrently"""
+    with serializing():
+        builder = ProjectPayloads(serializer)
+        rows = await _alist(builder.projects(project_ids))
+        tasks, employees = await asyncio.gather(_alist(builder.tasks(rows)), _alist(builder.employees(rows)))
+        return builder.assemble(rows, tasks, employees)
@@ -0,0 +1,170 @@
+"""Background jobs for heavy project writes, queued in the Job table.
+
+A request enqueues a job and returns; ``python manage.py run_jobs`` claims
+queued jobs oldest first and runs them. There are three kinds:
+
+* ``reschedule``: auto_schedule_projects for the project. It replaces every
+  task date, so it supersedes the project's queued cascades.
+* ``cascade``: shift the tasks that follow payload["task"] by
+  payload["days"] calendar days. Queued cascades of the same task add up.
+* ``recompute_rollups``: refresh_project_rollups for the project.
+
+Queued jobs of the same kind for the same project (and task) coalesce into
+one. A claimed batch runs consecutive jobs of one kind together in one
+transaction: one bulk_update, UPDATE or deferred rollup refresh for all
+their projects. If that fails, the jobs are retried one by one, so a bad
+project only fails its own job.
+"""
+import itertools
+import logging
+import os
+import socket
+from collections import Counter
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .critical_path import DependencyCycle
+from .models import Job, Project, Task
+from .rollups import deferred_rollups, refresh_project_rollups
+from .scheduling import auto_schedule_projects, shift_following
+
+logger = logging.getLogger(__name__)
+
+KINDS = [kind for kind, _ in Job.KIND_CHOICES]
+
+
+class JobError(Exception):
+    """A job that cannot run; the message is stored on the job"""
+
+
+def worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def enqueue(kind, project_id, task_id=None, days=0):
+    """Queue a job, or merge it into the same queued job, and return the job.
+
+    Call inside the transaction of the request's own writes so the worker
+    only sees the job once they are committed.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Unknown job kind {kind!r}")
+    key = str(task_id) if kind == "cascade" else ""
+    payload = {"task": task_id, "days": days} if kind == "cascade" else {}
+
+    while True:
+        with transaction.atomic():
+            if kind == "reschedule":
+                Job.objects.filter(project_id=project_id, kind="cascade", status="queued").update(
+                    status="superseded", finished_at=timezone.now(), updated_at=timezone.now()
+                )
+            job = (
+                Job.objects.select_for_update()
+                .filter(kind=kind, project_id=project_id, coalesce_key=key, status="queued")
+                .first()
+            )
+            if job is not None:
+                if kind == "cascade":
+                    job.payload["days"] += days
+                job.coalesced = F("coalesced") + 1
+                job.save(update_fields=["payload", "coalesced", "updated_at"])
+                job.refresh_from_db(fields=["coalesced"])
+                return job
+            try:
+                with transaction.atomic():
+                    return Job.objects.create(kind=kind, project_id=project_id, coalesce_key=key, payload=payload)
+            except IntegrityError:
+                pass  # Queued by another request meanwhile; merge into that one
+
+
+def claim(limit, worker):
+    """Mark up to ``limit`` queued jobs as running for ``worker`` and return them, oldest first"""
+    queued = Job.objects.filter(status="queued").order_by("id").values_list("pk", flat=True)
+    ids = list(queued[:limit])
+    if not ids:
+        return []
+    now = timezone.now()
+    # Only still-queued rows flip, so two workers never claim the same job
+    Job.objects.filter(pk__in=ids, status="queued").update(
+        status="running", worker=worker, started_at=now, updated_at=now
+    )
+    return list(Job.objects.filter(pk__in=ids, status="running", worker=worker, started_at=now).order_by("id"))
+
+
+def _reschedule(jobs):
+    projects = list(Project.objects.filter(pk__in=[job.project_id for job in jobs]))
+    for project in projects:
+        if not project.start_date:
+            raise JobError("Project must have a start date to auto-schedule tasks")
+    scheduled = Counter(task.project_id for task in auto_schedule_projects(projects))
+    return {job.pk: {"tasks": scheduled[job.project_id]} for job in jobs}
+
+
+def _cascade(jobs):
+    results = {}
+    tasks = Task.objects.in_bulk([job.payload["task"] for job in jobs])
+    with deferred_rollups():
+        for job in jobs:
+            task = tasks.get(job.payload["task"])
+            # A task deleted since has nothing left to cascade
+            moved = shift_following(task, timedelta(days=job.payload["days"])) if task else []
+            results[job.pk] = {"moved": len(moved)}
+    return results
+
+
+def _recompute_rollups(jobs):
+    refresh_project_rollups({job.project_id for job in jobs})
+    return {}
+
+
+HANDLERS = {
+    "reschedule": _reschedule,
+    "cascade": _cascade,
+    "recompute_rollups": _recompute_rollups,
+}
+
+
+def _finish(job, status, result=None, error=""):
+    now = timezone.now()
+    Job.objects.filter(pk=job.pk).update(status=status, result=result, error=error, finished_at=now, updated_at=now)
+
+
+def _run(kind, jobs):
+    try:
+        with transaction.atomic():
+            results = HANDLERS[kind](jobs)
+    except Exception as exc:
+        if len(jobs) > 1:
+            for job in jobs:
+                _run(kind, [job])
+            return
+        if not isinstance(exc, (JobError, DependencyCycle)):
+            logger.exception("Job %s failed", jobs[0].pk)
+        _finish(jobs[0], "failed", error=str(exc) or exc.__class__.__name__)
+        return
+    for job in jobs:
+        _finish(job, "done", result=results.get(job.pk))
+
+
+def run_jobs(jobs):
+    """Run claimed jobs in order, batching consecutive jobs of the same kind"""
+    for kind, group in itertools.groupby(jobs, key=lambda job: job.kind):
+        _run(kind, list(group))
+
+
+def run_pending(limit=50, worker=None):
+    """Claim and run one batch; returns the number of jobs run"""
+    jobs = claim(limit, worker or worker_name())
+    run_jobs(jobs)
+    return len(jobs)
+
+
+def fail_stale(older_than):
+    """Fail running jobs started longer ago than ``older_than`` (their worker died)"""
+    now = timezone.now()
+    return Job.objects.filter(status="running", started_at__lt=now - older_than).update(
+        status="failed", error="Worker stopped before the job finished", finished_at=now, updated_at=now
+    )
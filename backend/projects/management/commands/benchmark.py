@@ -0,0 +1,103 @@
+import json
+import platform
+from pathlib import Path
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.utils import timezone
+
+from projects.benchmark import SIZES, compare, run_size
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the main API endpoints on synthetic datasets of several sizes. "
+        "Each size runs in a throwaway test database; results are written as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", default="small,medium",
+            help=f"Comma-separated sizes ({', '.join(SIZES)}) or EMPLOYEES:PROJECTS:TASKS triples",
+        )
+        parser.add_argument("--repeat", type=int, default=20, help="Calls per endpoint")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--dependencies", type=float, default=0.0, help="Share of projects with task dependencies")
+        parser.add_argument("--only", help="Comma-separated endpoint names to run")
+        parser.add_argument("--output", default="benchmark-results.json", help="Where to write the JSON results")
+        parser.add_argument("--compare", help="Earlier results file to check for regressions")
+        parser.add_argument("--threshold", type=float, default=20.0, help="Allowed p50 slowdown in percent")
+        parser.add_argument("--fail-on-regression", action="store_true")
+
+    def parse_sizes(self, value):
+        sizes = {}
+        for name in filter(None, (part.strip() for part in value.split(","))):
+            if name in SIZES:
+                sizes[name] = SIZES[name]
+                continue
+            try:
+                employees, projects, tasks = (int(part) for part in name.split(":"))
+            except ValueError:
+                raise CommandError(f"Unknown size {name!r}")
+            sizes[name] = (employees, projects, tasks)
+        if not sizes:
+            raise CommandError("No sizes given")
+        return sizes
+
+    def handle(self, *args, **options):
+        sizes = self.parse_sizes(options["sizes"])
+        if options["repeat"] < 1:
+            raise CommandError("--repeat must be at least 1")
+        only = set(options["only"].split(",")) if options["only"] else None
+        previous = None
+        if options["compare"]:
+            previous = json.loads(Path(options["compare"]).read_text())
+
+        report = {
+            "meta": {
+                "created_at": timezone.now().isoformat(),
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "database": connection.vendor,
+                "repeat": options["repeat"],
+                "seed": options["seed"],
+                "dependencies": options["dependencies"],
+            },
+            "results": {},
+        }
+
+        setup_test_environment()
+        try:
+            for name, size in sizes.items():
+                self.stdout.write(f"{name}: {size[0]} employees, {size[1]} projects, {size[2]} tasks each")
+                old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+                try:
+                    result = run_size(size, options["repeat"], options["seed"], options["dependencies"], only)
+                finally:
+                    connection.creation.destroy_test_db(old_name, verbosity=0)
+                report["results"][name] = result
+                self.write_table(result["endpoints"])
+        finally:
+            teardown_test_environment()
+
+        Path(options["output"]).write_text(json.dumps(report, indent=2))
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+
+        if previous is not None:
+            regressions = compare(previous, report, options["threshold"])
+            for line in regressions:
+                self.stdout.write(self.style.WARNING(line))
+            if not regressions:
+                self.stdout.write(self.style.SUCCESS("No regressions"))
+            elif options["fail_on_regression"]:
+                raise CommandError(f"{len(regressions)} regression(s)")
+
+    def write_table(self, endpoints):
+        self.stdout.write(f"  {'endpoint':<22}{'p50':>10}{'p90':>10}{'p99':>10}{'queries':>9}  status")
+        for name, stats in endpoints.items():
+            self.stdout.write(
+                f"  {name:<22}{stats['p50_ms']:>8.1f}ms{stats['p90_ms']:>8.1f}ms{stats['p99_ms']:>8.1f}ms"
+                f"{stats['queries']:>9}  {','.join(map(str, stats['statuses']))}"
+            )
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from projects.streaming import csv_lines, ndjson_lines
+from projects.transfer import EXPORT_COLUMNS, EXPORT_TYPES, export_records
+
+
+class Command(BaseCommand):
+    help = "Stream employees, projects and tasks as NDJSON or CSV that import_data can load again."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--stream", choices=["ndjson", "csv"], default="ndjson", help="Output format")
+        parser.add_argument(
+            "--type", action="append", dest="types", choices=list(EXPORT_TYPES.values()),
+            help="Limit to these record types (repeatable; default all)",
+        )
+        parser.add_argument("--output", default="-", help="File to write, or - for stdout")
+
+    def handle(self, *args, stream="ndjson", types=None, output="-", **options):
+        names = {name: record_type for record_type, name in EXPORT_TYPES.items()}
+        records = export_records({names[name] for name in types or names})
+        lines = csv_lines(records, EXPORT_COLUMNS) if stream == "csv" else ndjson_lines(records)
+        if output == "-":
+            for line in lines:
+                self.stdout.write(line, ending="")
+            return
+        with open(output, "w", newline="", encoding="utf-8") as out:
+            out.writelines(lines)
+        self.stderr.write(self.style.SUCCESS(f"Exported to {output}"))
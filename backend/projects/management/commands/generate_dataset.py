@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from projects.models import Employee, Project, Tombstone
+from projects.synthetic import generate_dataset
+
+
+class Command(BaseCommand):
+    help = "Fill the database with a reproducible synthetic dataset of employees, projects and tasks."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--employees", type=int, default=50)
+        parser.add_argument("--projects", type=int, default=200)
+        parser.add_argument("--tasks", type=int, default=20, help="Tasks per project")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--dependencies", type=float, default=0.0,
+            help="Share of projects (0-1) that also get explicit task dependencies",
+        )
+        parser.add_argument("--clear", action="store_true", help="Delete all employees, projects and tasks first")
+
+    def handle(self, *args, employees, projects, tasks, seed, dependencies, clear, **options):
+        if min(employees, projects, tasks) < 0:
+            raise CommandError("Counts must not be negative")
+        if not 0 <= dependencies <= 1:
+            raise CommandError("--dependencies must be between 0 and 1")
+
+        if clear:
+            with transaction.atomic():
+                Project.objects.all().delete()
+                Employee.objects.all().delete()
+                Tombstone.objects.all().delete()
+
+        counts = generate_dataset(employees, projects, tasks, seed=seed, dependency_ratio=dependencies)
+        self.stdout.write(self.style.SUCCESS(
+            "Created {employees} employees, {projects} projects, {tasks} tasks and {dependencies} dependencies".format(**counts)
+        ))
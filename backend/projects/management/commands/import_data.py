@@ -0,0 +1,41 @@
+import json
+import sys
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.transfer import CHUNK_SIZE, READERS, import_records
+
+
+class Command(BaseCommand):
+    help = (
+        "Import employees, projects and tasks from an NDJSON or CSV file (as written by export_data), "
+        "in chunks of bulk inserts. Invalid rows are skipped and reported."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to read, or - for stdin")
+        parser.add_argument("--stream", choices=sorted(READERS), help="Format (default: from the file extension)")
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Rows per bulk insert")
+
+    def handle(self, *args, path, stream=None, chunk_size=CHUNK_SIZE, **options):
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be at least 1")
+        fmt = stream or ("csv" if path.endswith(".csv") else "ndjson")
+        if path == "-":
+            summary = import_records(READERS[fmt](sys.stdin), chunk_size)
+        else:
+            if not Path(path).is_file():
+                raise CommandError(f"No such file: {path}")
+            with open(path, newline="", encoding="utf-8") as lines:
+                summary = import_records(READERS[fmt](lines), chunk_size)
+
+        for error in summary["errors"]:
+            self.stderr.write(f"line {error['line']} ({error['type']}): {json.dumps(error['errors'])}")
+        if summary["error_count"] > len(summary["errors"]):
+            self.stderr.write(f"... and {summary['error_count'] - len(summary['errors'])} more")
+        created = ", ".join(f"{count} {name}" for name, count in summary["created"].items())
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {created}; {summary['matched_employees']} existing employee(s), "
+            f"{summary['error_count']} row(s) skipped"
+        ))
@@ -0,0 +1,45 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from projects.benchmark import LOAD_PATHS, load_test
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-test read endpoints of an already running server (e.g. gunicorn for WSGI "
+        "vs uvicorn for ASGI) with concurrent keep-alive clients; results are written as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", default="http://127.0.0.1:8000", help="Base URL of the server")
+        parser.add_argument("--path", action="append", dest="paths", help=f"Path to hit (repeatable; default {', '.join(LOAD_PATHS)})")
+        parser.add_argument("--concurrency", type=int, default=16, help="Simultaneous clients")
+        parser.add_argument("--requests", type=int, default=500, help="Requests per path")
+        parser.add_argument("--label", default="", help="Name for this run in the output, e.g. wsgi or asgi")
+        parser.add_argument("--output", default="loadtest-results.json", help="Where to write the JSON results")
+
+    def handle(self, *args, **options):
+        if options["concurrency"] < 1 or options["requests"] < 1:
+            raise CommandError("--concurrency and --requests must be at least 1")
+        report = {
+            "meta": {
+                "created_at": timezone.now().isoformat(),
+                "url": options["url"],
+                "label": options["label"],
+                "concurrency": options["concurrency"],
+            },
+            "results": {},
+        }
+        self.stdout.write(f"  {'path':<40}{'req/s':>9}{'p50':>10}{'p95':>10}{'p99':>10}{'errors':>8}")
+        for path in options["paths"] or LOAD_PATHS:
+            stats = load_test(options["url"], path, options["concurrency"], options["requests"])
+            report["results"][path] = stats
+            self.stdout.write(
+                f"  {path:<40}{stats['requests_per_second']:>9.1f}{stats['p50_ms']:>8.1f}ms"
+                f"{stats['p95_ms']:>8.1f}ms{stats['p99_ms']:>8.1f}ms{stats['errors']:>8}"
+            )
+        Path(options["output"]).write_text(json.dumps(report, indent=2))
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
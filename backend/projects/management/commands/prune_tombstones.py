@@ -0,0 +1,24 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from projects.deletion import prune_tombstones
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete sync tombstones older than the retention window. Clients whose last sync is older "
+        "get 410 from /api/sync/ and start over, so run this no more often than daily."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=int, default=None,
+            help="Keep this many days (default SYNC_TOMBSTONE_RETENTION_DAYS)",
+        )
+
+    def handle(self, *args, days=None, **options):
+        days = settings.SYNC_TOMBSTONE_RETENTION_DAYS if days is None else days
+        deleted = prune_tombstones(timedelta(days=days))
+        self.stdout.write(self.style.SUCCESS(f"Pruned {deleted} tombstone(s) older than {days} day(s)"))
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from projects.models import Project
+from projects.rollups import refresh_project_rollups, rollup_expressions
+
+
+class Command(BaseCommand):
+    help = "Recompute the per-project task rollup columns, or with --verify report drift without writing."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--verify", action="store_true", help="Only compare stored and actual values")
+        parser.add_argument("--project", type=int, action="append", dest="projects", help="Limit to these project ids")
+
+    def handle(self, *args, verify=False, projects=None, **options):
+        queryset = Project.objects.all()
+        if projects:
+            queryset = queryset.filter(pk__in=projects)
+
+        expected = {f"expected_{name}": expression for name, expression in rollup_expressions().items()}
+        drifted = []
+        for row in queryset.annotate(**expected).values("pk", *Project.ROLLUP_FIELDS, *expected).iterator():
+            diffs = {
+                name: (row[name], row[f"expected_{name}"])
+                for name in Project.ROLLUP_FIELDS
+                if row[name] != row[f"expected_{name}"]
+            }
+            if diffs:
+                drifted.append(row["pk"])
+                for name, (stored, actual) in diffs.items():
+                    self.stdout.write(f"project {row['pk']}: {name} stored={stored} actual={actual}")
+
+        if verify:
+            if drifted:
+                raise CommandError(f"{len(drifted)} project(s) have stale rollups")
+            self.stdout.write(self.style.SUCCESS("All project rollups are up to date"))
+            return
+
+        with transaction.atomic():
+            refresh_project_rollups(drifted)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt rollups for {len(drifted)} project(s)"))
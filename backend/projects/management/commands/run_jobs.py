@@ -0,0 +1,55 @@
+import signal
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from projects.jobs import fail_stale, run_pending, worker_name
+
+
+class Command(BaseCommand):
+    help = (
+        "Run queued background jobs (reschedules, cascades, rollup refreshes). "
+        "Polls the job table until stopped, or with --once drains the queue and exits."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Exit once the queue is empty")
+        parser.add_argument("--batch", type=int, default=50, help="Jobs claimed per round")
+        parser.add_argument("--interval", type=float, default=1.0, help="Seconds to sleep when the queue is empty")
+        parser.add_argument(
+            "--stale-after", type=int, default=600,
+            help="Fail jobs left running this many seconds by a worker that died",
+        )
+
+    def handle(self, *args, once=False, batch=50, interval=1.0, stale_after=600, **options):
+        if batch < 1:
+            raise CommandError("--batch must be at least 1")
+        self.stopping = False
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, self.stop)
+
+        worker = worker_name()
+        stale = fail_stale(timedelta(seconds=stale_after))
+        if stale:
+            self.stdout.write(self.style.WARNING(f"Marked {stale} stale job(s) as failed"))
+        self.stdout.write(f"Worker {worker} started")
+
+        total = 0
+        while not self.stopping:
+            # Like a request: drop connections that are broken or past CONN_MAX_AGE
+            close_old_connections()
+            ran = run_pending(batch, worker)
+            total += ran
+            if ran:
+                self.stdout.write(f"Ran {ran} job(s)")
+            elif once:
+                break
+            else:
+                time.sleep(interval)
+        self.stdout.write(self.style.SUCCESS(f"Worker {worker} stopped after {total} job(s)"))
+
+    def stop(self, signum, frame):
+        # Finish the current batch, then exit
+        self.stopping = True
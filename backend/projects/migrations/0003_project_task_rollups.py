@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:30
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, Max, Min, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def fill_rollups(apps, schema_editor):
+    Project = apps.get_model("projects", "Project")
+    Task = apps.get_model("projects", "Task")
+
+    def per_project(aggregate):
+        rows = (
+            Task.objects.filter(project=OuterRef("pk")).order_by()
+            .values("project").annotate(value=aggregate).values("value")
+        )
+        return Subquery(rows)
+
+    Project.objects.update(
+        task_count=Coalesce(per_project(Count("pk")), Value(0), output_field=IntegerField()),
+        done_count=Coalesce(per_project(Count("pk", filter=Q(status="done"))), Value(0), output_field=IntegerField()),
+        min_task_start=per_project(Min("start_date")),
+        max_task_end=per_project(Max("end_date")),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_sync_updated_at_and_tombstones'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='done_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='max_task_end',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='min_task_start',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='task_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_rollups, migrations.RunPython.noop),
+    ]
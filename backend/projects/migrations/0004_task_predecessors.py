@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_project_task_rollups'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='predecessors',
+            field=models.ManyToManyField(blank=True, help_text='Tasks in the same project that must finish before this one starts', related_name='successors', to='projects.task'),
+        ),
+    ]
@@ -2,7 +2,33 @@ from django.db import models
 from datetime import timedelta, date
 from django.utils import timezone
 
-class Employee(models.Model):
+from .business_calendar import add_business_days
+
+class TrackedQuerySet(models.QuerySet):
+    """Deletes leave tombstones and keep rollups in step (see projects/deletion.py)"""
+
+    def delete(self):
+        # Imported here: deletion imports rollups, which imports this module
+        from .deletion import delete_tracked
+        return delete_tracked(self, super().delete)
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+class TrackedModel(models.Model):
+    """Base for the models delta sync follows; instance deletes go through TrackedQuerySet"""
+
+    objects = TrackedQuerySet.as_manager()
+
+    def delete(self, *args, **kwargs):
+        from .deletion import delete_tracked
+        queryset = type(self)._default_manager.filter(pk=self.pk)
+        return delete_tracked(queryset, lambda: super(TrackedModel, self).delete(*args, **kwargs))
+
+    class Meta:
+        abstract = True
+
+class Employee(TrackedModel):
     DEPARTMENT_CHOICES = [
         ('engineering', 'Engineering'),
         ('design', 'Design'),
@@ -18,6 +44,7 @@ class Employee(models.Model):
     email = models.EmailField(unique=True)
     department = models.CharField(max_length=20, choices=DEPARTMENT_CHOICES, default='other')
     created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self):
         return f"{self.name} ({self.get_department_display()})"
@@ -25,7 +52,7 @@ class Employee(models.Model):
     class Meta:
         ordering = ['name']
 
-class Project(models.Model):
+class Project(TrackedModel):
     title = models.CharField(max_length=200)
     description = models.TextField(blank=True)
     start_date = models.DateField(null=True, blank=True)
@@ -33,11 +60,32 @@ class Project(models.Model):
     assigned_employee = models.ForeignKey('Employee', on_delete=models.SET_NULL, null=True, blank=True, related_name="projects")
     completion_time = models.DurationField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    # Task rollups, kept in step with the tasks by projects.rollups
+    task_count = models.PositiveIntegerField(default=0, editable=False)
+    done_count = models.PositiveIntegerField(default=0, editable=False)
+    min_task_start = models.DateField(null=True, blank=True, editable=False)
+    max_task_end = models.DateField(null=True, blank=True, editable=False)
+
+    ROLLUP_FIELDS = ["task_count", "done_count", "min_task_start", "max_task_end"]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remembered so a reassignment can invalidate the previous employee's cached data
+        instance._loaded_employee_id = instance.__dict__.get("assigned_employee_id")
+        return instance
 
     def save(self, *args, **kwargs):
         if self.start_date and self.end_date:
             self.completion_time = self.end_date - self.start_date
+        # Never write back rollups read earlier; task writes maintain them
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.ROLLUP_FIELDS
+            ]
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -45,8 +93,12 @@ class Project(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Default list order and the cursor pagination key
+            models.Index(fields=["-created_at", "-id"], name="project_created_idx"),
+        ]
 
-class Task(models.Model):
+class Task(TrackedModel):
     STATUS_CHOICES = [
         ("pending", "Pending"),
         ("in_progress", "In Progress"),
@@ -63,25 +115,41 @@ class Task(models.Model):
     completion_days = models.PositiveIntegerField(default=1, help_text="Duration in business days (excluding weekends)")
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
     completion_time = models.DurationField(null=True, blank=True)
+    predecessors = models.ManyToManyField(
+        "self", symmetrical=False, related_name="successors", blank=True,
+        help_text="Tasks in the same project that must finish before this one starts"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         ordering = ["project", "order"]
+        # The unique (project, order) index also serves per-project ordering and order__gt cascades
         unique_together = ("project", "order")
+        indexes = [
+            # Timeline and workload windows only look at dated tasks
+            models.Index(
+                fields=["start_date", "end_date"], name="task_dated_window_idx",
+                condition=models.Q(start_date__isnull=False, end_date__isnull=False),
+            ),
+            # done_count rollups and completion stats
+            models.Index(fields=["project"], name="task_done_idx", condition=models.Q(status="done")),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if not instance.get_deferred_fields():
+            instance._rollup_state = instance.rollup_state()
+        return instance
+
+    def rollup_state(self):
+        """The values that feed the project's rollup columns"""
+        return (self.project_id, self.status, self.start_date, self.end_date)
 
     def add_business_days(self, start_date, days):
-        """Add business days to a date, excluding weekends"""
-        current = start_date
-        added_days = 0
-        
-        while added_days < days:
-            current += timedelta(days=1)
-            # Skip weekends (Monday=0, Sunday=6)
-            if current.weekday() < 5:  # Monday to Friday
-                added_days += 1
-        
-        return current
+        """Add business days to a date, excluding weekends and holidays"""
+        return add_business_days(start_date, days)
 
     def calculate_end_date(self):
         """Calculate end date based on start date and completion days"""
@@ -91,7 +159,8 @@ class Task(models.Model):
 
     def save(self, *args, **kwargs):
         # Auto-calculate end_date if start_date and completion_days are set
-        if self.start_date and self.completion_days and not kwargs.get('skip_auto_end_date'):
+        skip_auto_end_date = kwargs.pop('skip_auto_end_date', False)
+        if self.start_date and self.completion_days and not skip_auto_end_date:
             self.end_date = self.calculate_end_date()
         
         # Calculate completion_time
@@ -101,4 +170,68 @@ class Task(models.Model):
         super().save(*args, **kwargs)
 
     def __str__(self):
-        return f"{self.project.title} - {self.order}. {self.name}"
\ No newline at end of file
+        return f"{self.project.title} - {self.order}. {self.name}"
+
+class Tombstone(models.Model):
+    """Record of a deleted row, so delta-sync clients can drop it too"""
+    MODEL_CHOICES = [
+        ("employee", "Employee"),
+        ("project", "Project"),
+        ("task", "Task"),
+    ]
+
+    model = models.CharField(max_length=20, choices=MODEL_CHOICES)
+    object_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    def __str__(self):
+        return f"{self.model} #{self.object_id} deleted at {self.deleted_at}"
+
+    class Meta:
+        ordering = ["deleted_at"]
+
+class Job(models.Model):
+    """Background write queued for the run_jobs worker (see projects/jobs.py)"""
+    KIND_CHOICES = [
+        ("reschedule", "Reschedule project"),
+        ("cascade", "Cascade task delay"),
+        ("recompute_rollups", "Recompute project rollups"),
+    ]
+    STATUS_CHOICES = [
+        ("queued", "Queued"),
+        ("running", "Running"),
+        ("done", "Done"),
+        ("failed", "Failed"),
+        ("superseded", "Superseded"),
+    ]
+
+    kind = models.CharField(max_length=30, choices=KIND_CHOICES)
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="jobs")
+    # Queued jobs with the same kind, project and key are merged into one
+    coalesce_key = models.CharField(max_length=100, blank=True, default="")
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="queued")
+    coalesced = models.PositiveIntegerField(default=0, help_text="Enqueues merged into this job")
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    worker = models.CharField(max_length=100, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.kind} #{self.pk} ({self.status})"
+
+    class Meta:
+        ordering = ["-created_at", "-id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "project", "coalesce_key"], condition=models.Q(status="queued"),
+                name="job_queued_unique",
+            ),
+        ]
+        indexes = [
+            # The worker picks queued jobs oldest first
+            models.Index(fields=["id"], condition=models.Q(status="queued"), name="job_queued_idx"),
+        ]
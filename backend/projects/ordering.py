@@ -0,0 +1,123 @@
+"""Sparse task ordering.
+
+Task.order only has to sort a project's tasks, so values may leave gaps.
+Moving a task writes one row: it takes the midpoint between its new
+neighbours. Only when two neighbours are adjacent integers, or a move to
+the end would pass MAX_ORDER, is the project respread ORDER_GAP apart from
+zero. Reads keep using the unique (project_id, order) index.
+"""
+from django.db import connections
+from django.db.models import Count, Min
+from django.utils import timezone
+
+from . import cache
+from .models import Task
+
+ORDER_GAP = 1024
+# Largest value Task.order (a PositiveIntegerField) holds on every backend
+MAX_ORDER = 2 ** 31 - 1
+
+
+def _renumber(project_id, base, step):
+    """Set each task's order to base + rank * step (rank 1, 2, ... in current order) in one UPDATE"""
+    connection = connections[Task.objects.db]
+    quote = connection.ops.quote_name
+    table, pk, order = quote(Task._meta.db_table), quote("id"), quote("order")
+    sql = f"""
+        UPDATE {table} SET {order} = %s + ranked.position * %s, {quote("updated_at")} = %s
+        FROM (
+            SELECT {pk}, ROW_NUMBER() OVER (ORDER BY {order}) AS position
+            FROM {table} WHERE {quote("project_id")} = %s
+        ) AS ranked
+        WHERE {table}.{pk} = ranked.{pk}
+    """
+    now = connection.ops.adapt_datetimefield_value(timezone.now())
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [base, step, now, project_id])
+        return cursor.rowcount
+
+
+def rebalance_orders(project_id):
+    """Respread a project's task orders to ORDER_GAP, 2 * ORDER_GAP, ... keeping their sequence.
+
+    Each UPDATE ranks with ROW_NUMBER() in a FROM subquery (SQLite 3.33+
+    and PostgreSQL), so the ranks come from the rows as they were before
+    the statement. The unique (project, order) constraint is checked row by
+    row, so no statement may write a value another row still holds: when
+    the current orders reach into the target range they are first parked,
+    one apart, in a run of free values above it. Returns the number of tasks.
+    """
+    tasks = Task.objects.filter(project_id=project_id)
+    bounds = tasks.aggregate(low=Min("order"), count=Count("pk"))
+    count = bounds["count"]
+    if not count:
+        return 0
+    top = count * ORDER_GAP
+    if bounds["low"] <= top:
+        # Runs of ``count`` values above top; the tasks can occupy at most ``count`` of the first count + 1
+        above = tasks.filter(order__gt=top, order__lte=top + (count + 1) * count).values_list("order", flat=True)
+        taken = {(order - top - 1) // count for order in above}
+        run = next(run for run in range(count + 1) if run not in taken)
+        _renumber(project_id, top + run * count, 1)
+    updated = _renumber(project_id, 0, ORDER_GAP)
+    cache.bump("project", project_id)
+    return updated
+
+
+def _neighbours(task, after=None, before=None, position=None, to_start=False):
+    """Orders just below and above the target slot (None at either end)"""
+    others = Task.objects.filter(project_id=task.project_id).exclude(pk=task.pk).values_list("order", flat=True)
+    if position is not None:
+        window = list(others.order_by("order")[max(position - 1, 0):position + 1])
+        if position == 0:
+            return None, (window[0] if window else None)
+        if window:
+            return window[0], (window[1] if len(window) > 1 else None)
+        # Past the last task: same as moving to the end
+    elif before is not None:
+        return others.filter(order__lt=before.order).order_by("-order").first(), before.order
+    elif after is not None:
+        return after.order, others.filter(order__gt=after.order).order_by("order").first()
+    elif to_start:
+        return None, others.order_by("order").first()
+    return others.order_by("-order").first(), None
+
+
+def _slot(lower, upper):
+    """An order strictly between lower and upper, or None if they are adjacent"""
+    if upper is None:
+        return lower + ORDER_GAP if lower + ORDER_GAP <= MAX_ORDER else None
+    if lower is None:
+        candidate = upper - ORDER_GAP if upper > ORDER_GAP else upper // 2
+        return candidate if 0 < candidate < upper else None
+    return (lower + upper) // 2 if upper - lower > 1 else None
+
+
+def move_task(task, after=None, before=None, position=None, to_start=False):
+    """Move ``task`` next to another task of its project or to a 0-based position.
+
+    Give one of ``after``/``before`` (tasks), ``position`` or ``to_start``;
+    with none the task goes to the end. Call inside a transaction holding
+    the project's row lock. Updates task.order in place and returns whether
+    the project had to be rebalanced first.
+    """
+    rebalanced = False
+    while True:
+        lower, upper = _neighbours(task, after, before, position, to_start)
+        if (lower is None or lower < task.order) and (upper is None or task.order < upper):
+            return rebalanced  # already in place (or the only task)
+
+        order = _slot(lower, upper)
+        if order is not None:
+            Task.objects.filter(pk=task.pk).update(order=order, updated_at=timezone.now())
+            cache.bump("project", task.project_id)
+            task.order = order
+            return rebalanced
+
+        # Respreading ORDER_GAP apart from zero leaves room next to every task, so this runs at most once
+        rebalance_orders(task.project_id)
+        rebalanced = True
+        task.refresh_from_db(fields=["order", "updated_at"])
+        for neighbour in (after, before):
+            if neighbour is not None:
+                neighbour.refresh_from_db(fields=["order"])
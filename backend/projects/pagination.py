@@ -0,0 +1,135 @@
+from base64 import b64decode, b64encode
+from urllib import parse
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination, _reverse_ordering
+from rest_framework.utils.urls import replace_query_param
+
+
+def _after(ordering, values):
+    """Rows strictly after ``values`` in ``ordering``.
+
+    (a, b) > (x, y) is written a >= x AND (a > x OR b > y) so the database
+    can seek on the leading column of the matching index.
+    """
+    name = ordering[0].lstrip("-")
+    op = "lt" if ordering[0].startswith("-") else "gt"
+    if len(ordering) == 1:
+        return Q(**{f"{name}__{op}": values[0]})
+    return Q(**{f"{name}__{op}e": values[0]}) & (
+        Q(**{f"{name}__{op}": values[0]}) | _after(ordering[1:], values[1:])
+    )
+
+
+class OptInCursorPagination(CursorPagination):
+    """Keyset pagination that only kicks in when the client asks for ?page_size=N.
+
+    Without it list endpoints keep returning plain arrays, which is what the
+    frontend expects. The next/previous links carry page_size along.
+
+    Unlike DRF's CursorPagination, which keys on the first ordering column
+    and breaks ties with an offset, the cursor holds every ordering column.
+    Orderings must therefore be unique, and every page is one indexed range
+    query however many rows share the leading column.
+    """
+    page_size = None
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor.reverse if self.cursor else False
+        position = self.cursor.position if self.cursor else None
+
+        ordering = _reverse_ordering(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(_after(ordering, self.parse_position(queryset.model, position)))
+
+        results = list(queryset[:self.page_size + 1])
+        self.page = results[:self.page_size]
+        has_more = len(results) > self.page_size
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        # An empty page (e.g. its rows were deleted) keeps the cursor's own position both ways
+        self.next_position = self._get_position_from_instance(self.page[-1], self.ordering) if self.page else position
+        self.previous_position = self._get_position_from_instance(self.page[0], self.ordering) if self.page else position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def parse_position(self, model, position):
+        """Cursor strings converted to the ordering columns' Python types"""
+        if len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        try:
+            return [
+                model._meta.get_field(order.lstrip("-")).to_python(value)
+                for order, value in zip(self.ordering, position)
+            ]
+        except (FieldDoesNotExist, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=self.next_position))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=self.previous_position))
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            tokens = parse.parse_qs(b64decode(encoded.encode("ascii")).decode("ascii"), keep_blank_values=True)
+            reverse = bool(int(tokens.get("r", ["0"])[0]))
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        return Cursor(offset=0, reverse=reverse, position=tokens.get("p"))
+
+    def encode_cursor(self, cursor):
+        tokens = {"p": cursor.position}
+        if cursor.reverse:
+            tokens["r"] = "1"
+        encoded = b64encode(parse.urlencode(tokens, doseq=True).encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def _get_position_from_instance(self, instance, ordering):
+        names = [order.lstrip("-") for order in ordering]
+        if isinstance(instance, dict):
+            return [str(instance[name]) for name in names]
+        return [str(getattr(instance, name)) for name in names]
+
+
+class EmployeeCursorPagination(OptInCursorPagination):
+    ordering = ("created_at", "id")
+
+
+class ProjectCursorPagination(OptInCursorPagination):
+    ordering = ("-created_at", "-id")
+
+
+class TaskCursorPagination(OptInCursorPagination):
+    ordering = ("project_id", "order")
+
+
+class JobCursorPagination(OptInCursorPagination):
+    ordering = ("-created_at", "-id")
@@ -0,0 +1,73 @@
+import threading
+from contextlib import contextmanager
+
+from django.db.models import Count, IntegerField, Max, Min, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import Project, Task
+
+_deferred = threading.local()
+
+
+def _task_aggregate(aggregate, output_field=None, **filters):
+    rows = (
+        Task.objects.filter(project=OuterRef("pk"), **filters)
+        .order_by()
+        .values("project")
+        .annotate(value=aggregate)
+        .values("value")
+    )
+    return Subquery(rows, output_field=output_field)
+
+
+def rollup_expressions():
+    """Project rollup columns computed from the tasks table"""
+    return {
+        "task_count": Coalesce(_task_aggregate(Count("pk")), Value(0), output_field=IntegerField()),
+        # A WHERE (not an aggregate FILTER) so it can count straight from the partial task_done_idx
+        "done_count": Coalesce(_task_aggregate(Count("pk"), status="done"), Value(0), output_field=IntegerField()),
+        "min_task_start": _task_aggregate(Min("start_date")),
+        "max_task_end": _task_aggregate(Max("end_date")),
+    }
+
+
+def refresh_project_rollups(project_ids):
+    """Recompute the rollup columns of the given projects in one UPDATE.
+
+    It also moves their updated_at, which keys the cached project payloads.
+    """
+    project_ids = {pk for pk in project_ids if pk is not None}
+    if not project_ids:
+        return 0
+    return Project.objects.filter(pk__in=project_ids).update(
+        updated_at=timezone.now(), **rollup_expressions()
+    )
+
+
+@contextmanager
+def deferred_rollups(project_ids=()):
+    """Collect rollup refreshes inside the block and run them once on exit.
+
+    Use inside the same transaction as the task writes so the counters
+    commit or roll back with them.
+    """
+    stack = getattr(_deferred, "stack", None)
+    if stack is None:
+        stack = _deferred.stack = []
+    pending = set(project_ids)
+    stack.append(pending)
+    try:
+        yield pending
+    finally:
+        stack.pop()
+    schedule_rollup(*pending)
+
+
+def schedule_rollup(*project_ids):
+    """Refresh now, or at the end of the innermost deferred_rollups block"""
+    stack = getattr(_deferred, "stack", None)
+    if stack:
+        stack[-1].update(project_ids)
+    else:
+        refresh_project_rollups(project_ids)
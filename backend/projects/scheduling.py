@@ -0,0 +1,128 @@
+from datetime import timedelta
+
+from django.db.models import DateField, ExpressionWrapper, F
+from django.utils import timezone
+
+from .business_calendar import add_business_days
+from .critical_path import critical_path, downstream, project_edges, with_order_edges
+from .models import Task
+from .rollups import refresh_project_rollups, schedule_rollup
+
+SCHEDULE_FIELDS = ["start_date", "end_date", "completion_time", "updated_at"]
+
+
+def next_business_day(day):
+    """First business day on or after ``day``"""
+    return add_business_days(day - timedelta(days=1), 1)
+
+
+def schedule_tasks(start_date, tasks):
+    """Chain tasks back to back from start_date, in memory.
+
+    Mirrors Task.save: end_date follows from completion_days and each task
+    starts on the first business day after the previous one ends.
+    """
+    now = timezone.now()
+    current_date = start_date
+    for task in tasks:
+        task.start_date = next_business_day(current_date)
+        if task.completion_days:
+            task.end_date = task.calculate_end_date()
+        if task.end_date:
+            task.completion_time = task.end_date - task.start_date
+        task.updated_at = now
+
+        # Next task starts day after this one ends
+        if task.end_date:
+            current_date = task.end_date + timedelta(days=1)
+    return tasks
+
+
+def schedule_dependent_tasks(start_date, tasks, edges):
+    """Place tasks (in order) at their earliest dates from the dependency graph's forward pass.
+
+    Tasks without dependency links still follow the task before them.
+    """
+    edges = with_order_edges([task.pk for task in tasks], edges)
+    schedule, _, _ = critical_path(tasks, edges, start_date, keep_start_dates=False)
+    now = timezone.now()
+    for task in tasks:
+        task.start_date = schedule[task.pk]["earliest_start"]
+        if task.completion_days:
+            task.end_date = schedule[task.pk]["earliest_finish"]
+        if task.end_date:
+            task.completion_time = task.end_date - task.start_date
+        task.updated_at = now
+    return tasks
+
+
+def auto_schedule_projects(projects):
+    """Reschedule every task of the given projects with a single bulk_update.
+
+    Projects with explicit dependencies follow the dependency graph, with
+    unlinked tasks still chained by order; the rest chain every task by
+    order. Raises DependencyCycle on a cyclic graph.
+    """
+    projects = [project for project in projects if project.start_date]
+    start_dates = {project.pk: project.start_date for project in projects}
+
+    tasks_by_project = {}
+    for task in Task.objects.filter(project_id__in=start_dates).order_by("project_id", "order"):
+        tasks_by_project.setdefault(task.project_id, []).append(task)
+
+    edges_by_project = {}
+    by_id = {task.pk: task for tasks in tasks_by_project.values() for task in tasks}
+    for predecessor, successor in project_edges(list(tasks_by_project)):
+        edges_by_project.setdefault(by_id[successor].project_id, []).append((predecessor, successor))
+
+    scheduled = []
+    for project_id, tasks in tasks_by_project.items():
+        edges = edges_by_project.get(project_id)
+        if edges:
+            scheduled.extend(schedule_dependent_tasks(start_dates[project_id], tasks, edges))
+        else:
+            scheduled.extend(schedule_tasks(start_dates[project_id], tasks))
+
+    Task.objects.bulk_update(scheduled, SCHEDULE_FIELDS, batch_size=500)
+    refresh_project_rollups(tasks_by_project)
+    return scheduled
+
+
+def shift_following(task, delta):
+    """Move the tasks that follow ``task`` by ``delta`` (a timedelta).
+
+    With explicit dependencies only the task's transitive successors move,
+    where an unlinked task succeeds the task before it in order; otherwise
+    every later task in the project does. Runs as a single UPDATE and
+    returns the moved tasks (ids in order), with their in-memory dates
+    already shifted.
+    """
+    if delta == timedelta(0):
+        return []
+
+    edges = project_edges([task.project_id])
+    if edges:
+        task_ids = list(Task.objects.filter(project_id=task.project_id).order_by("order").values_list("pk", flat=True))
+        following = Task.objects.filter(pk__in=downstream(task.pk, with_order_edges(task_ids, edges)))
+    else:
+        following = Task.objects.filter(project_id=task.project_id, order__gt=task.order)
+    following_tasks = list(following.order_by("order").select_for_update())
+    if not following_tasks:
+        return []
+
+    # completion_time (end - start) is unchanged when both dates move by the same delta
+    now = timezone.now()
+    following.update(
+        start_date=ExpressionWrapper(F("start_date") + delta, output_field=DateField()),
+        end_date=ExpressionWrapper(F("end_date") + delta, output_field=DateField()),
+        updated_at=now,
+    )
+    schedule_rollup(task.project_id)
+
+    for following_task in following_tasks:
+        if following_task.start_date:
+            following_task.start_date = following_task.start_date + delta
+        if following_task.end_date:
+            following_task.end_date = following_task.end_date + delta
+        following_task.updated_at = now
+    return following_tasks
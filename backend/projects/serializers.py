@@ -1,20 +1,50 @@
+from django.db import transaction
 from rest_framework import serializers
-from .models import Employee, Project, Task
-from datetime import timedelta
+from .models import Employee, Job, Project, Task
+from .business_calendar import count_business_days
+from .task_writes import save_task_changes, snapshot_tasks
 
-class EmployeeSerializer(serializers.ModelSerializer):
+class SparseFieldsMixin:
+    """Trim a top-level read with ?fields=a,b or ?omit=c,d (or omit=[...] in code)"""
+
+    def __init__(self, *args, omit=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        for name in list(self.fields):
+            if name in omit or not self.field_is_requested(request, name):
+                self.fields.pop(name)
+
+    @staticmethod
+    def _field_list(request, param):
+        value = request.query_params.get(param)
+        if not value:
+            return None
+        return {name.strip() for name in value.split(",") if name.strip()}
+
+    @classmethod
+    def field_is_requested(cls, request, name):
+        """Whether a field survives the ?fields= / ?omit= filters of this request"""
+        if request is None or request.method not in ("GET", "HEAD"):
+            return True
+        fields = cls._field_list(request, "fields")
+        omit = cls._field_list(request, "omit") or set()
+        return (fields is None or name in fields) and name not in omit
+
+class EmployeeSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     project_count = serializers.SerializerMethodField()
     department_display = serializers.CharField(source='get_department_display', read_only=True)
     
     class Meta:
         model = Employee
-        fields = ["id", "name", "email", "department", "department_display", "created_at", "project_count"]
-        read_only_fields = ["created_at", "department_display"]
+        fields = ["id", "name", "email", "department", "department_display", "created_at", "updated_at", "project_count"]
+        read_only_fields = ["created_at", "updated_at", "department_display"]
     
     def get_project_count(self, obj):
+        if hasattr(obj, "num_projects"):
+            return obj.num_projects
         return obj.projects.count()
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     business_days = serializers.SerializerMethodField()
     
     class Meta:
@@ -31,13 +61,7 @@ class TaskSerializer(serializers.ModelSerializer):
         if not obj.start_date or not obj.end_date:
             return None
         
-        current = obj.start_date
-        days = 0
-        while current < obj.end_date:
-            current += timedelta(days=1)
-            if current.weekday() < 5:  # Monday to Friday
-                days += 1
-        return days
+        return count_business_days(obj.start_date, obj.end_date)
 
     def update(self, instance, validated_data):
         # Handle completion_days update
@@ -55,11 +79,35 @@ class TaskSerializer(serializers.ModelSerializer):
         
         return super().update(instance, validated_data)
 
-class ProjectSerializer(serializers.ModelSerializer):
-    tasks = TaskSerializer(many=True, required=False)
+class NestedTaskSerializer(TaskSerializer):
+    """Task inside a project payload; a writable id matches it to an existing row"""
+    id = serializers.IntegerField(required=False)
+    # No model default here: a missing order falls back to the task's position
+    order = serializers.IntegerField(required=False, min_value=0)
+
+# Task attributes a nested project payload may set
+NESTED_TASK_FIELDS = ["name", "description", "order", "start_date", "completion_days", "status"]
+NESTED_TASK_DEFAULTS = {"description": "", "start_date": None, "completion_days": 1, "status": "pending"}
+
+def apply_task_data(task, task_data):
+    """Set nested payload fields on a task and derive its dates like Task.save"""
+    for field in NESTED_TASK_FIELDS:
+        if field in task_data:
+            setattr(task, field, task_data[field])
+    if task.start_date and task.completion_days:
+        task.end_date = task.calculate_end_date()
+    if task.start_date and task.end_date:
+        task.completion_time = task.end_date - task.start_date
+    return task
+
+def build_task(project, order, task_data):
+    task = Task(project=project, **NESTED_TASK_DEFAULTS)
+    return apply_task_data(task, {**task_data, "order": task_data.get("order", order)})
+
+class ProjectSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    tasks = NestedTaskSerializer(many=True, required=False)
     assigned_employee_detail = EmployeeSerializer(source="assigned_employee", read_only=True)
-    task_count = serializers.SerializerMethodField()
-    completed_tasks = serializers.SerializerMethodField()
+    completed_tasks = serializers.IntegerField(source="done_count", read_only=True)
     completion_percentage = serializers.SerializerMethodField()
 
     class Meta:
@@ -68,62 +116,79 @@ class ProjectSerializer(serializers.ModelSerializer):
             "id", "title", "description", "start_date", "end_date", 
             "assigned_employee", "assigned_employee_detail", "completion_time", 
             "tasks", "task_count", "completed_tasks", "completion_percentage",
-            "created_at", "updated_at"
+            "min_task_start", "max_task_end", "created_at", "updated_at"
         ]
         read_only_fields = ["completion_time", "created_at", "updated_at"]
 
-    def get_task_count(self, obj):
-        return obj.tasks.count()
-    
-    def get_completed_tasks(self, obj):
-        return obj.tasks.filter(status='done').count()
-    
     def get_completion_percentage(self, obj):
-        total = obj.tasks.count()
-        if total == 0:
+        if obj.task_count == 0:
             return 0
-        completed = obj.tasks.filter(status='done').count()
-        return round((completed / total) * 100)
+        return round((obj.done_count / obj.task_count) * 100)
+
+    def validate_tasks(self, tasks_data):
+        orders = [task_data.get("order", i) for i, task_data in enumerate(tasks_data, start=1)]
+        if len(orders) != len(set(orders)):
+            raise serializers.ValidationError("Task orders must be unique within a project")
+        return tasks_data
 
     def create(self, validated_data):
         tasks_data = validated_data.pop("tasks", [])
-        project = Project.objects.create(**validated_data)
-        
-        for i, task_data in enumerate(tasks_data, start=1):
-            task = Task.objects.create(
-                project=project, 
-                order=task_data.get("order", i),
-                name=task_data["name"],
-                description=task_data.get("description", ""),
-                start_date=task_data.get("start_date"),
-                completion_days=task_data.get("completion_days", 1),
-                status=task_data.get("status", "pending")
-            )
-            # The save method will auto-calculate end_date
+        with transaction.atomic():
+            project = Project.objects.create(**validated_data)
+            save_task_changes([], {}, created=[
+                build_task(project, i, task_data)
+                for i, task_data in enumerate(tasks_data, start=1)
+            ])
         
+        project.refresh_from_db(fields=Project.ROLLUP_FIELDS + ["updated_at"])
         return project
 
     def update(self, instance, validated_data):
         tasks_data = validated_data.pop("tasks", None)
         
-        # Update project fields
-        for attr, val in validated_data.items():
-            setattr(instance, attr, val)
-        instance.save()
-        
-        # Handle tasks if provided
-        if tasks_data is not None:
-            # Clear existing tasks and recreate
-            instance.tasks.all().delete()
-            for i, task_data in enumerate(tasks_data, start=1):
-                Task.objects.create(
-                    project=instance,
-                    order=task_data.get("order", i),
-                    name=task_data["name"],
-                    description=task_data.get("description", ""),
-                    start_date=task_data.get("start_date"),
-                    completion_days=task_data.get("completion_days", 1),
-                    status=task_data.get("status", "pending")
-                )
+        with transaction.atomic():
+            # Update project fields
+            for attr, val in validated_data.items():
+                setattr(instance, attr, val)
+            instance.save()
+            
+            # Handle tasks if provided
+            if tasks_data is not None:
+                self.sync_tasks(instance, tasks_data)
+                instance.refresh_from_db(fields=Project.ROLLUP_FIELDS + ["updated_at"])
         
-        return instance
\ No newline at end of file
+        return instance
+
+    def sync_tasks(self, project, tasks_data):
+        """Diff the payload against the project's tasks: create, update and delete only what changed.
+
+        Incoming tasks match existing ones by id, or by order when no id is given.
+        Returns the project's tasks after the sync.
+        """
+        existing = list(Task.objects.filter(project=project))
+        by_id = {task.pk: task for task in existing}
+        by_order = {task.order: task for task in existing}
+        snapshots = snapshot_tasks(existing)
+
+        matched, created = {}, []
+        for i, task_data in enumerate(tasks_data, start=1):
+            task = by_id.get(task_data.get("id"))
+            if task is None and "id" not in task_data:
+                task = by_order.get(task_data.get("order", i))
+            if task is None or task.pk in matched:
+                created.append(build_task(project, i, task_data))
+                continue
+            matched[task.pk] = apply_task_data(task, {**task_data, "order": task_data.get("order", i)})
+
+        removed = [pk for pk in by_id if pk not in matched]
+        save_task_changes(list(matched.values()), snapshots, removed=removed, created=created)
+        return list(matched.values()) + created
+
+class JobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Job
+        fields = [
+            "id", "kind", "project", "status", "payload", "coalesced", "result", "error",
+            "created_at", "started_at", "finished_at"
+        ]
+        read_only_fields = fields
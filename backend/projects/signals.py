@@ -0,0 +1,31 @@
+"""Rollup and cache upkeep on saves; deletes are handled set-wise in projects/deletion.py"""
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from . import cache
+from .models import Project, Task
+from .rollups import schedule_rollup
+
+
+@receiver(post_save, sender=Task)
+def update_rollups_on_save(sender, instance, created, **kwargs):
+    previous = getattr(instance, "_rollup_state", None)
+    current = instance.rollup_state()
+    if created or previous != current:
+        schedule_rollup(instance.project_id)
+        if previous and previous[0] != instance.project_id:
+            schedule_rollup(previous[0])
+    else:
+        # No rollup refresh to move the project's updated_at, which keys its cached payload
+        cache.bump("project", instance.project_id)
+    instance._rollup_state = current
+
+
+# Employee payloads carry a project count, so the employees gaining or losing a project change too
+@receiver(post_save, sender=Project)
+def invalidate_employees_on_save(sender, instance, created, **kwargs):
+    previous = getattr(instance, "_loaded_employee_id", None)
+    if created or previous != instance.assigned_employee_id:
+        cache.bump("employee", previous, instance.assigned_employee_id)
+    instance._loaded_employee_id = instance.assigned_employee_id
+
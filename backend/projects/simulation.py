@@ -0,0 +1,147 @@
+from datetime import date
+
+from .bulk import BulkOperationError, TaskBatch
+from .business_calendar import add_business_days
+from .critical_path import project_edges
+from .models import Task
+from .scheduling import schedule_dependent_tasks, schedule_tasks
+
+MAX_SCENARIOS = 50
+
+SIM_FIELDS = (
+    "pk", "project_id", "name", "description", "order", "start_date", "end_date",
+    "completion_days", "status", "completion_time", "updated_at",
+)
+
+
+class SimTask:
+    """Slotted stand-in for a Task row; enough for the scheduling rules, no ORM"""
+    __slots__ = SIM_FIELDS
+
+    def __init__(self, **values):
+        for field in SIM_FIELDS:
+            setattr(self, field, values.get(field))
+
+    @property
+    def id(self):
+        return self.pk
+
+    def copy(self):
+        return SimTask(**{field: getattr(self, field) for field in SIM_FIELDS})
+
+    def calculate_end_date(self):
+        """Same rule as Task.calculate_end_date"""
+        if self.start_date and self.completion_days:
+            return add_business_days(self.start_date, self.completion_days)
+        return None
+
+
+class Scenario(TaskBatch):
+    """A TaskBatch over copies of preloaded tasks that never writes.
+
+    Adds an ``auto_schedule`` operation ({"op": "auto_schedule",
+    "start_date": optional}) on top of the bulk endpoint's operations.
+    """
+    OPERATIONS = TaskBatch.OPERATIONS + ("auto_schedule",)
+    TASKLESS_OPERATIONS = ("auto_schedule",)
+
+    def __init__(self, operations, project, tasks, edges):
+        # Reorders always target the simulated project, so "project" may be omitted
+        operations = [
+            {**operation, "project": project.pk}
+            if isinstance(operation, dict) and operation.get("op") == "reorder" else operation
+            for operation in operations
+        ]
+        super().__init__(operations)
+        self.project = project
+        self.by_project[project.pk] = [task.copy() for task in tasks]
+        self.by_id = {task.pk: task for task in self.by_project[project.pk]}
+        if edges:
+            self.edges[project.pk] = list(edges)
+
+    def load(self):
+        self.validate()
+
+    def auto_schedule(self, index, operation):
+        start_date = operation.get("start_date") or self.project.start_date
+        if not start_date:
+            raise BulkOperationError(index, "Project must have a start date to auto-schedule tasks")
+        if isinstance(start_date, str):
+            try:
+                start_date = date.fromisoformat(start_date)
+            except ValueError:
+                raise BulkOperationError(index, "start_date must be a YYYY-MM-DD date")
+        tasks = self.by_project[self.project.pk]
+        edges = self.edges.get(self.project.pk)
+        if edges:
+            schedule_dependent_tasks(start_date, tasks, edges)
+        else:
+            schedule_tasks(start_date, tasks)
+        self.touched.update(task.pk for task in tasks)
+
+
+def load_project_tasks(project):
+    """Read a project's tasks once into SimTasks (plain SELECT, no locks)"""
+    rows = Task.objects.filter(project=project).order_by("order").values(
+        "id", *[field for field in SIM_FIELDS if field not in ("pk", "id")]
+    )
+    return [SimTask(pk=row.pop("id"), **row) for row in rows]
+
+
+def _finish(tasks):
+    return max((task.end_date for task in tasks if task.end_date), default=None)
+
+
+def simulate(project, scenarios):
+    """Run each scenario against the same baseline; returns one result per scenario"""
+    baseline = load_project_tasks(project)
+    edges = project_edges([project.pk])
+    base_by_id = {task.pk: task for task in baseline}
+    base_finish = _finish(baseline)
+
+    results = []
+    for number, scenario in enumerate(scenarios, start=1):
+        name = scenario.get("name") or f"scenario {number}"
+        operations = scenario.get("operations")
+        if not isinstance(operations, list):
+            results.append({"name": name, "error": "operations must be a list", "index": None})
+            continue
+
+        run = Scenario(operations, project, baseline, edges)
+        try:
+            run.load()
+            run.apply()
+        except BulkOperationError as exc:
+            results.append({"name": name, "error": exc.message, "index": exc.index})
+            continue
+
+        tasks = run.by_project[project.pk]
+        finish = _finish(tasks)
+        changes = []
+        for task in tasks:
+            before = base_by_id[task.pk]
+            if (task.start_date, task.end_date, task.order, task.completion_days) == \
+                    (before.start_date, before.end_date, before.order, before.completion_days):
+                continue
+            changes.append({
+                "id": task.pk,
+                "name": task.name,
+                "order": task.order,
+                "start_date": task.start_date,
+                "end_date": task.end_date,
+                "completion_days": task.completion_days,
+                "start_shift_days": (task.start_date - before.start_date).days
+                if task.start_date and before.start_date else None,
+                "end_shift_days": (task.end_date - before.end_date).days
+                if task.end_date and before.end_date else None,
+            })
+
+        results.append({
+            "name": name,
+            "finish": finish,
+            "finish_shift_days": (finish - base_finish).days if finish and base_finish else None,
+            "changed": changes,
+            "deleted": run.deleted,
+        })
+
+    return {"project": project.pk, "baseline_finish": base_finish, "scenarios": results}
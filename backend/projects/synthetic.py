@@ -0,0 +1,94 @@
+import random
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from .critical_path import DependencyEdge
+from .models import Employee, Project, Task
+from .rollups import refresh_project_rollups
+from .scheduling import schedule_tasks
+
+FIRST_NAMES = ["Asha", "Ben", "Chen", "Dana", "Elif", "Farid", "Grace", "Hiro", "Ines", "Jonas", "Kavya", "Luis"]
+LAST_NAMES = ["Rao", "Miller", "Wang", "Cohen", "Yilmaz", "Haddad", "Okafor", "Sato", "Silva", "Berg", "Iyer", "Diaz"]
+PROJECT_WORDS = ["Billing", "Onboarding", "Search", "Mobile", "Reporting", "Checkout", "Analytics", "Migration"]
+TASK_WORDS = ["Spec", "Design", "Build", "Review", "Test", "Deploy", "Document", "Handover"]
+
+
+def generate_dataset(employees, projects, tasks_per_project, seed=0, dependency_ratio=0.0, batch_size=1000):
+    """Insert a synthetic dataset with bulk_create and return the row counts.
+
+    The same seed always produces the same rows (apart from timestamps).
+    Projects start within roughly six months of today and chain their tasks
+    back to back like auto_schedule; tasks that already ended are mostly
+    done, current ones in progress, the rest pending with a few blocked.
+    About one project in ten is unassigned. ``dependency_ratio`` is the share
+    of projects that also get explicit task dependencies (each task after
+    the first depends on one of the three before it).
+    """
+    rng = random.Random(seed)
+    today = timezone.localdate()
+    departments = [code for code, _ in Employee.DEPARTMENT_CHOICES]
+    email_offset = Employee.objects.count()
+
+    with transaction.atomic():
+        staff = Employee.objects.bulk_create([
+            Employee(
+                name=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                email=f"synthetic.{email_offset + i}@example.com",
+                department=rng.choice(departments),
+            )
+            for i in range(employees)
+        ], batch_size=batch_size)
+
+        project_rows = []
+        for i in range(projects):
+            start = today + timedelta(days=rng.randint(-180, 60))
+            project_rows.append(Project(
+                title=f"{rng.choice(PROJECT_WORDS)} {i + 1}",
+                description="Synthetic project",
+                start_date=start,
+                assigned_employee=rng.choice(staff) if staff and rng.random() >= 0.1 else None,
+            ))
+        project_rows = Project.objects.bulk_create(project_rows, batch_size=batch_size)
+
+        task_rows, edges = [], []
+        for project in project_rows:
+            tasks = [
+                Task(
+                    project=project,
+                    name=f"{rng.choice(TASK_WORDS)} {order}",
+                    order=order,
+                    completion_days=rng.randint(1, 10),
+                )
+                for order in range(1, tasks_per_project + 1)
+            ]
+            schedule_tasks(project.start_date, tasks)
+            for task in tasks:
+                if task.end_date < today:
+                    task.status = "done" if rng.random() < 0.85 else "blocked"
+                elif task.start_date <= today:
+                    task.status = "in_progress"
+                else:
+                    task.status = "blocked" if rng.random() < 0.05 else "pending"
+            if tasks:
+                project.end_date = tasks[-1].end_date
+                project.completion_time = project.end_date - project.start_date
+            if tasks and rng.random() < dependency_ratio:
+                edges.append(tasks)
+            task_rows.extend(tasks)
+        Project.objects.bulk_update(project_rows, ["end_date", "completion_time"], batch_size=batch_size)
+        Task.objects.bulk_create(task_rows, batch_size=batch_size)
+
+        links = [
+            DependencyEdge(from_task_id=task.pk, to_task_id=rng.choice(tasks[max(index - 3, 0):index]).pk)
+            for tasks in edges
+            for index, task in enumerate(tasks)
+            if index
+        ]
+        DependencyEdge.objects.bulk_create(links, batch_size=batch_size)
+
+        # bulk_create skips the signals that normally maintain the rollups
+        refresh_project_rollups([project.pk for project in project_rows])
+
+    return {"employees": len(staff), "projects": len(project_rows), "tasks": len(task_rows), "dependencies": len(links)}
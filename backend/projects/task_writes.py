@@ -0,0 +1,62 @@
+from django.utils import timezone
+
+from .models import Task
+from .rollups import deferred_rollups
+
+# Task columns the bulk write paths may change
+TASK_WRITE_FIELDS = [
+    "name", "description", "order", "start_date", "end_date",
+    "completion_days", "status", "completion_time",
+]
+
+
+def snapshot_tasks(tasks):
+    """Remember the writable state of loaded tasks, keyed by pk"""
+    return {task.pk: tuple(getattr(task, field) for field in TASK_WRITE_FIELDS) for task in tasks}
+
+
+def save_task_changes(tasks, snapshots, removed=(), created=()):
+    """Persist in-memory task edits with as few statements as possible.
+
+    ``tasks`` are the surviving loaded rows, compared against ``snapshots``;
+    only the ones that differ are written, in one bulk_update. ``removed`` pks
+    are deleted and ``created`` unsaved tasks are bulk-created. Rollups of the
+    affected projects are refreshed once at the end. Returns the changed tasks.
+    """
+    with deferred_rollups() as pending:
+        changed = _save_task_changes(tasks, snapshots, removed, created)
+        pending.update(task.project_id for task in [*changed, *created])
+    return changed
+
+
+def _save_task_changes(tasks, snapshots, removed, created):
+    order_index = TASK_WRITE_FIELDS.index("order")
+    changed = [task for task in tasks
+               if tuple(getattr(task, field) for field in TASK_WRITE_FIELDS) != snapshots[task.pk]]
+
+    if removed:
+        Task.objects.filter(pk__in=removed).delete()
+
+    # Park reordered rows above every old and new order first so (project, order) stays unique mid-update
+    moved = [task for task in changed if task.order != snapshots[task.pk][order_index]]
+    if moved:
+        final_orders = {task.pk: task.order for task in moved}
+        parking = max(
+            [state[order_index] for state in snapshots.values()]
+            + [task.order for task in tasks]
+            + [task.order for task in created]
+        ) + 1
+        for offset, task in enumerate(moved):
+            task.order = parking + offset
+        Task.objects.bulk_update(moved, ["order"])
+        for task in moved:
+            task.order = final_orders[task.pk]
+
+    if changed:
+        now = timezone.now()
+        for task in changed:
+            task.updated_at = now
+        Task.objects.bulk_update(changed, TASK_WRITE_FIELDS + ["updated_at"], batch_size=500)
+    if created:
+        Task.objects.bulk_create(created, batch_size=500)
+    return changed
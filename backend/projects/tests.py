@@ -0,0 +1,1102 @@
+import csv
+import json
+import tempfile
+from datetime import date, timedelta
+from io import StringIO
+from pathlib import Path
+from unittest import skipUnless
+
+from asgiref.sync import async_to_sync
+
+from django.conf import settings
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import AsyncRequestFactory, RequestFactory, SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.test import APITestCase
+
+from . import async_views, jobs
+from .benchmark import compare, percentile, run_size
+from .business_calendar import BusinessCalendar, add_business_days
+from .cache import get_cache, project_key_queryset
+from .critical_path import DependencyEdge, downstream
+from .models import Employee, Job, Project, Task, Tombstone
+from .ordering import MAX_ORDER, ORDER_GAP, rebalance_orders
+from .rollups import refresh_project_rollups, rollup_expressions
+from .scheduling import auto_schedule_projects
+from .synthetic import generate_dataset
+from .views import ImportView, TaskViewSet
+
+
+def make_employees(count):
+    return Employee.objects.bulk_create(
+        Employee(name=f"Employee {index}", email=f"employee{index}@example.com") for index in range(count)
+    )
+
+
+def make_projects(count, employees=(), tasks_per_project=3):
+    """Projects round-robin assigned to ``employees`` (every seventh one unassigned), each with a few tasks"""
+    projects = Project.objects.bulk_create(
+        Project(
+            title=f"Project {index}",
+            assigned_employee=employees[index % len(employees)] if employees and index % 7 else None,
+        )
+        for index in range(count)
+    )
+    Task.objects.bulk_create(
+        Task(project=project, name=f"Task {order}", order=order, status="done" if order % 2 else "pending")
+        for project in projects
+        for order in range(1, tasks_per_project + 1)
+    )
+    # bulk_create skips the signals that maintain the rollups
+    refresh_project_rollups([project.pk for project in projects])
+    return projects
+
+
+class ProjectListQueryTests(APITestCase):
+    # ETag (3 aggregates), cache keys, then projects, tasks and employees
+    LIST_QUERIES = 7
+
+    @classmethod
+    def setUpTestData(cls):
+        make_projects(500, make_employees(20))
+
+    def setUp(self):
+        get_cache().clear()
+
+    def test_list_runs_constant_queries(self):
+        for fast_reads in (True, False):
+            with self.subTest(fast_reads=fast_reads), override_settings(FAST_READS=fast_reads):
+                get_cache().clear()
+                with self.assertNumQueries(self.LIST_QUERIES):
+                    response = self.client.get("/api/projects/")
+                self.assertEqual(len(response.json()), 500)
+
+    def test_rollups_match_the_tasks(self):
+        for fast_reads in (True, False):
+            with self.subTest(fast_reads=fast_reads), override_settings(FAST_READS=fast_reads):
+                get_cache().clear()
+                project = self.client.get("/api/projects/").json()[0]
+                self.assertEqual(
+                    (project["task_count"], project["completed_tasks"], project["completion_percentage"]),
+                    (3, 2, 67),
+                )
+
+    def test_detail_runs_constant_queries(self):
+        project = Project.objects.first()
+        with self.assertNumQueries(self.LIST_QUERIES):
+            self.client.get(f"/api/projects/{project.pk}/")
+
+    def test_detail_of_missing_or_malformed_id_is_404(self):
+        missing = Project.objects.order_by("-pk").first().pk + 1
+        for pk in ("abc", missing):
+            with self.subTest(pk=pk):
+                self.assertEqual(self.client.get(f"/api/projects/{pk}/").status_code, 404)
+
+
+class KeysetPaginationTests(APITestCase):
+    def walk(self, url):
+        """Rows of every page following next links, then of every page following previous links back"""
+        forward, pages = [], 0
+        while url:
+            page = self.client.get(url).json()
+            forward.extend(page["results"])
+            url, previous, pages = page["next"], page["previous"], pages + 1
+            self.assertLessEqual(pages, 100, "next links never ended")
+        backward = page["results"]
+        while previous:
+            page = self.client.get(previous).json()
+            backward = page["results"] + backward
+            previous = page["previous"]
+        return forward, backward
+
+    def test_task_pages_cover_every_task_once(self):
+        project = Project.objects.create(title="Big")
+        Task.objects.bulk_create(Task(project=project, name=f"Task {order}", order=order) for order in range(1, 2501))
+        make_projects(3)
+
+        forward, backward = self.walk("/api/tasks/?page_size=500")
+        expected = list(Task.objects.order_by("project_id", "order").values_list("id", flat=True))
+        self.assertEqual([task["id"] for task in forward], expected)
+        self.assertEqual([task["id"] for task in backward], expected)
+
+    def test_ties_on_created_at_break_on_id(self):
+        make_projects(25)
+        Project.objects.update(created_at=Project.objects.first().created_at)
+
+        forward, backward = self.walk("/api/projects/?page_size=4&fields=id")
+        expected = list(Project.objects.order_by("-id").values_list("id", flat=True))
+        self.assertEqual([project["id"] for project in forward], expected)
+        self.assertEqual([project["id"] for project in backward], expected)
+
+    def test_page_is_one_indexed_range_query(self):
+        project = Project.objects.create(title="Big")
+        Task.objects.bulk_create(Task(project=project, name=f"Task {order}", order=order) for order in range(1, 21))
+        cursor = self.client.get("/api/tasks/?page_size=5").json()["next"]
+        with self.assertNumQueries(1):
+            page = self.client.get(cursor).json()
+        self.assertEqual([task["order"] for task in page["results"]], [6, 7, 8, 9, 10])
+
+    def test_invalid_cursor_is_404(self):
+        for cursor in ("not-base64!", "cD0x"):  # the second decodes to p=1: too few columns
+            with self.subTest(cursor=cursor):
+                self.assertEqual(self.client.get(f"/api/tasks/?page_size=5&cursor={cursor}").status_code, 404)
+
+
+class EmployeeQueryTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.employees = make_employees(1000)
+        make_projects(300, cls.employees[:50])
+
+    def test_list_is_one_query(self):
+        with self.assertNumQueries(1):
+            employees = self.client.get("/api/employees/").json()
+        self.assertEqual(len(employees), 1000)
+        counts = {employee["id"]: employee["project_count"] for employee in employees}
+        self.assertEqual(counts[self.employees[1].pk], self.employees[1].projects.count())
+        self.assertEqual(counts[self.employees[999].pk], 0)
+
+    def test_list_page_is_one_query(self):
+        with self.assertNumQueries(1):
+            page = self.client.get("/api/employees/?page_size=100").json()
+        self.assertEqual(len(page["results"]), 100)
+
+    def test_employee_projects_run_constant_queries(self):
+        # Employee, then projects, their tasks and the annotated employee
+        busy = self.employees[1]
+        make_projects(40, [busy])
+        for employee in (self.employees[2], busy):
+            with self.subTest(projects=employee.projects.count()), self.assertNumQueries(4):
+                projects = self.client.get(f"/api/employees/{employee.pk}/projects/").json()
+            self.assertEqual(len(projects), employee.projects.count())
+            self.assertEqual(projects[0]["assigned_employee_detail"]["project_count"], len(projects))
+
+
+@skipUnless(connection.vendor == "sqlite", "plans are checked against SQLite's EXPLAIN QUERY PLAN")
+class IndexUsageTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        make_projects(50, make_employees(5), tasks_per_project=10)
+        Task.objects.update(start_date=date(2025, 1, 6), end_date=date(2025, 1, 10))
+
+    def assertUsesIndex(self, queryset, index):
+        self.assertIn(f"USING INDEX {index}", queryset.explain())
+
+    def test_project_list_uses_created_index(self):
+        projects = project_key_queryset(Project.objects.order_by("-created_at", "-id"))[:51]
+        self.assertUsesIndex(projects, "project_created_idx")
+
+    def test_timeline_uses_dated_window_index(self):
+        window = Task.objects.filter(
+            start_date__isnull=False, end_date__isnull=False,
+            end_date__gte=date(2025, 1, 1), start_date__lte=date(2025, 3, 1),
+        )
+        self.assertUsesIndex(window.order_by("project_id", "order"), "task_dated_window_idx")
+
+    def test_cascade_uses_project_order_index(self):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, Task._meta.db_table)
+        unique_index = next(
+            name for name, constraint in constraints.items()
+            if constraint["unique"] and constraint["columns"] == ["project_id", "order"]
+        )
+        project = Project.objects.first()
+        self.assertUsesIndex(Task.objects.filter(project=project, order__gt=3).order_by("order"), unique_index)
+
+    def test_done_count_uses_done_index(self):
+        # The same subqueries refresh_project_rollups writes back
+        expected = {f"expected_{name}": expression for name, expression in rollup_expressions().items()}
+        projects = Project.objects.filter(pk__in=Project.objects.values("pk")[:5]).annotate(**expected)
+        self.assertUsesIndex(projects, "task_done_idx")
+
+
+class PayloadCacheTests(APITestCase):
+    """Writes made outside the request (run_jobs, scripts, other workers) must reach cached payloads"""
+
+    def setUp(self):
+        get_cache().clear()
+        self.employee, self.other = make_employees(2)
+        self.project = Project.objects.create(title="Cached", start_date=date(2025, 1, 6), assigned_employee=self.employee)
+        for order in range(1, 4):
+            Task.objects.create(project=self.project, name=f"Task {order}", order=order, start_date=date(2024, 1, 1))
+
+    def cached_detail(self):
+        return self.client.get(f"/api/projects/{self.project.pk}/").json()
+
+    def test_background_reschedule_reaches_cached_detail(self):
+        self.assertEqual(self.cached_detail()["tasks"][0]["start_date"], "2024-01-01")
+        self.client.post(f"/api/projects/{self.project.pk}/auto_schedule/?background=1")
+        jobs.run_pending()
+        self.assertEqual(self.cached_detail()["tasks"][0]["start_date"], "2025-01-06")
+
+    def test_direct_saves_reach_cached_list_and_detail(self):
+        self.client.get("/api/projects/")
+        self.cached_detail()
+        self.project.assigned_employee = self.other
+        self.project.save()
+        task = self.project.tasks.get(order=2)
+        task.name = "Renamed"
+        task.save()
+
+        for payload in (self.client.get("/api/projects/").json()[0], self.cached_detail()):
+            self.assertEqual(payload["assigned_employee"], self.other.pk)
+            self.assertEqual(payload["tasks"][1]["name"], "Renamed")
+
+
+class DeletionTests(APITestCase):
+    def delete_queries(self, tasks):
+        project = make_projects(1, tasks_per_project=tasks)[0]
+        with CaptureQueriesContext(connection) as context:
+            self.client.delete(f"/api/projects/{project.pk}/")
+        self.assertEqual(Tombstone.objects.filter(model="task").count(), tasks)
+        Tombstone.objects.all().delete()
+        return len(context.captured_queries)
+
+    def test_project_delete_runs_constant_queries(self):
+        # Django deletes the tasks 100 ids per statement, so stay within one batch
+        self.assertEqual(self.delete_queries(5), self.delete_queries(100))
+
+    def test_task_deletes_leave_tombstones_and_refresh_rollups(self):
+        project = make_projects(1, tasks_per_project=6)[0]
+        removed = list(project.tasks.order_by("order").values_list("pk", flat=True)[:2])
+        self.client.post("/api/tasks/bulk/", [{"op": "delete", "id": pk} for pk in removed], format="json")
+        self.client.delete(f"/api/tasks/{project.tasks.order_by('order').first().pk}/")
+
+        project.refresh_from_db()
+        self.assertEqual(project.task_count, 3)
+        self.assertEqual(Tombstone.objects.filter(model="task").count(), 3)
+
+    def test_employee_delete_resyncs_its_projects(self):
+        employee = make_employees(1)[0]
+        employee_pk = employee.pk
+        project = Project.objects.create(title="Owned", assigned_employee=employee)
+        since = timezone.now()
+        employee.delete()
+
+        changes = self.client.get("/api/sync/", {"since": since.isoformat()}).json()
+        self.assertEqual(changes["deleted"]["employees"], [employee_pk])
+        self.assertEqual([(row["id"], row["assigned_employee"]) for row in changes["projects"]], [(project.pk, None)])
+
+
+class SyncTests(APITestCase):
+    def test_timestamp_overlaps_the_read(self):
+        before = timezone.now()
+        timestamp = self.client.get("/api/sync/").json()["timestamp"]
+        lag = before - parse_datetime(timestamp)
+        self.assertGreaterEqual(lag, timedelta(seconds=settings.SYNC_OVERLAP_SECONDS - 1))
+
+    def test_project_count_change_reaches_synced_employees(self):
+        employee, other = make_employees(2)
+        project = Project.objects.create(title="Moving", assigned_employee=employee)
+        since = timezone.now()
+        project.assigned_employee = other
+        project.save()
+
+        changes = self.client.get("/api/sync/", {"since": since.isoformat()}).json()
+        counts = {row["id"]: row["project_count"] for row in changes["employees"]}
+        self.assertEqual(counts, {employee.pk: 0, other.pk: 1})
+
+    def test_since_older_than_retention_is_gone(self):
+        since = timezone.now() - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS + 1)
+        self.assertEqual(self.client.get("/api/sync/", {"since": since.isoformat()}).status_code, 410)
+
+
+class AsyncReadTests(APITestCase):
+    """The async views answer byte for byte like the sync ones"""
+
+    @classmethod
+    def setUpTestData(cls):
+        projects = make_projects(12, make_employees(3), tasks_per_project=4)
+        Task.objects.filter(project__in=projects[:6]).update(start_date=date(2025, 1, 6), end_date=date(2025, 1, 10))
+
+    def assertSameAsSync(self, path, read, **kwargs):
+        get_cache().clear()
+        expected = self.client.get(path, HTTP_ACCEPT="application/json")
+        get_cache().clear()
+        response = async_to_sync(read)(AsyncRequestFactory().get(path), **kwargs)
+        self.assertEqual(response.content, expected.content)
+        self.assertEqual(response.get("ETag"), expected.get("ETag"))
+
+    def test_reads_match_the_sync_views(self):
+        project = Project.objects.first()
+        cases = [
+            ("/api/projects/", async_views.project_list, {}),
+            ("/api/projects/?fields=id,title,tasks", async_views.project_list, {}),
+            (f"/api/projects/{project.pk}/", async_views.project_detail, {"pk": project.pk}),
+            (f"/api/projects/{project.pk}/tasks/", async_views.project_tasks, {"pk": project.pk}),
+            ("/api/projects/stats/", async_views.project_stats, {}),
+            ("/api/tasks/project_timeline/?start=2025-01-01&end=2025-02-01", async_views.project_timeline, {}),
+        ]
+        for path, read, kwargs in cases:
+            with self.subTest(path=path):
+                self.assertSameAsSync(path, read, **kwargs)
+
+    def test_missing_project_falls_back_to_the_sync_view(self):
+        self.assertIsNone(async_to_sync(async_views.project_detail)(AsyncRequestFactory().get("/"), pk=0))
+
+    def test_streams_are_async_iterators_under_asgi(self):
+        path = "/api/tasks/project_timeline/?stream=ndjson"
+        response = TaskViewSet.as_view({"get": "project_timeline"})(AsyncRequestFactory().get(path))
+        self.assertTrue(response.is_async)
+
+        async def body():
+            return b"".join([chunk async for chunk in response])
+
+        streamed = async_to_sync(body)()
+        self.assertEqual(streamed, b"".join(self.client.get(path).streaming_content))
+        self.assertEqual(len(streamed.splitlines()), 24)
+
+
+class JobQueueTests(APITestCase):
+    def setUp(self):
+        self.project = Project.objects.create(title="Queued", start_date=date(2025, 1, 6))
+        self.tasks = [
+            Task.objects.create(project=self.project, name=f"Task {order}", order=order, completion_days=1)
+            for order in range(1, 4)
+        ]
+
+    def test_enqueues_of_the_same_job_merge(self):
+        first = jobs.enqueue("cascade", self.project.pk, task_id=self.tasks[0].pk, days=2)
+        second = jobs.enqueue("cascade", self.project.pk, task_id=self.tasks[0].pk, days=3)
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual((second.payload["days"], second.coalesced), (5, 1))
+        # Another task is another job
+        self.assertNotEqual(jobs.enqueue("cascade", self.project.pk, task_id=self.tasks[1].pk, days=1).pk, first.pk)
+
+    def test_reschedule_supersedes_queued_cascades(self):
+        cascade = jobs.enqueue("cascade", self.project.pk, task_id=self.tasks[0].pk, days=2)
+        reschedule = jobs.enqueue("reschedule", self.project.pk)
+        cascade.refresh_from_db()
+        self.assertEqual(cascade.status, "superseded")
+
+        self.assertEqual(jobs.run_pending(), 1)
+        reschedule.refresh_from_db()
+        self.assertEqual((reschedule.status, reschedule.result), ("done", {"tasks": 3}))
+
+    def test_failed_batch_is_retried_job_by_job(self):
+        undated = Project.objects.create(title="No start")
+        good = jobs.enqueue("reschedule", self.project.pk)
+        bad = jobs.enqueue("reschedule", undated.pk)
+
+        call_command("run_jobs", "--once", stdout=StringIO())
+        good.refresh_from_db()
+        bad.refresh_from_db()
+        self.assertEqual(good.status, "done")
+        self.assertEqual((bad.status, bad.error), ("failed", "Project must have a start date to auto-schedule tasks"))
+        self.assertEqual(self.project.tasks.filter(start_date=date(2025, 1, 6)).count(), 1)
+
+    def test_list_filters_are_validated(self):
+        job = jobs.enqueue("recompute_rollups", self.project.pk)
+        for params in ({"project": "abc"}, {"status": "paused"}, {"kind": "rebuild"}):
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get("/api/jobs/", params).status_code, 400)
+        listed = self.client.get("/api/jobs/", {"project": self.project.pk, "status": "queued"}).json()
+        self.assertEqual([row["id"] for row in listed], [job.pk])
+
+
+class DependencyTests(APITestCase):
+    def setUp(self):
+        self.project = Project.objects.create(title="Graph", start_date=date(2025, 1, 6))
+        self.tasks = [
+            Task.objects.create(project=self.project, name=f"Task {order}", order=order, completion_days=2)
+            for order in range(1, 5)
+        ]
+
+    def link(self, task, *predecessors):
+        return self.client.post(
+            f"/api/tasks/{task.pk}/dependencies/", {"predecessors": [p.pk for p in predecessors]}, format="json"
+        )
+
+    def schedule(self):
+        self.client.post(f"/api/projects/{self.project.pk}/auto_schedule/")
+        return {task.order: (task.start_date, task.end_date) for task in self.project.tasks.all()}
+
+    def test_predecessors_must_be_a_list_without_cycles(self):
+        first, second, third, _ = self.tasks
+        self.assertEqual(self.link(third, first).status_code, 200)
+        self.assertEqual(self.link(second, third).status_code, 200)
+        self.assertEqual(self.link(first, second).json()["error"], "Task dependencies contain a cycle")
+        other = make_projects(1)[0].tasks.first()
+        for predecessors in ("12", 12, [True], [other.pk], [first.pk + 1000]):
+            with self.subTest(predecessors=predecessors):
+                response = self.client.post(
+                    f"/api/tasks/{first.pk}/dependencies/", {"predecessors": predecessors}, format="json"
+                )
+                self.assertEqual(response.status_code, 400)
+        self.assertFalse(first.predecessors.exists())
+
+    def test_unlinked_tasks_keep_their_order_chain(self):
+        chained = self.schedule()
+        self.link(self.tasks[2], self.tasks[0])
+        linked = self.schedule()
+
+        self.assertEqual(linked[1], chained[1])
+        self.assertEqual(linked[2], chained[2])  # unlinked: still follows task 1
+        self.assertEqual(linked[3], chained[2])  # only depends on task 1, so runs alongside task 2
+        self.assertGreater(linked[4][0], linked[3][1])  # unlinked: follows task 3
+
+    def test_cascade_follows_links_and_order_chain(self):
+        first, second, third, fourth = self.tasks
+        self.schedule()
+        self.link(third, first)
+
+        moved = self.client.post(f"/api/tasks/{first.pk}/shift/", {"days": 1}, format="json").json()
+        self.assertEqual([task["id"] for task in moved["cascaded_tasks"]], [second.pk, third.pk, fourth.pk])
+        moved = self.client.post(f"/api/tasks/{second.pk}/shift/", {"days": 1}, format="json").json()
+        self.assertEqual(moved["cascaded_tasks"], [])
+
+    def test_critical_path(self):
+        first, second, third, fourth = self.tasks
+        self.link(third, first)
+        result = self.client.get(f"/api/projects/{self.project.pk}/critical_path/").json()
+
+        self.assertEqual(result["critical_path"], [first.pk, third.pk, fourth.pk])
+        self.assertEqual(result["dependencies"], [[first.pk, third.pk]])
+        # Task 2 may slip until task 4 ends: task 4's start day plus its 2 days
+        slack = {task["id"]: task["slack"] for task in result["tasks"]}
+        self.assertEqual(slack, {first.pk: 0, second.pk: 3, third.pk: 0, fourth.pk: 0})
+
+    def test_downstream(self):
+        edges = [(1, 2), (2, 3), (4, 3), (3, 5)]
+        self.assertEqual(downstream(1, edges), {2, 3, 5})
+        self.assertEqual(downstream(4, edges), {3, 5})
+        self.assertEqual(downstream(5, edges), set())
+
+
+class NestedTaskUpdateTests(APITestCase):
+    def setUp(self):
+        self.project = make_projects(1, tasks_per_project=3)[0]
+        self.first, self.second, self.third = self.project.tasks.order_by("order")
+
+    def patch_tasks(self, tasks):
+        return self.client.patch(f"/api/projects/{self.project.pk}/", {"tasks": tasks}, format="json")
+
+    def current(self):
+        return list(self.project.tasks.order_by("order").values_list("pk", "order", "name"))
+
+    def test_swapping_two_orders_keeps_the_rows(self):
+        # The swap goes through the parking step, or the (project, order) constraint would fail mid-update
+        response = self.patch_tasks([
+            {"id": self.first.pk, "order": 2},
+            {"id": self.second.pk, "order": 1},
+            {"id": self.third.pk, "order": 3},
+        ])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.current(), [
+            (self.second.pk, 1, "Task 2"), (self.first.pk, 2, "Task 1"), (self.third.pk, 3, "Task 3"),
+        ])
+
+    def test_delete_and_create_in_one_payload(self):
+        # Without an id a task matches by order, so the new one takes an order nobody has
+        response = self.patch_tasks([{"id": self.first.pk, "name": "Kept"}, {"name": "New", "order": 5}])
+        self.assertEqual(response.status_code, 200)
+        (kept_pk, *kept), (new_pk, *new) = self.current()
+        self.assertEqual((kept_pk, kept), (self.first.pk, [1, "Kept"]))
+        self.assertNotIn(new_pk, (self.second.pk, self.third.pk))
+        self.assertEqual(new, [5, "New"])
+        self.assertEqual(response.json()["task_count"], 2)
+        self.assertEqual(
+            set(Tombstone.objects.filter(model="task").values_list("object_id", flat=True)),
+            {self.second.pk, self.third.pk},
+        )
+
+    def test_tasks_without_id_match_by_order(self):
+        self.patch_tasks([{"name": "Renamed", "order": 2}])
+        self.assertEqual(self.current(), [(self.second.pk, 2, "Renamed")])
+
+    def test_duplicate_orders_are_rejected(self):
+        before = self.current()
+        response = self.patch_tasks([{"id": self.first.pk, "order": 1}, {"id": self.second.pk, "order": 1}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.current(), before)
+
+
+class BusinessCalendarTests(SimpleTestCase):
+    CALENDARS = {
+        "plain": BusinessCalendar(),
+        # 2025-01-04 is a Saturday; 24-26 December are back to back
+        "holidays": BusinessCalendar(
+            holidays=["2025-01-01", "2025-01-04", "2025-01-06", "2025-12-24", "2025-12-25", "2025-12-26"],
+        ),
+        "friday-saturday weekend": BusinessCalendar(holidays=["2025-01-05", "2025-01-09"], weekend=[4, 5]),
+        "six-day week": BusinessCalendar(holidays=["2025-12-25"], weekend=[6]),
+    }
+    STARTS = [date(2024, 12, 20) + timedelta(days=offset) for offset in range(24)] + [
+        date(2025, 12, 15) + timedelta(days=offset) for offset in range(21)
+    ]
+
+    @staticmethod
+    def step(calendar, start, days):
+        """Day-by-day reference for add_business_days"""
+        direction = 1 if days > 0 else -1
+        current, left = start, abs(days)
+        while left:
+            current += timedelta(days=direction)
+            left -= calendar.is_business_day(current)
+        return current
+
+    def test_examples(self):
+        calendar = self.CALENDARS["holidays"]
+        for start, days, expected in [
+            (date(2025, 1, 3), 1, date(2025, 1, 7)),     # Friday: weekend and the Monday holiday skipped
+            (date(2025, 1, 7), -1, date(2025, 1, 3)),
+            (date(2025, 12, 23), 1, date(2025, 12, 29)),  # three holidays in a row, then the weekend
+            (date(2025, 12, 29), -2, date(2025, 12, 22)),
+            (date(2025, 1, 3), 0, date(2025, 1, 3)),
+        ]:
+            with self.subTest(start=start, days=days):
+                self.assertEqual(calendar.add_business_days(start, days), expected)
+        self.assertFalse(calendar.is_business_day(date(2025, 1, 6)))
+        self.assertEqual(calendar.count_business_days(date(2025, 12, 23), date(2025, 12, 29)), 1)
+
+    def test_matches_day_by_day_reference(self):
+        for name, calendar in self.CALENDARS.items():
+            for start in self.STARTS:
+                for days in range(-15, 16):
+                    with self.subTest(calendar=name, start=start, days=days):
+                        self.assertEqual(calendar.add_business_days(start, days), self.step(calendar, start, days))
+                expected = 0
+                for span in range(1, 30):
+                    end = start + timedelta(days=span)
+                    expected += calendar.is_business_day(end)
+                    with self.subTest(calendar=name, start=start, end=end):
+                        self.assertEqual(calendar.count_business_days(start, end), expected)
+
+    @override_settings(BUSINESS_WEEKEND=[4, 5], BUSINESS_HOLIDAYS=["2025-01-05"])
+    def test_settings_calendar(self):
+        # Thursday + 1 skips Friday, Saturday and the Sunday holiday
+        self.assertEqual(add_business_days(date(2025, 1, 2), 1), date(2025, 1, 6))
+
+
+class TaskOrderingTests(APITestCase):
+    def make_tasks(self, *orders):
+        self.project = Project.objects.create(title="Ordered")
+        return [
+            Task.objects.create(project=self.project, name=f"Task {index}", order=order)
+            for index, order in enumerate(orders)
+        ]
+
+    def move(self, task, **target):
+        return self.client.post(f"/api/tasks/{task.pk}/move/", target, format="json").json()
+
+    def orders(self):
+        return list(self.project.tasks.order_by("order").values_list("pk", "order"))
+
+    def test_targets_write_only_the_moved_task(self):
+        a, b, c, d = self.make_tasks(1024, 2048, 3072, 4096)
+        for task, target, sequence in [
+            (d, {"after": a.pk}, [a, d, b, c]),
+            (a, {"before": c.pk}, [d, b, a, c]),
+            (c, {"position": 0}, [c, d, b, a]),
+            (b, {"after": None}, [b, c, d, a]),
+            (b, {"before": None}, [c, d, a, b]),
+            (d, {"position": 9}, [c, a, b, d]),
+        ]:
+            with self.subTest(task=task.name, target=target):
+                before = dict(self.orders())
+                self.assertFalse(self.move(task, **target)["rebalanced"])
+                after = self.orders()
+                self.assertEqual([pk for pk, _ in after], [t.pk for t in sequence])
+                self.assertEqual({pk for pk, order in after if before[pk] != order}, {task.pk})
+
+    def test_adjacent_neighbours_rebalance_from_zero(self):
+        a, b, c = self.make_tasks(1, 2, 3)
+        self.assertTrue(self.move(c, after=a.pk)["rebalanced"])
+        self.assertEqual(self.orders(), [(a.pk, 1024), (c.pk, 1536), (b.pk, 2048)])
+
+    def test_rebalancing_does_not_grow_orders(self):
+        # The middle layouts reach into the target range and into the first parking runs above it
+        for orders in ([5, 6, 10 ** 9], [1, 3073, 3076], [1024, 2048, 3072]):
+            with self.subTest(orders=orders):
+                tasks = self.make_tasks(*orders)
+                for _ in range(3):
+                    self.assertEqual(rebalance_orders(self.project.pk), 3)
+                    self.assertEqual(self.orders(), [(task.pk, (i + 1) * ORDER_GAP) for i, task in enumerate(tasks)])
+
+    def test_move_past_max_order_rebalances(self):
+        a, b, c = self.make_tasks(1024, MAX_ORDER - 10, 2048)
+        self.assertTrue(self.move(c, before=None)["rebalanced"])
+        self.assertEqual(self.orders(), [(a.pk, 1024), (b.pk, 3072), (c.pk, 4096)])
+
+
+class TransferTests(APITestCase):
+    def setUp(self):
+        employees = make_employees(3)
+        Employee.objects.filter(pk=employees[0].pk).update(department="design")
+        make_projects(4, employees, tasks_per_project=3)
+        Project.objects.update(start_date=date(2025, 1, 6), description="Imported")
+        Task.objects.filter(order=2).update(start_date=date(2025, 1, 7), end_date=date(2025, 1, 9), completion_days=2)
+
+    @staticmethod
+    def normalized(records):
+        """Records with project refs (exported as ids) replaced by their position"""
+        refs = {}
+        for record in records:
+            if record["type"] == "project":
+                record["ref"] = refs.setdefault(record["ref"], len(refs))
+            elif record["type"] == "task":
+                record["project_ref"] = refs[record["project_ref"]]
+        return records
+
+    def export_ndjson(self):
+        body = b"".join(self.client.get("/api/export/").streaming_content).decode()
+        return [json.loads(line) for line in body.splitlines()]
+
+    def import_body(self, body, fmt="ndjson"):
+        return self.client.generic(
+            "POST", f"/api/import/?stream={fmt}", body.encode(), content_type="application/octet-stream"
+        ).json()
+
+    def test_ndjson_round_trip(self):
+        exported = self.export_ndjson()
+        body = "".join(json.dumps(record) + "\n" for record in exported)
+        Project.objects.all().delete()
+        Employee.objects.all().delete()
+
+        summary = self.import_body(body)
+        self.assertEqual(summary["created"], {"employees": 3, "projects": 4, "tasks": 12})
+        self.assertEqual(summary["error_count"], 0)
+        self.assertEqual(self.normalized(self.export_ndjson()), self.normalized(exported))
+        # Imports refresh the rollups too
+        self.assertEqual(set(Project.objects.values_list("task_count", flat=True)), {3})
+
+    def test_csv_round_trip_through_the_commands(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "all.csv"
+            call_command("export_data", "--stream", "csv", "--output", str(path), stderr=StringIO())
+            exported = path.read_text()
+            Project.objects.all().delete()
+            Employee.objects.all().delete()
+            output = StringIO()
+            call_command("import_data", str(path), stdout=output)
+
+        self.assertIn("Created 3 employees, 4 projects, 12 tasks", output.getvalue())
+        again = b"".join(self.client.get("/api/export/?stream=csv").streaming_content).decode()
+        rows = [self.normalized(list(csv.DictReader(text.splitlines()))) for text in (exported, again)]
+        self.assertEqual(rows[0], rows[1])
+
+    def test_existing_emails_are_reused(self):
+        body = "".join(json.dumps(record) + "\n" for record in self.export_ndjson())
+        summary = self.import_body(body)
+        self.assertEqual(summary["created"], {"employees": 0, "projects": 4, "tasks": 12})
+        self.assertEqual(summary["matched_employees"], 3)
+        self.assertEqual(Employee.objects.count(), 3)
+
+    def test_invalid_rows_are_skipped_and_reported(self):
+        body = "\n".join([
+            '{"type": "employee", "name": "Ann", "email": "ann@example.com"}',
+            "{not json",
+            '{"type": "robot"}',
+            '{"type": "project", "ref": "p", "title": "Launch", "assigned_employee_email": "nobody@example.com"}',
+            '{"type": "project", "ref": "q", "title": "Launch", "start_date": "soon"}',
+            '{"type": "project", "ref": "r", "title": "Ok", "assigned_employee_email": "ann@example.com"}',
+            '{"type": "task", "project_ref": "p", "name": "Orphan"}',
+            '{"type": "task", "project_ref": "r", "name": "Kept", "completion_days": 2}',
+        ])
+        summary = self.import_body(body)
+        self.assertEqual(summary["created"], {"employees": 1, "projects": 1, "tasks": 1})
+        self.assertEqual(summary["error_count"], 5)
+        self.assertEqual(
+            [(error["line"], error["type"], list(error["errors"])) for error in summary["errors"]],
+            [
+                (2, None, ["record"]),
+                (3, "robot", ["type"]),
+                (4, "project", ["assigned_employee_email"]),
+                (5, "project", ["start_date"]),
+                (7, "task", ["project_ref"]),
+            ],
+        )
+
+    def test_body_without_content_length_is_411(self):
+        request = RequestFactory().post(
+            "/api/import/", b'{"type": "employee"}\n', content_type="application/x-ndjson",
+            HTTP_TRANSFER_ENCODING="chunked",
+        )
+        del request.META["CONTENT_LENGTH"]
+        self.assertEqual(ImportView.as_view()(request).status_code, 411)
+
+
+class BulkTaskTests(APITestCase):
+    def make_project(self, tasks):
+        project = Project.objects.create(title="Bulk", start_date=date(2025, 1, 6))
+        Task.objects.bulk_create(
+            Task(project=project, name=f"Task {order}", order=order, completion_days=1)
+            for order in range(1, tasks + 1)
+        )
+        self.client.post(f"/api/projects/{project.pk}/auto_schedule/")
+        return list(project.tasks.order_by("order"))
+
+    def bulk(self, operations):
+        return self.client.post("/api/tasks/bulk/", operations, format="json")
+
+    def test_failing_operation_rolls_back_the_batch(self):
+        tasks = self.make_project(4)
+        before = list(Task.objects.order_by("pk").values_list("name", "start_date", "end_date", "order"))
+        response = self.bulk([
+            {"op": "patch", "id": tasks[0].pk, "data": {"name": "Renamed"}},
+            {"op": "shift", "id": tasks[1].pk, "days": 2},
+            {"op": "delete", "id": tasks[3].pk},
+            {"op": "set_completion_days", "id": tasks[2].pk, "completion_days": 0},
+        ])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["index"], 3)
+        self.assertEqual(list(Task.objects.order_by("pk").values_list("name", "start_date", "end_date", "order")), before)
+
+    def test_shift_cascades_in_the_batch(self):
+        tasks = self.make_project(4)
+        response = self.bulk([{"op": "shift", "id": tasks[1].pk, "days": 1}]).json()
+        moved = {task["id"]: task["start_date"] for task in response["tasks"]}
+        self.assertEqual(set(moved), {task.pk for task in tasks[1:]})
+        for task in tasks[2:]:
+            task.refresh_from_db()
+            self.assertEqual(task.start_date.isoformat(), moved[task.pk])
+
+    def test_batch_runs_constant_queries(self):
+        def queries(size):
+            tasks = self.make_project(size)
+            operations = [{"op": "patch", "id": task.pk, "data": {"status": "done"}} for task in tasks]
+            operations += [{"op": "shift", "id": tasks[0].pk, "days": 1}, {"op": "delete", "id": tasks[-1].pk}]
+            with CaptureQueriesContext(connection) as context:
+                self.assertEqual(self.bulk(operations).status_code, 200)
+            return len(context.captured_queries)
+
+        self.assertEqual(queries(5), queries(60))
+
+
+class SimulationTests(APITestCase):
+    def setUp(self):
+        self.project = Project.objects.create(title="What if", start_date=date(2025, 1, 6))
+        Task.objects.bulk_create(
+            Task(project=self.project, name=f"Task {order}", order=order, completion_days=2)
+            for order in range(1, 5)
+        )
+        self.client.post(f"/api/projects/{self.project.pk}/auto_schedule/")
+        self.tasks = list(self.project.tasks.order_by("order"))
+
+    def test_simulate_never_writes(self):
+        first, second, third, fourth = self.tasks
+        before = list(Task.objects.order_by("pk").values())
+        scenarios = [
+            {"name": "slip", "operations": [{"op": "shift", "id": first.pk, "days": 1}]},
+            {"name": "cut", "operations": [{"op": "delete", "id": second.pk}, {"op": "auto_schedule"}]},
+            {"name": "broken", "operations": [{"op": "patch", "id": 0}]},
+        ]
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(
+                f"/api/projects/{self.project.pk}/simulate/", {"scenarios": scenarios}, format="json"
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(all(query["sql"].startswith("SELECT") for query in context.captured_queries))
+        self.assertEqual(list(Task.objects.order_by("pk").values()), before)
+
+        slip, cut, broken = response.json()["scenarios"]
+        self.assertEqual(slip["finish_shift_days"], 1)
+        self.assertEqual([change["id"] for change in slip["changed"]], [first.pk, second.pk, third.pk, fourth.pk])
+        self.assertEqual(cut["deleted"], [second.pk])
+        self.assertLess(cut["finish_shift_days"], 0)
+        self.assertEqual(broken["index"], 0)
+
+    def test_scenarios_start_from_the_same_state(self):
+        operations = [{"op": "shift", "id": self.tasks[0].pk, "days": 1}]
+        result = self.client.post(
+            f"/api/projects/{self.project.pk}/simulate/",
+            {"scenarios": [{"operations": operations}, {"operations": operations}]}, format="json",
+        ).json()
+        self.assertEqual(result["scenarios"][0], {**result["scenarios"][1], "name": "scenario 1"})
+
+
+def make_scheduled_project(tasks, start_date=date(2025, 1, 6), completion_days=2):
+    """A project whose tasks are chained back to back by auto_schedule"""
+    project = Project.objects.create(title="Scheduled", start_date=start_date)
+    Task.objects.bulk_create(
+        Task(project=project, name=f"Task {order}", order=order, completion_days=completion_days)
+        for order in range(1, tasks + 1)
+    )
+    auto_schedule_projects([project])
+    return project, list(project.tasks.order_by("order"))
+
+
+class CascadeTests(APITestCase):
+    def dates(self, project):
+        return list(project.tasks.order_by("order").values_list("start_date", "end_date"))
+
+    def test_end_date_change_shifts_the_following_tasks(self):
+        project, tasks = make_scheduled_project(5)
+        before = self.dates(project)
+        response = self.client.patch(f"/api/tasks/{tasks[1].pk}/", {"completion_days": 5}, format="json")
+
+        self.assertEqual([task["id"] for task in response.json()["cascaded_tasks"]], [task.pk for task in tasks[2:]])
+        after = self.dates(project)
+        delta = after[1][1] - before[1][1]
+        self.assertEqual(delta, timedelta(days=3))  # starts Thursday: ends the next Thursday, not Monday
+        self.assertEqual(after[0], before[0])
+        for (old_start, old_end), (start, end) in zip(before[2:], after[2:]):
+            self.assertEqual((start - old_start, end - old_end), (delta, delta))
+
+    def test_cascade_runs_constant_queries(self):
+        def queries(size):
+            _, tasks = make_scheduled_project(size)
+            with CaptureQueriesContext(connection) as context:
+                self.client.post(f"/api/tasks/{tasks[0].pk}/shift/", {"days": 1}, format="json")
+            return len(context.captured_queries)
+
+        self.assertEqual(queries(5), queries(80))
+
+
+class AutoScheduleTests(APITestCase):
+    def test_tasks_chain_on_business_days(self):
+        # Starts on a Saturday, so the first task starts on Monday
+        project, _ = make_scheduled_project(3, start_date=date(2025, 1, 4))
+        for task in project.tasks.all():
+            task.start_date = task.end_date = None
+            task.save()
+        response = self.client.post(f"/api/projects/{project.pk}/auto_schedule/")
+        dates = [(task["start_date"], task["end_date"]) for task in response.json()["tasks"]]
+        self.assertEqual(dates, [
+            ("2025-01-06", "2025-01-08"), ("2025-01-09", "2025-01-13"), ("2025-01-14", "2025-01-16"),
+        ])
+
+    def test_batch_reports_unschedulable_projects(self):
+        scheduled, _ = make_scheduled_project(2)
+        undated = Project.objects.create(title="No start")
+        response = self.client.post(
+            "/api/projects/auto_schedule/", {"project_ids": [scheduled.pk, undated.pk, 0]}, format="json"
+        ).json()
+        self.assertEqual([project["id"] for project in response["projects"]], [scheduled.pk])
+        self.assertEqual(set(response["errors"]), {str(undated.pk), "0"})
+
+    def test_batch_writes_with_constant_queries(self):
+        def queries(projects, tasks):
+            ids = [make_scheduled_project(tasks)[0].pk for _ in range(projects)]
+            tasks = Task.objects.filter(project_id__in=ids)
+            tasks.update(start_date=None, end_date=None)
+            with CaptureQueriesContext(connection) as context:
+                self.client.post("/api/projects/auto_schedule/", {"project_ids": ids}, format="json")
+            self.assertFalse(tasks.filter(start_date__isnull=True).exists())
+            return len(context.captured_queries)
+
+        # bulk_update splits at SQLite's variable limit (about 160 tasks here), so stay within one statement
+        self.assertEqual(queries(2, 3), queries(10, 15))
+
+
+class TimelineTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        project = Project.objects.create(title="Timeline", assigned_employee=make_employees(1)[0])
+        spans = [
+            (date(2025, 1, 1), date(2025, 1, 10)),
+            (date(2025, 1, 8), date(2025, 1, 20)),
+            (date(2025, 2, 1), date(2025, 2, 5)),
+            (None, None),
+        ]
+        # bulk_create keeps the end dates (Task.save would derive them from completion_days)
+        Task.objects.bulk_create(
+            Task(project=project, name=f"Task {order}", order=order, start_date=start, end_date=end)
+            for order, (start, end) in enumerate(spans, start=1)
+        )
+
+    def names(self, **params):
+        return [row["name"] for row in self.client.get("/api/tasks/project_timeline/", params).json()]
+
+    def test_window_keeps_overlapping_dated_tasks(self):
+        self.assertEqual(self.names(), ["Task 1", "Task 2", "Task 3"])
+        self.assertEqual(self.names(start="2025-01-11", end="2025-01-31"), ["Task 2"])
+        self.assertEqual(self.names(end="2025-01-08"), ["Task 1", "Task 2"])
+        self.assertEqual(self.names(start="2025-01-21"), ["Task 3"])
+
+    def test_invalid_parameters(self):
+        for params in ({"start": "soon"}, {"stream": "xml"}):
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get("/api/tasks/project_timeline/", params).status_code, 400)
+
+    def test_streams_match_the_list(self):
+        params = {"start": "2025-01-09"}
+        rows = self.client.get("/api/tasks/project_timeline/", params).json()
+
+        response = self.client.get("/api/tasks/project_timeline/", {**params, "stream": "ndjson"})
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], rows)
+
+        response = self.client.get("/api/tasks/project_timeline/", {**params, "stream": "csv"})
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="timeline.csv"')
+        streamed = list(csv.DictReader(b"".join(response.streaming_content).decode().splitlines()))
+        self.assertEqual([row["name"] for row in streamed], [row["name"] for row in rows])
+        self.assertEqual(streamed[0]["assigned_to"], "Employee 0")
+
+
+class RollupTests(APITestCase):
+    def setUp(self):
+        self.project = make_projects(1, tasks_per_project=2)[0]
+
+    def assertRollups(self, task_count, done_count, min_start, max_end):
+        self.project.refresh_from_db()
+        self.assertEqual(
+            (self.project.task_count, self.project.done_count, self.project.min_task_start, self.project.max_task_end),
+            (task_count, done_count, min_start, max_end),
+        )
+
+    def test_task_writes_maintain_the_rollups(self):
+        self.assertRollups(2, 1, None, None)
+        # Plain ORM saves go through the signals
+        created = Task.objects.create(
+            project=self.project, name="New", order=3, status="done", start_date=date(2025, 1, 6), completion_days=2
+        )
+        self.assertRollups(3, 2, date(2025, 1, 6), date(2025, 1, 8))
+
+        self.client.patch(f"/api/tasks/{created.pk}/", {"status": "pending", "start_date": "2025-01-13"}, format="json")
+        self.assertRollups(3, 1, date(2025, 1, 13), date(2025, 1, 15))
+
+        task = self.project.tasks.get(order=1)
+        task.start_date = date(2025, 1, 2)
+        task.save()
+        self.assertRollups(3, 1, date(2025, 1, 2), date(2025, 1, 15))
+
+        self.client.delete(f"/api/tasks/{created.pk}/")
+        self.assertRollups(2, 1, date(2025, 1, 2), date(2025, 1, 3))
+
+    def test_rebuild_command_repairs_drift(self):
+        other = make_projects(1)[0]
+        Project.objects.filter(pk=self.project.pk).update(task_count=9, done_count=0)
+
+        output = StringIO()
+        with self.assertRaisesMessage(CommandError, "1 project(s) have stale rollups"):
+            call_command("rebuild_project_rollups", "--verify", stdout=output)
+        self.assertIn(f"project {self.project.pk}: task_count stored=9 actual=2", output.getvalue())
+
+        call_command("rebuild_project_rollups", "--project", str(other.pk), stdout=StringIO())
+        self.assertRollups(9, 0, None, None)  # outside --project
+        call_command("rebuild_project_rollups", stdout=StringIO())
+        self.assertRollups(2, 1, None, None)
+        call_command("rebuild_project_rollups", "--verify", stdout=StringIO())
+
+
+
+class SyntheticDatasetTests(APITestCase):
+    def snapshot(self):
+        return {
+            "employees": list(Employee.objects.order_by("pk").values_list("name", "department")),
+            "projects": list(Project.objects.order_by("pk").values_list(
+                "title", "start_date", "end_date", "assigned_employee__email", "task_count", "done_count"
+            )),
+            "tasks": list(Task.objects.order_by("project_id", "order").values_list(
+                "project__title", "name", "order", "start_date", "end_date", "completion_days", "status"
+            )),
+            "dependencies": list(DependencyEdge.objects.order_by("pk").values_list(
+                "from_task__project__title", "from_task__order", "to_task__order"
+            )),
+        }
+
+    def test_same_seed_produces_same_rows(self):
+        args = ["--employees", "4", "--projects", "6", "--tasks", "5", "--seed", "7", "--dependencies", "1"]
+        call_command("generate_dataset", *args, stdout=StringIO())
+        first = self.snapshot()
+        call_command("generate_dataset", *args, "--clear", stdout=StringIO())
+        self.assertEqual(self.snapshot(), first)
+
+        args[args.index("--seed") + 1] = "8"
+        call_command("generate_dataset", *args, "--clear", stdout=StringIO())
+        self.assertNotEqual(self.snapshot(), first)
+
+    def test_counts_and_dependencies(self):
+        counts = generate_dataset(3, 4, 5, seed=1, dependency_ratio=1)
+        self.assertEqual(counts, {"employees": 3, "projects": 4, "tasks": 20, "dependencies": 16})
+        self.assertEqual(Task.objects.count(), 20)
+        for edge in DependencyEdge.objects.select_related("from_task", "to_task"):
+            self.assertEqual(edge.from_task.project_id, edge.to_task.project_id)
+            self.assertIn(edge.from_task.order - edge.to_task.order, (1, 2, 3))
+        for project in Project.objects.all():
+            last = project.tasks.order_by("order").last()
+            self.assertEqual(project.end_date, last.end_date)
+            self.assertEqual(project.task_count, 5)
+
+        self.assertEqual(generate_dataset(0, 2, 3)["dependencies"], 0)
+
+    def test_run_size_measures_every_endpoint(self):
+        result = run_size((2, 3, 3), repeat=2)
+        self.assertEqual(result["dataset"]["tasks"], 9)
+        self.assertEqual(set(result["endpoints"]), {
+            "employee_list", "project_list", "project_list_warm", "task_list", "timeline",
+            "task_update_cascade", "task_shift", "auto_schedule",
+        })
+        for stats in result["endpoints"].values():
+            self.assertEqual(stats["statuses"], [200])
+            self.assertEqual(stats["samples"], 2)
+            self.assertLessEqual(stats["p50_ms"], stats["p99_ms"])
+
+    def test_percentile_and_compare(self):
+        self.assertIsNone(percentile([], 50))
+        self.assertEqual(percentile([1, 2, 3, 4], 50), 2.5)
+        self.assertEqual(percentile([1, 2, 3, 4], 100), 4)
+
+        previous = {"results": {"small": {"endpoints": {"a": {"p50_ms": 10, "queries": 3}}}}}
+        current = {"results": {"small": {"endpoints": {
+            "a": {"p50_ms": 11.5, "queries": 4}, "new": {"p50_ms": 99, "queries": 9},
+        }}}}
+        self.assertEqual(compare(previous, current, threshold=20), ["small/a: queries 3 -> 4"])
+        self.assertEqual(compare(previous, current, threshold=10), [
+            "small/a: queries 3 -> 4", "small/a: p50 10ms -> 11.5ms",
+        ])
+
+
+@override_settings(BUSINESS_HOLIDAYS=["2025-01-08"])
+class WorkloadTests(APITestCase):
+    START, END = date(2025, 1, 3), date(2025, 1, 24)
+
+    def setUp(self):
+        self.employees = make_employees(3)
+        projects = make_projects(8, self.employees, tasks_per_project=0)
+        spans = [(-4, 2), (0, 0), (1, 9), (5, 5), (5, 5), (12, 30), (20, 21), (-9, -1), (22, 40), (3, 16)]
+        Task.objects.bulk_create(
+            Task(
+                project=project,
+                name=f"Task {order}",
+                order=order,
+                start_date=self.START + timedelta(days=first),
+                end_date=self.START + timedelta(days=last),
+            )
+            for index, project in enumerate(projects)
+            for order, (first, last) in enumerate(spans[index:] + spans[:index], start=1)
+            if (order + index) % 3
+        )
+        # Undated tasks are not load
+        Task.objects.create(project=projects[1], name="Undated", order=99)
+
+    def naive_load(self, employee, day):
+        return Task.objects.filter(
+            project__assigned_employee=employee, start_date__lte=day, end_date__gte=day
+        ).count()
+
+    def test_daily_load_matches_a_per_day_count(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(f"/api/employees/workload/?start={self.START}&end={self.END}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(context.captured_queries), 2)
+
+        calendar = BusinessCalendar(holidays=["2025-01-08"])
+        days = [self.START + timedelta(days=offset) for offset in range((self.END - self.START).days + 1)]
+        self.assertEqual(response.data["periods"], days)
+        loads = {employee["id"]: employee["load"] for employee in response.data["employees"]}
+        self.assertEqual(set(loads), {employee.pk for employee in self.employees})
+        for employee in self.employees:
+            expected = [self.naive_load(employee, day) if calendar.is_business_day(day) else 0 for day in days]
+            self.assertEqual(loads[employee.pk], expected)
+
+    def test_weekly_buckets_sum_the_days(self):
+        daily = self.client.get(f"/api/employees/workload/?start={self.START}&end={self.END}").data
+        weekly = self.client.get(f"/api/employees/workload/?start={self.START}&end={self.END}&bucket=week").data
+        self.assertEqual(weekly["periods"], [date(2024, 12, 30) + timedelta(weeks=week) for week in range(4)])
+        by_id = {employee["id"]: employee for employee in weekly["employees"]}
+        for employee in daily["employees"]:
+            weeks = [0] * 4
+            for day, load in zip(daily["periods"], employee["load"]):
+                weeks[(day - date(2024, 12, 30)).days // 7] += load
+            self.assertEqual(by_id[employee["id"]]["load"], weeks)
+            self.assertEqual(by_id[employee["id"]]["total"], employee["total"])
+
+    def test_invalid_window(self):
+        for query in ("start=2025-01-10&end=2025-01-09", "start=nope", "bucket=month", "start=2025-01-01&end=2027-01-02"):
+            self.assertEqual(self.client.get(f"/api/employees/workload/?{query}").status_code, 400, query)
@@ -0,0 +1,271 @@
+"""Bulk import and export of employees, projects and tasks.
+
+One record per NDJSON line or CSV row, tagged with ``type``; CSV files use
+the union of all columns (EXPORT_COLUMNS) and leave the others empty:
+
+* ``employee``: name, email, department. A row whose email already exists
+  is matched, not created again.
+* ``project``: ref, title, description, start_date, end_date,
+  assigned_employee_email. ``ref`` is any label unique within the file
+  (export uses the project id) for tasks to point at.
+* ``task``: project_ref, name, description, order, start_date, end_date,
+  completion_days, status. Orders must increase within a project and
+  default to the next one.
+
+References must point to earlier rows. Records are read lazily and written
+in chunks: each chunk is validated field by field with the model fields'
+own clean(), its end dates are derived like Task.save, and each type goes
+in with one bulk_create in one transaction. Invalid rows are skipped and
+reported. Only the email, project ref and last-order maps grow with the
+file, so memory stays flat however many tasks it has.
+"""
+import csv
+import json
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from . import cache
+from .business_calendar import get_calendar
+from .models import Employee, Project, Task
+from .rollups import refresh_project_rollups
+
+CHUNK_SIZE = 1000
+MAX_CHUNK_SIZE = 10000
+EXPORT_CHUNK_SIZE = 2000
+MAX_REPORTED_ERRORS = 100
+
+# type -> (model, fields taken through the model field's clean())
+RECORD_TYPES = {
+    "employee": (Employee, ["name", "email", "department"]),
+    "project": (Project, ["title", "description", "start_date", "end_date"]),
+    "task": (Task, ["name", "description", "order", "start_date", "end_date", "completion_days", "status"]),
+}
+# Record type -> export name, in dependency order
+EXPORT_TYPES = {"employee": "employees", "project": "projects", "task": "tasks"}
+
+# CSV header for every record type
+EXPORT_COLUMNS = [
+    "type", "ref", "project_ref", "name", "email", "department", "title", "description",
+    "start_date", "end_date", "assigned_employee_email", "order", "completion_days", "status",
+]
+
+
+class RecordError(Exception):
+    """A record that cannot be imported; ``errors`` maps fields to messages"""
+
+    def __init__(self, errors):
+        super().__init__(errors)
+        self.errors = errors
+
+
+def read_ndjson(lines):
+    """(line number, record) pairs from NDJSON lines; undecodable lines yield an error string"""
+    for number, line in enumerate(lines, start=1):
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            yield number, f"Invalid JSON: {exc}"
+            continue
+        yield number, record if isinstance(record, dict) else "Each line must be a JSON object"
+
+
+def read_csv(lines):
+    """(line number, record) pairs from CSV lines with a header row"""
+    reader = csv.DictReader(line.decode("utf-8") if isinstance(line, bytes) else line for line in lines)
+    for row in reader:
+        yield reader.line_num, row
+
+
+READERS = {"ndjson": read_ndjson, "csv": read_csv}
+
+
+def _clean(model, record, names):
+    values, errors = {}, {}
+    for name in names:
+        field = model._meta.get_field(name)
+        value = record.get(name)
+        if value is None or value == "":
+            if field.has_default():
+                values[name] = field.get_default()
+                continue
+            value = None if field.null else ""
+        try:
+            values[name] = field.clean(value, None)
+        except ValidationError as exc:
+            errors[name] = exc.messages
+    if errors:
+        raise RecordError(errors)
+    return values
+
+
+class Importer:
+    """Feeds (line number, record) pairs into the database chunk by chunk.
+
+    ``summary()`` reports created and matched rows plus the first
+    MAX_REPORTED_ERRORS skipped ones.
+    """
+
+    def __init__(self, chunk_size=CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.employee_ids = dict(Employee.objects.values_list("email", "id").iterator())
+        self.project_ids = {}
+        self.last_orders = {}
+        self.created = {name: 0 for name in EXPORT_TYPES.values()}
+        self.matched_employees = 0
+        self.errors = []
+        self.error_count = 0
+
+    def error(self, line, record_type, errors):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "type": record_type, "errors": errors})
+
+    def feed(self, records):
+        chunk = []
+        for line, record in records:
+            chunk.append((line, record))
+            if len(chunk) >= self.chunk_size:
+                self.write_chunk(chunk)
+                chunk = []
+        if chunk:
+            self.write_chunk(chunk)
+        return self.summary()
+
+    def summary(self):
+        return {
+            "created": self.created,
+            "matched_employees": self.matched_employees,
+            "error_count": self.error_count,
+            "errors": sorted(self.errors, key=lambda error: error["line"]),
+        }
+
+    def write_chunk(self, chunk):
+        by_type = {record_type: [] for record_type in RECORD_TYPES}
+        for line, record in chunk:
+            if isinstance(record, str):
+                self.error(line, None, {"record": [record]})
+            elif record.get("type") not in RECORD_TYPES:
+                self.error(line, record.get("type"), {"type": [f"must be one of: {', '.join(RECORD_TYPES)}"]})
+            else:
+                by_type[record["type"]].append((line, record))
+
+        with transaction.atomic():
+            self.write_employees(by_type["employee"])
+            project_ids = self.write_projects(by_type["project"])
+            project_ids.update(self.write_tasks(by_type["task"]))
+            refresh_project_rollups(project_ids)
+
+    def valid(self, record_type, rows, build):
+        """Clean rows and build unsaved instances with ``build(record, values)``"""
+        model, fields = RECORD_TYPES[record_type]
+        instances = []
+        for line, record in rows:
+            try:
+                instance = build(record, _clean(model, record, fields))
+            except RecordError as exc:
+                self.error(line, record_type, exc.errors)
+                continue
+            if instance is not None:
+                instances.append(instance)
+        return instances
+
+    def write_employees(self, rows):
+        pending = set()
+
+        def build(record, values):
+            if values["email"] in self.employee_ids or values["email"] in pending:
+                self.matched_employees += 1
+                return None
+            pending.add(values["email"])
+            return Employee(**values)
+
+        employees = Employee.objects.bulk_create(self.valid("employee", rows, build))
+        self.employee_ids.update((employee.email, employee.pk) for employee in employees)
+        self.created["employees"] += len(employees)
+
+    def write_projects(self, rows):
+        refs, chunk_refs = [], set()
+
+        def build(record, values):
+            ref = str(record.get("ref") or "")
+            if ref and (ref in self.project_ids or ref in chunk_refs):
+                raise RecordError({"ref": [f"Duplicate project ref {ref!r}"]})
+            email = record.get("assigned_employee_email")
+            if email and email not in self.employee_ids:
+                raise RecordError({"assigned_employee_email": [f"No employee with email {email!r}"]})
+            refs.append(ref)
+            chunk_refs.add(ref)
+            project = Project(assigned_employee_id=self.employee_ids.get(email) if email else None, **values)
+            if project.start_date and project.end_date:
+                project.completion_time = project.end_date - project.start_date
+            return project
+
+        projects = Project.objects.bulk_create(self.valid("project", rows, build))
+        self.project_ids.update((ref, project.pk) for ref, project in zip(refs, projects) if ref)
+        self.created["projects"] += len(projects)
+        # Nested employee details carry a project count
+        cache.bump("employee", *{project.assigned_employee_id for project in projects})
+        return {project.pk for project in projects}
+
+    def write_tasks(self, rows):
+        calendar = get_calendar()
+        end_dates = {}
+
+        def build(record, values):
+            ref = str(record.get("project_ref") or "")
+            project_id = self.project_ids.get(ref)
+            if project_id is None:
+                raise RecordError({"project_ref": [f"No project with ref {ref!r} earlier in the file"]})
+            last_order = self.last_orders.get(project_id, 0)
+            if record.get("order") in (None, ""):
+                values["order"] = last_order + 1
+            elif values["order"] <= last_order:
+                raise RecordError({"order": [f"Orders must increase within a project (last was {last_order})"]})
+            self.last_orders[project_id] = values["order"]
+
+            task = Task(project_id=project_id, **values)
+            # Same derivation as Task.save, memoized per (start, duration) within the chunk
+            if task.start_date and task.completion_days:
+                key = (task.start_date, task.completion_days)
+                if key not in end_dates:
+                    end_dates[key] = calendar.add_business_days(*key)
+                task.end_date = end_dates[key]
+            if task.start_date and task.end_date:
+                task.completion_time = task.end_date - task.start_date
+            return task
+
+        tasks = Task.objects.bulk_create(self.valid("task", rows, build))
+        self.created["tasks"] += len(tasks)
+        return {task.project_id for task in tasks}
+
+
+def import_records(records, chunk_size=CHUNK_SIZE):
+    """Import (line number, record) pairs and return the summary"""
+    return Importer(chunk_size).feed(records)
+
+
+def export_records(types=tuple(EXPORT_TYPES)):
+    """Records of the given types, streamed from the database in export order"""
+    if "employee" in types:
+        for row in Employee.objects.order_by("id").values("name", "email", "department").iterator(
+            chunk_size=EXPORT_CHUNK_SIZE
+        ):
+            yield {"type": "employee", **row}
+    if "project" in types:
+        projects = Project.objects.order_by("id").values(
+            "id", "title", "description", "start_date", "end_date", "assigned_employee__email"
+        )
+        for row in projects.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            project_id, email = row.pop("id"), row.pop("assigned_employee__email")
+            yield {"type": "project", "ref": str(project_id), **row, "assigned_employee_email": email}
+    if "task" in types:
+        tasks = Task.objects.order_by("project_id", "order").values(
+            "project_id", *RECORD_TYPES["task"][1]
+        )
+        for row in tasks.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            yield {"type": "task", "project_ref": str(row.pop("project_id")), **row}
@@ -1,13 +1,21 @@
 
 from rest_framework.routers import DefaultRouter
 from django.urls import path, include
-from .views import EmployeeViewSet, ProjectViewSet, TaskViewSet
+from .async_views import async_urls
+from .views import (
+    CacheStatsView, EmployeeViewSet, ExportView, ImportView, JobViewSet, ProjectViewSet, SyncView, TaskViewSet,
+)
 
 router = DefaultRouter()
 router.register(r'employees', EmployeeViewSet, basename='employee')
 router.register(r'projects', ProjectViewSet, basename='project')
 router.register(r'tasks', TaskViewSet, basename='task')
+router.register(r'jobs', JobViewSet, basename='job')
 
 urlpatterns = [
-    path('', include(router.urls)),
+    path('sync/', SyncView.as_view(), name='sync'),
+    path('import/', ImportView.as_view(), name='import'),
+    path('export/', ExportView.as_view(), name='export'),
+    path('cache/stats/', CacheStatsView.as_view(), name='cache-stats'),
+    path('', include(async_urls(router.urls))),
 ]
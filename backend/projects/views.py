@@ -1,48 +1,177 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
+from rest_framework.views import APIView
+from django.conf import settings
 from django.db import transaction
+from django.db.models import Count, Prefetch, Q, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from datetime import timedelta, date
-from .models import Employee, Project, Task
-from .serializers import EmployeeSerializer, ProjectSerializer, TaskSerializer
+from functools import partial
+from pm_backend.metrics import serializing
+from . import cache, fast_read, jobs, transfer
+from .bulk import BulkOperationError, TaskBatch
+from .business_calendar import add_business_days
+from .conditional import conditional_response, queryset_etag
+from .critical_path import DependencyCycle, critical_path, project_edges, topological_order, with_order_edges
+from .models import Employee, Job, Project, Task, Tombstone
+from .ordering import move_task
+from .pagination import EmployeeCursorPagination, JobCursorPagination, ProjectCursorPagination, TaskCursorPagination
+from .rollups import deferred_rollups
+from .scheduling import auto_schedule_projects, shift_following
+from .simulation import MAX_SCENARIOS, simulate
+from .streaming import stream_rows
+from .workload import BUCKETS, MAX_WINDOW_DAYS, employee_workload
+from .serializers import EmployeeSerializer, JobSerializer, ProjectSerializer, TaskSerializer
+
+STREAM_FORMATS = ("ndjson", "csv")
+TIMELINE_CHUNK_SIZE = 2000
+# Timeline key -> values() lookup; project and employee are joined in the same query
+TIMELINE_FIELDS = {
+    "id": "id",
+    "name": "name",
+    "project": "project__title",
+    "start": "start_date",
+    "end": "end_date",
+    "status": "status",
+    "completion_days": "completion_days",
+    "assigned_to": "project__assigned_employee__name",
+}
+
+def in_background(request):
+    """Whether the client asked for the heavy writes to be queued (?background=1)"""
+    return request.query_params.get("background", "").lower() in ("1", "true", "yes")
+
+def project_queryset(with_tasks=True, with_employee=True):
+    """Projects with their tasks and assigned employee prefetched"""
+    queryset = Project.objects.all().order_by("-created_at")
+    if with_tasks:
+        queryset = queryset.prefetch_related("tasks")
+    if with_employee:
+        queryset = queryset.prefetch_related(
+            Prefetch(
+                "assigned_employee",
+                queryset=Employee.objects.annotate(num_projects=Count("projects")),
+            )
+        )
+    return queryset
 
 class EmployeeViewSet(viewsets.ModelViewSet):
-    queryset = Employee.objects.all().order_by("name")
+    queryset = Employee.objects.annotate(num_projects=Count("projects")).order_by("name")
     serializer_class = EmployeeSerializer
+    pagination_class = EmployeeCursorPagination
 
     @action(detail=True, methods=["get"])
     def projects(self, request, pk=None):
         """Get all projects assigned to this employee"""
         employee = self.get_object()
-        projects = employee.projects.all()
-        serializer = ProjectSerializer(projects, many=True)
+        projects = project_queryset().filter(assigned_employee=employee)
+        serializer = ProjectSerializer(projects, many=True, context=self.get_serializer_context())
         return Response(serializer.data)
 
+    @action(detail=False, methods=["get"])
+    def workload(self, request):
+        """Business-day task load per employee over ?start=&end= (?bucket=day|week)"""
+        bucket = request.query_params.get("bucket", "day")
+        if bucket not in BUCKETS:
+            return Response(
+                {"error": f"bucket must be one of: {', '.join(BUCKETS)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            start = date.fromisoformat(request.query_params.get("start") or timezone.localdate().isoformat())
+            end = date.fromisoformat(request.query_params.get("end") or (start + timedelta(days=27)).isoformat())
+        except ValueError:
+            return Response(
+                {"error": "start and end must be YYYY-MM-DD dates"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if end < start or (end - start).days >= MAX_WINDOW_DAYS:
+            return Response(
+                {"error": f"end must be on or after start and within {MAX_WINDOW_DAYS} days"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(employee_workload(start, end, bucket))
+
 class ProjectViewSet(viewsets.ModelViewSet):
-    queryset = Project.objects.all().order_by("-created_at").prefetch_related("tasks", "assigned_employee")
+    queryset = project_queryset()
     serializer_class = ProjectSerializer
+    pagination_class = ProjectCursorPagination
+
+    def get_queryset(self):
+        # Skip prefetches for nested fields the client filtered out
+        request = self.request
+        return project_queryset(
+            with_tasks=ProjectSerializer.field_is_requested(request, "tasks"),
+            with_employee=ProjectSerializer.field_is_requested(request, "assigned_employee_detail"),
+        )
+
+    def cached_data(self, projects):
+        """Serialized projects, read through the payload cache (keyed on updated_at)"""
+        params = self.request.query_params
+        variant = f"{params.get('fields', '')}|{params.get('omit', '')}"
+
+        def build(missing):
+            if fast_read.enabled():
+                return fast_read.project_payloads(self.get_serializer(many=True), missing)
+            instances = list(self.get_queryset().filter(pk__in=missing))
+            data = self.get_serializer(instances, many=True).data
+            return {instance.pk: payload for instance, payload in zip(instances, data)}
+
+        payloads = cache.cached_projects([cache.project_key_row(project) for project in projects], variant, build)
+        return [payloads[project.pk] for project in projects]
+
+    def cached_list(self, request):
+        projects = self.filter_queryset(cache.project_key_queryset(Project.objects.order_by("-created_at")))
+        page = self.paginate_queryset(projects)
+        if page is not None:
+            return self.get_paginated_response(self.cached_data(page))
+        return Response(self.cached_data(list(projects)))
+
+    def list(self, request, *args, **kwargs):
+        etag = queryset_etag(request, Project.objects.all(), Task.objects.all(), Employee.objects.all())
+        return conditional_response(request, etag, partial(self.cached_list, request))
+
+    def retrieve(self, request, *args, **kwargs):
+        # Look the project up first: a missing or malformed id is a 404, not an ETag query error
+        project = get_object_or_404(cache.project_key_queryset(Project.objects.all()), pk=kwargs["pk"])
+        etag = queryset_etag(
+            request,
+            Project.objects.filter(pk=project.pk),
+            Task.objects.filter(project_id=project.pk),
+            Employee.objects.filter(projects=project.pk),
+        )
+        return conditional_response(request, etag, lambda: Response(self.cached_data([project])[0]))
 
     @action(detail=True, methods=["get"])
     def tasks(self, request, pk=None):
         """Get all tasks for this project"""
         tasks = Task.objects.filter(project_id=pk).order_by("order")
-        return Response(TaskSerializer(tasks, many=True).data)
-    
-@action(detail=False, methods=["get"])
-def stats(self, request):
-    """Get overall project statistics"""
-    projects = Project.objects.all()
-    total_projects = projects.count()
-    total_tasks = Task.objects.count()
-    completed_tasks = Task.objects.filter(status='done').count()
-    
-    return Response({
-        'total_projects': total_projects,
-        'total_tasks': total_tasks,
-        'completed_tasks': completed_tasks,
-        'completion_rate': round((completed_tasks / total_tasks) * 100) if total_tasks > 0 else 0
-    })
-     
+        etag = queryset_etag(request, tasks)
+        return conditional_response(request, etag, lambda: Response(TaskSerializer(tasks, many=True).data))
+
+    @action(detail=False, methods=["get"])
+    def stats(self, request):
+        """Get overall project statistics"""
+        totals = Project.objects.aggregate(
+            total_projects=Count("id"),
+            total_tasks=Coalesce(Sum("task_count"), 0),
+            completed_tasks=Coalesce(Sum("done_count"), 0),
+        )
+        total_projects = totals['total_projects']
+        total_tasks = totals['total_tasks']
+        completed_tasks = totals['completed_tasks']
+        
+        return Response({
+            'total_projects': total_projects,
+            'total_tasks': total_tasks,
+            'completed_tasks': completed_tasks,
+            'completion_rate': round((completed_tasks / total_tasks) * 100) if total_tasks > 0 else 0
+        })
+
     @action(detail=True, methods=["post"])
     def auto_schedule(self, request, pk=None):
         """Auto-schedule all tasks in this project starting from project start date"""
@@ -53,65 +182,160 @@ def stats(self, request):
                 {"error": "Project must have a start date to auto-schedule tasks"}, 
                 status=status.HTTP_400_BAD_REQUEST
             )
+
+        if in_background(request):
+            job = jobs.enqueue("reschedule", project.pk)
+            return Response(JobSerializer(job).data, status=status.HTTP_202_ACCEPTED)
         
-        tasks = project.tasks.order_by('order')
-        current_date = project.start_date
-        
-        with transaction.atomic():
-            for task in tasks:
-                # Skip weekends for start date
-                while current_date.weekday() >= 5:  # Saturday = 5, Sunday = 6
-                    current_date += timedelta(days=1)
-                
-                task.start_date = current_date
-                task.save()  # This will auto-calculate end_date
-                
-                # Next task starts day after this one ends
-                if task.end_date:
-                    current_date = task.end_date + timedelta(days=1)
+        try:
+            with transaction.atomic():
+                auto_schedule_projects([project])
+        except DependencyCycle as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
         
         # Return updated project with tasks
-        serializer = self.get_serializer(project)
+        serializer = self.get_serializer(self.get_queryset().get(pk=project.pk))
         return Response(serializer.data)
 
+    @action(detail=False, methods=["post"], url_path="auto_schedule")
+    def auto_schedule_many(self, request):
+        """Auto-schedule several projects at once from {"project_ids": [...]}"""
+        try:
+            project_ids = [int(pk) for pk in request.data.get("project_ids") or []]
+        except (TypeError, ValueError):
+            project_ids = []
+        if not project_ids:
+            return Response(
+                {"error": "project_ids must be a non-empty list of ids"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        projects = list(Project.objects.filter(pk__in=project_ids))
+        errors = {}
+        found = {project.pk for project in projects}
+        for project_id in project_ids:
+            if project_id not in found:
+                errors[str(project_id)] = "Project not found"
+        for project in projects:
+            if not project.start_date:
+                errors[str(project.pk)] = "Project must have a start date to auto-schedule tasks"
+
+        if in_background(request):
+            with transaction.atomic():
+                queued = [jobs.enqueue("reschedule", project.pk) for project in projects if project.start_date]
+            return Response(
+                {"jobs": JobSerializer(queued, many=True).data, "errors": errors},
+                status=status.HTTP_202_ACCEPTED
+            )
+
+        try:
+            with transaction.atomic():
+                auto_schedule_projects(projects)
+        except DependencyCycle as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        scheduled = self.get_queryset().filter(pk__in=[p.pk for p in projects if p.start_date])
+        return Response({
+            "projects": self.get_serializer(scheduled, many=True).data,
+            "errors": errors,
+        })
+
+    @action(detail=True, methods=["get"])
+    def critical_path(self, request, pk=None):
+        """Earliest/latest dates, slack and the critical path from the task dependencies.
+
+        Tasks without dependency links follow the task before them, as in auto_schedule.
+        """
+        project = get_object_or_404(Project, pk=pk)
+        tasks = list(Task.objects.filter(project=project).order_by("order"))
+        start_date = project.start_date or min((t.start_date for t in tasks if t.start_date), default=None)
+        if not start_date:
+            return Response(
+                {"error": "Project or one of its tasks needs a start date"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        edges = project_edges([project.pk])
+        graph = with_order_edges([task.pk for task in tasks], edges)
+        try:
+            schedule, path, finish = critical_path(tasks, graph, start_date)
+        except DependencyCycle as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            "project": project.pk,
+            "finish": finish,
+            "critical_path": path,
+            "dependencies": edges,
+            "tasks": [{"id": task.pk, "name": task.name, **schedule[task.pk]} for task in tasks],
+        })
+
+    @action(detail=True, methods=["post"])
+    def simulate(self, request, pk=None):
+        """Preview edits without saving them.
+
+        Takes {"scenarios": [{"name": ..., "operations": [...]}]} (or a single
+        {"operations": [...]}) using the bulk task operations plus auto_schedule.
+        Each scenario starts from the same stored state; nothing is written.
+        """
+        project = get_object_or_404(Project, pk=pk)
+        scenarios = request.data.get("scenarios")
+        if scenarios is None and "operations" in request.data:
+            scenarios = [{"operations": request.data["operations"]}]
+        if not isinstance(scenarios, list) or not scenarios or len(scenarios) > MAX_SCENARIOS:
+            return Response(
+                {"error": f"scenarios must be a list of 1 to {MAX_SCENARIOS} scenarios"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not all(isinstance(scenario, dict) for scenario in scenarios):
+            return Response(
+                {"error": "each scenario must be an object with operations"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(simulate(project, scenarios))
+
 class TaskViewSet(viewsets.ModelViewSet):
     queryset = Task.objects.select_related("project").all().order_by("project_id", "order")
     serializer_class = TaskSerializer
+    pagination_class = TaskCursorPagination
 
-    def add_business_days(self, start_date, days):
-        """Add business days to a date, excluding weekends"""
-        current = start_date
-        added_days = 0
-        
-        while added_days < days:
-            current += timedelta(days=1)
-            # Skip weekends (Monday=0, Sunday=6)
-            if current.weekday() < 5:
-                added_days += 1
-        
-        return current
+    def list(self, request, *args, **kwargs):
+        if not fast_read.enabled():
+            return super().list(request, *args, **kwargs)
+        reader = fast_read.task_reader(self.get_serializer(many=True))
+        # Cursor pagination reads its position from these keys
+        reader.require("project_id", "order")
+        rows = self.filter_queryset(Task.objects.order_by("project_id", "order").values(*reader.columns))
+        page = self.paginate_queryset(rows)
+        with serializing():
+            if page is not None:
+                return self.get_paginated_response([reader.build(row) for row in page])
+            return Response([reader.build(row) for row in rows.iterator(chunk_size=TIMELINE_CHUNK_SIZE)])
 
     def cascade_delay(self, task, old_end_date, new_end_date):
-        """Cascade delay to all subsequent tasks in the project"""
+        """Cascade a change of this task's end date to the tasks that follow it.
+
+        With ?background=1 the cascade is queued as a job (kept on
+        self.cascade_job) and nothing moves yet.
+        """
         if not old_end_date or not new_end_date:
-            return
-        
-        delta = new_end_date - old_end_date
-        if delta == timedelta(0):
-            return
-        
-        # Get all subsequent tasks
-        following_tasks = Task.objects.filter(
-            project=task.project, 
-            order__gt=task.order
-        ).order_by("order")
-        
-        for following_task in following_tasks:
-            if following_task.start_date:
-                following_task.start_date = following_task.start_date + delta
-            if following_task.end_date:
-                following_task.end_date = following_task.end_date + delta
-            following_task.save(skip_auto_end_date=True)  # Skip auto-calculation to preserve manual adjustments
+            return []
+        if in_background(self.request):
+            self.cascade_job = jobs.enqueue(
+                "cascade", task.project_id, task_id=task.pk, days=(new_end_date - old_end_date).days
+            )
+            return []
+        return shift_following(task, new_end_date - old_end_date)
+
+    def cascade_response(self, instance, moved_tasks):
+        """Serialize a task together with the tasks its cascade moved"""
+        data = self.get_serializer(instance).data
+        data["cascaded_tasks"] = self.get_serializer(moved_tasks, many=True).data
+        job = getattr(self, "cascade_job", None)
+        if job is not None:
+            data["job"] = JobSerializer(job).data
+            return Response(data, status=status.HTTP_202_ACCEPTED)
+        return Response(data)
 
     def update(self, request, *args, **kwargs):
         """Enhanced update with cascade logic"""
@@ -123,7 +347,8 @@ class TaskViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
 
-        with transaction.atomic():
+        moved_tasks = []
+        with transaction.atomic(), deferred_rollups():
             # Save the updated task
             updated_instance = serializer.save()
             
@@ -133,7 +358,7 @@ class TaskViewSet(viewsets.ModelViewSet):
             
             # If end date changed, cascade the delay
             if old_end_date and new_end_date and new_end_date != old_end_date:
-                self.cascade_delay(updated_instance, old_end_date, new_end_date)
+                moved_tasks = self.cascade_delay(updated_instance, old_end_date, new_end_date)
             
             # If start date changed but completion_days stayed same, recalculate and cascade
             elif (old_start_date and new_start_date and new_start_date != old_start_date 
@@ -146,9 +371,9 @@ class TaskViewSet(viewsets.ModelViewSet):
                     
                     # Cascade to following tasks
                     if old_end_date:
-                        self.cascade_delay(updated_instance, old_end_date, new_calculated_end)
+                        moved_tasks = self.cascade_delay(updated_instance, old_end_date, new_calculated_end)
 
-        return Response(self.get_serializer(updated_instance).data)
+        return self.cascade_response(updated_instance, moved_tasks)
 
     @action(detail=True, methods=["post"])
     def shift(self, request, pk=None):
@@ -160,29 +385,72 @@ class TaskViewSet(viewsets.ModelViewSet):
             return Response({"error": "Days parameter is required"}, status=status.HTTP_400_BAD_REQUEST)
         
         old_end_date = instance.end_date
+        moved_tasks = []
         
-        with transaction.atomic():
+        with transaction.atomic(), deferred_rollups():
             # Shift start date by business days
             if instance.start_date:
-                if days > 0:
-                    new_start = self.add_business_days(instance.start_date, days)
-                else:
-                    # For negative days, subtract business days
-                    new_start = instance.start_date
-                    remaining_days = abs(days)
-                    while remaining_days > 0:
-                        new_start -= timedelta(days=1)
-                        if new_start.weekday() < 5:  # Business day
-                            remaining_days -= 1
-                
+                new_start = add_business_days(instance.start_date, days)
                 instance.start_date = new_start
                 instance.save()  # This will auto-recalculate end_date
                 
                 # Cascade to following tasks
                 if old_end_date and instance.end_date:
-                    self.cascade_delay(instance, old_end_date, instance.end_date)
+                    moved_tasks = self.cascade_delay(instance, old_end_date, instance.end_date)
         
-        return Response(self.get_serializer(instance).data)
+        return self.cascade_response(instance, moved_tasks)
+
+    @action(detail=True, methods=["post"])
+    def move(self, request, pk=None):
+        """Move a task within its project without renumbering the others.
+
+        Body: {"after": id}, {"before": id} or {"position": n} (0-based);
+        {"after": null} moves to the start and {"before": null} to the end.
+        Usually writes only this task's order.
+        """
+        targets = [key for key in ("after", "before", "position") if key in request.data]
+        if len(targets) != 1:
+            return Response(
+                {"error": "Give exactly one of after, before or position"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        key = targets[0]
+        value = request.data[key]
+
+        with transaction.atomic():
+            instance = self.get_object()
+            # Serialize moves per project so two of them cannot claim the same gap
+            list(Project.objects.select_for_update().filter(pk=instance.project_id).values_list("pk", flat=True))
+            options = {}
+            if key == "position":
+                try:
+                    options["position"] = int(value)
+                except (TypeError, ValueError):
+                    options["position"] = -1
+                if options["position"] < 0:
+                    return Response(
+                        {"error": "position must be a non-negative integer"},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+            elif value is None:
+                options["to_start"] = key == "after"
+            else:
+                neighbour = Task.objects.filter(project_id=instance.project_id, pk=value).first() \
+                    if str(value).isdigit() else None
+                if neighbour is None:
+                    return Response(
+                        {"error": f"{key} must be the id of another task in this project"},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+                if neighbour.pk == instance.pk:
+                    return Response(
+                        {"error": "A task cannot be moved relative to itself"},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+                options[key] = neighbour
+            rebalanced = move_task(instance, **options)
+
+        return Response({**self.get_serializer(instance).data, "rebalanced": rebalanced})
 
     @action(detail=True, methods=["post"])
     def set_completion_days(self, request, pk=None):
@@ -197,8 +465,9 @@ class TaskViewSet(viewsets.ModelViewSet):
             )
         
         old_end_date = instance.end_date
+        moved_tasks = []
         
-        with transaction.atomic():
+        with transaction.atomic(), deferred_rollups():
             instance.completion_days = completion_days
             if instance.start_date:
                 instance.end_date = instance.calculate_end_date()
@@ -206,29 +475,302 @@ class TaskViewSet(viewsets.ModelViewSet):
             
             # Cascade delay to following tasks
             if old_end_date and instance.end_date:
-                self.cascade_delay(instance, old_end_date, instance.end_date)
+                moved_tasks = self.cascade_delay(instance, old_end_date, instance.end_date)
         
-        return Response(self.get_serializer(instance).data)
+        return self.cascade_response(instance, moved_tasks)
+
+    @action(detail=True, methods=["get", "post"])
+    def dependencies(self, request, pk=None):
+        """Get or replace this task's predecessors with {"predecessors": [ids]}"""
+        task = self.get_object()
+        if request.method == "POST":
+            predecessors = request.data.get("predecessors")
+            try:
+                if not isinstance(predecessors, list) or any(isinstance(p, bool) for p in predecessors):
+                    raise TypeError
+                predecessor_ids = {int(p) for p in predecessors}
+            except (TypeError, ValueError):
+                return Response(
+                    {"error": "predecessors must be a list of task ids"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            siblings = set(
+                Task.objects.filter(project_id=task.project_id, pk__in=predecessor_ids).values_list("pk", flat=True)
+            )
+            if task.pk in predecessor_ids or siblings != predecessor_ids:
+                return Response(
+                    {"error": "Predecessors must be other tasks of the same project"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            edges = [edge for edge in project_edges([task.project_id]) if edge[1] != task.pk]
+            edges += [(predecessor, task.pk) for predecessor in predecessor_ids]
+            project_task_ids = Task.objects.filter(project_id=task.project_id).values_list("pk", flat=True)
+            try:
+                topological_order(list(project_task_ids), edges)
+            except DependencyCycle as exc:
+                return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+            task.predecessors.set(predecessor_ids)
+
+        return Response({
+            "id": task.pk,
+            "predecessors": sorted(task.predecessors.values_list("pk", flat=True)),
+            "successors": sorted(task.successors.values_list("pk", flat=True)),
+        })
+
+    @action(detail=False, methods=["post"])
+    def bulk(self, request):
+        """Apply a list of task operations in one transaction.
+
+        Each operation is {"op": "patch", "id": ..., "data": {...}},
+        {"op": "shift", "id": ..., "days": N},
+        {"op": "set_completion_days", "id": ..., "completion_days": N},
+        {"op": "delete", "id": ...} or {"op": "reorder", "project": ..., "ids": [...]}.
+        Cascades are applied in memory and written once per project.
+        """
+        operations = request.data if isinstance(request.data, list) else request.data.get("operations")
+        if not isinstance(operations, list) or not operations:
+            return Response(
+                {"error": "operations must be a non-empty list"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            with transaction.atomic(), deferred_rollups():
+                tasks, deleted = TaskBatch(operations).run()
+        except BulkOperationError as exc:
+            return Response(
+                {"error": exc.message, "index": exc.index},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response({
+            "tasks": self.get_serializer(tasks, many=True).data,
+            "deleted": deleted,
+        })
 
     @action(detail=False, methods=["get"])
     def project_timeline(self, request):
-        """Get timeline view of all tasks across projects"""
-        tasks = self.get_queryset().filter(
-            start_date__isnull=False,
-            end_date__isnull=False
-        ).select_related('project')
-        
-        timeline_data = []
-        for task in tasks:
-            timeline_data.append({
-                'id': task.id,
-                'name': task.name,
-                'project': task.project.title,
-                'start': task.start_date,
-                'end': task.end_date,
-                'status': task.status,
-                'completion_days': task.completion_days,
-                'assigned_to': task.project.assigned_employee.name if task.project.assigned_employee else None
-            })
-        
-        return Response(timeline_data)
\ No newline at end of file
+        """Get timeline view of all tasks across projects.
+
+        ?start= / ?end= limit it to tasks overlapping that date window, and
+        ?stream=ndjson|csv streams the rows instead of building one list.
+        """
+        stream = request.query_params.get("stream")
+        if stream and stream not in STREAM_FORMATS:
+            return Response(
+                {"error": f"stream must be one of: {', '.join(STREAM_FORMATS)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        window = {}
+        for param, lookup in (("start", "end_date__gte"), ("end", "start_date__lte")):
+            value = request.query_params.get(param)
+            if value:
+                try:
+                    window[lookup] = date.fromisoformat(value)
+                except ValueError:
+                    return Response(
+                        {"error": f"{param} must be a YYYY-MM-DD date"},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+
+        rows = (
+            Task.objects.filter(start_date__isnull=False, end_date__isnull=False, **window)
+            .order_by("project_id", "order")
+            .values(*TIMELINE_FIELDS.values())
+        )
+        timeline = (
+            {key: row[field] for key, field in TIMELINE_FIELDS.items()}
+            for row in rows.iterator(chunk_size=TIMELINE_CHUNK_SIZE)
+        )
+
+        if stream:
+            return stream_rows(request, timeline, list(TIMELINE_FIELDS), stream, filename="timeline")
+        etag = queryset_etag(
+            request,
+            Task.objects.filter(start_date__isnull=False, end_date__isnull=False, **window),
+            Project.objects.all(),
+            Employee.objects.all(),
+        )
+        return conditional_response(
+            request, etag, lambda: Response(cache.cached_global("timeline", etag.strip('"'), lambda: list(timeline)))
+        )
+
+class JobViewSet(viewsets.ReadOnlyModelViewSet):
+    """Background jobs: poll GET /api/jobs/{id}/, queue with POST /api/jobs/.
+
+    The list filters on ?status=, ?kind= and ?project=.
+    """
+    serializer_class = JobSerializer
+    pagination_class = JobCursorPagination
+
+    def get_queryset(self):
+        return Job.objects.order_by("-created_at", "-id")
+
+    def list(self, request, *args, **kwargs):
+        filters = {}
+        for param, choices in (("status", Job.STATUS_CHOICES), ("kind", Job.KIND_CHOICES)):
+            value = request.query_params.get(param)
+            if not value:
+                continue
+            allowed = [choice for choice, _ in choices]
+            if value not in allowed:
+                return Response(
+                    {"error": f"{param} must be one of: {', '.join(allowed)}"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            filters[param] = value
+        project = request.query_params.get("project")
+        if project:
+            if not project.isdigit():
+                return Response({"error": "project must be a project id"}, status=status.HTTP_400_BAD_REQUEST)
+            filters["project_id"] = int(project)
+
+        queryset = self.get_queryset().filter(**filters)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.get_serializer(page, many=True).data)
+        return Response(self.get_serializer(queryset, many=True).data)
+
+    def create(self, request):
+        """Queue {"kind": "reschedule"|"recompute_rollups", "project": id} or {"kind": "cascade", "task": id, "days": n}"""
+        kind = request.data.get("kind")
+        if kind not in jobs.KINDS:
+            return Response(
+                {"error": f"kind must be one of: {', '.join(jobs.KINDS)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        fields = ("task", "days") if kind == "cascade" else ("project",)
+        try:
+            values = {field: int(request.data.get(field)) for field in fields}
+        except (TypeError, ValueError):
+            return Response(
+                {"error": f"{kind} jobs need integer {' and '.join(fields)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if kind == "cascade":
+            task = get_object_or_404(Task.objects.only("id", "project_id"), pk=values["task"])
+            job = jobs.enqueue(kind, task.project_id, task_id=task.pk, days=values["days"])
+        else:
+            project = get_object_or_404(Project.objects.only("id", "start_date"), pk=values["project"])
+            if kind == "reschedule" and not project.start_date:
+                return Response(
+                    {"error": "Project must have a start date to auto-schedule tasks"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            job = jobs.enqueue(kind, project.pk)
+        return Response(self.get_serializer(job).data, status=status.HTTP_202_ACCEPTED)
+
+class CacheStatsView(APIView):
+    """Hit/miss counters of the serialized payload cache"""
+
+    def get(self, request):
+        return Response(cache.stats())
+
+class SyncView(APIView):
+    """Changes since ?since=<ISO timestamp>: changed rows plus tombstones for deletions.
+
+    Pass the returned timestamp as the next since. It lags the read by
+    SYNC_OVERLAP_SECONDS so writes committed late are not missed; rows can
+    therefore arrive twice and clients upsert them by id. Without since the
+    full dataset is returned; a since older than the tombstone retention
+    gets 410 and the client must start over without it.
+    """
+
+    def get(self, request):
+        since = request.query_params.get("since")
+        now = timezone.now()
+        if since:
+            since = parse_datetime(since.replace(" ", "+"))
+            if since is None:
+                return Response(
+                    {"error": "since must be an ISO 8601 timestamp"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if timezone.is_naive(since):
+                since = timezone.make_aware(since)
+            if since < now - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS):
+                return Response(
+                    {"error": f"since is older than the {settings.SYNC_TOMBSTONE_RETENTION_DAYS}-day "
+                              "deletion history; sync again without since"},
+                    status=status.HTTP_410_GONE
+                )
+
+        changed = Q(updated_at__gt=since) if since else Q()
+
+        employees = Employee.objects.filter(changed).annotate(num_projects=Count("projects"))
+        projects = project_queryset(with_tasks=False).filter(changed)
+        tasks = Task.objects.filter(changed).order_by("project_id", "order")
+
+        deleted = {"employees": [], "projects": [], "tasks": []}
+        if since:
+            tombstones = Tombstone.objects.filter(deleted_at__gt=since).values_list("model", "object_id")
+            for model, object_id in tombstones:
+                deleted[f"{model}s"].append(object_id)
+
+        return Response({
+            "timestamp": now - timedelta(seconds=settings.SYNC_OVERLAP_SECONDS),
+            "employees": EmployeeSerializer(employees, many=True).data,
+            "projects": ProjectSerializer(projects, many=True, omit=["tasks"]).data,
+            "tasks": TaskSerializer(tasks, many=True).data,
+            "deleted": deleted,
+        })
+
+class ImportView(APIView):
+    """Bulk-create employees, projects and tasks from an NDJSON or CSV body.
+
+    The body is read line by line and written in chunks (see
+    projects/transfer.py); ?stream=ndjson|csv picks the format, otherwise
+    a text/csv Content-Type means CSV. ?chunk_size= sets the rows per
+    chunk. Invalid rows are skipped and listed in the response.
+    """
+
+    def post(self, request):
+        fmt = request.query_params.get("stream") or ("csv" if request.content_type.startswith("text/csv") else "ndjson")
+        if fmt not in STREAM_FORMATS:
+            return Response(
+                {"error": f"stream must be one of: {', '.join(STREAM_FORMATS)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            chunk_size = int(request.query_params.get("chunk_size") or transfer.CHUNK_SIZE)
+        except ValueError:
+            chunk_size = 0
+        if not 1 <= chunk_size <= transfer.MAX_CHUNK_SIZE:
+            return Response(
+                {"error": f"chunk_size must be between 1 and {transfer.MAX_CHUNK_SIZE}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        # Read the raw stream instead of request.data so the body is never held in memory
+        stream = request.stream
+        if stream is None:
+            # Django only reads bodies with a Content-Length, so a chunked upload arrives empty
+            if "Content-Length" not in request.headers:
+                return Response(
+                    {"error": "Send the body with a Content-Length header; chunked uploads are not supported"},
+                    status=status.HTTP_411_LENGTH_REQUIRED
+                )
+            return Response({"error": "The request body is empty"}, status=status.HTTP_400_BAD_REQUEST)
+        lines = iter(stream.readline, b"")
+        return Response(transfer.import_records(transfer.READERS[fmt](lines), chunk_size))
+
+class ExportView(APIView):
+    """Stream ?type=employees,projects,tasks (default all) as ?stream=ndjson|csv, ready to re-import"""
+
+    def get(self, request):
+        fmt = request.query_params.get("stream", "ndjson")
+        if fmt not in STREAM_FORMATS:
+            return Response(
+                {"error": f"stream must be one of: {', '.join(STREAM_FORMATS)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        names = {name: record_type for record_type, name in transfer.EXPORT_TYPES.items()}
+        requested = request.query_params.get("type")
+        requested = [name.strip() for name in requested.split(",")] if requested else list(names)
+        if any(name not in names for name in requested):
+            return Response(
+                {"error": f"type must be a comma-separated list of: {', '.join(names)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        records = transfer.export_records({names[name] for name in requested})
+        return stream_rows(request, records, transfer.EXPORT_COLUMNS, fmt, filename="export")
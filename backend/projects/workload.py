@@ -0,0 +1,75 @@
+from datetime import timedelta
+from itertools import accumulate
+
+from django.db.models import Count, F, Value
+from django.db.models.functions import Greatest, Least
+
+from .business_calendar import get_calendar
+from .models import Task
+
+BUCKETS = ("day", "week")
+MAX_WINDOW_DAYS = 731
+
+
+def employee_workload(start, end, bucket="day"):
+    """Business-day load per employee between start and end (inclusive).
+
+    The database counts how many of each employee's tasks start and end on
+    each day of the window (two grouped queries, at most one row per
+    employee and day however many tasks there are); a prefix sum over those
+    changes then gives the number of concurrent tasks per day. Weekly
+    buckets sum those daily loads (task-days) per Monday-based week.
+    """
+    days = (end - start).days + 1
+    tasks = Task.objects.filter(
+        project__assigned_employee__isnull=False,
+        start_date__isnull=False,
+        end_date__isnull=False,
+        start_date__lte=end,
+        end_date__gte=start,
+    ).order_by()
+    employee = F("project__assigned_employee_id")
+    # Tasks running past the window edges count from its first day / until its last
+    starts = tasks.values_list(
+        employee, "project__assigned_employee__name", Greatest("start_date", Value(start))
+    ).annotate(Count("id"))
+    ends = tasks.values_list(employee, Least("end_date", Value(end))).annotate(Count("id"))
+
+    deltas, names = {}, {}
+    for employee_id, name, day, count in starts:
+        diff = deltas.get(employee_id)
+        if diff is None:
+            diff = deltas[employee_id] = [0] * (days + 1)
+            names[employee_id] = name
+        diff[(day - start).days] += count
+    for employee_id, day, count in ends:
+        deltas[employee_id][(day - start).days + 1] -= count
+
+    calendar = get_calendar()
+    window = [start + timedelta(days=offset) for offset in range(days)]
+    working = [calendar.is_business_day(day) for day in window]
+
+    if bucket == "week":
+        first_monday = start - timedelta(days=start.weekday())
+        bucket_of = [(day - first_monday).days // 7 for day in window]
+        periods = [first_monday + timedelta(weeks=week) for week in range(bucket_of[-1] + 1)]
+    else:
+        bucket_of = list(range(days))
+        periods = window
+
+    employees = []
+    for employee_id, diff in deltas.items():
+        load = [0] * len(periods)
+        for offset, concurrent in enumerate(accumulate(diff[:days])):
+            if working[offset]:
+                load[bucket_of[offset]] += concurrent
+        employees.append({
+            "id": employee_id,
+            "name": names[employee_id],
+            "load": load,
+            "total": sum(load),
+            "peak": max(load),
+        })
+    employees.sort(key=lambda employee: (-employee["peak"], employee["name"]))
+
+    return {"start": start, "end": end, "bucket": bucket, "periods": periods, "employees": employees}
@@ -925,9 +925,9 @@ function TaskList({project, onTaskEdit}) {
               </tr>
             </thead>
             <tbody>
-              {tasks.map(t => (
+              {tasks.map((t, idx) => (
                 <tr key={t.id}>
-                  <td style={{fontWeight: '600', color: 'var(--primary)'}}>{t.order}</td>
+                  <td style={{fontWeight: '600', color: 'var(--primary)'}}>{idx + 1}</td>
                   <td>
                     <div style={{maxWidth: '200px'}}>
                       <strong>{t.name}</strong>